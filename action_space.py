@@ -0,0 +1,68 @@
+# action_space.py
+from typing import Any, Iterable, List, Optional
+
+import numpy as np
+
+from datas import GameKnowledge
+from enums import PartyID
+from game_action import ActionTypeEnum, Move, PlayOptionEnum
+from id_registry import Interner
+from models import AGENDA_OPTIONS
+
+
+class ActionSpace:
+    """
+    Agent의 모든 결정(Move와 get_choice 선택지)을 고정된 정수 구간에 배치합니다.
+    학습 데이터의 행동 번호와 합법 수 마스크는 이 번호를 씁니다.
+
+    - [0, E): 정당 카드 EVENT 플레이 (knowledge.party_cards 순서)
+    - [E, E+C): 도시별 DEMONSTRATION (knowledge.cities 순서)
+    - [E+C, size): get_choice 선택지 (도시, 정당, 아젠다, "PASS")
+    같은 지식 데이터면 번호도 같습니다. 번호를 매길 수 없는 수(아직 정의되지 않은 행동)는 None.
+    """
+
+    def __init__(self, knowledge: GameKnowledge):
+        self.cards = Interner(knowledge.party_cards.keys())
+        self.cities = Interner(knowledge.cities.keys())
+        self.choices = Interner()
+        for label in [*knowledge.cities.keys(), *(party.value for party in PartyID), *AGENDA_OPTIONS, "PASS"]:
+            self.choices.add(label)
+
+        self.demonstration_offset = len(self.cards)
+        self.choice_offset = self.demonstration_offset + len(self.cities)
+        self.size = self.choice_offset + len(self.choices)
+
+    @property
+    def labels(self) -> List[str]:
+        """번호 순서의 사람이 읽을 수 있는 이름. 예: "EVENT:spd_01", "DEMONSTRATION:berlin", "CHOICE:PASS"."""
+        return ([f"EVENT:{card_id}" for card_id in self.cards]
+                + [f"DEMONSTRATION:{city_id}" for city_id in self.cities]
+                + [f"CHOICE:{label}" for label in self.choices])
+
+    # --- 번호 매기기 ---
+    def move_index(self, move: Move) -> Optional[int]:
+        if move.play_option == PlayOptionEnum.EVENT and move.card_id is not None:
+            return self.cards.get(move.card_id)
+        if move.card_action_type == ActionTypeEnum.DEMONSTRATION and move.target is not None:
+            num = self.cities.get(move.target)
+            return None if num is None else self.demonstration_offset + num
+        return None
+
+    def choice_index(self, option: Any) -> Optional[int]:
+        label = option.value if isinstance(option, PartyID) else str(option)
+        num = self.choices.get(label)
+        return None if num is None else self.choice_offset + num
+
+    # --- 마스크 ---
+    def move_mask(self, moves: Iterable[Move]) -> np.ndarray:
+        return self._mask(self.move_index(move) for move in moves)
+
+    def choice_mask(self, options: Iterable[Any]) -> np.ndarray:
+        return self._mask(self.choice_index(option) for option in options)
+
+    def _mask(self, indices: Iterable[Optional[int]]) -> np.ndarray:
+        mask = np.zeros(self.size, dtype=bool)
+        for index in indices:
+            if index is not None:
+                mask[index] = True
+        return mask
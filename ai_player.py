@@ -1,5 +1,4 @@
 # ai_agent.py
-import random
 import asyncio
 from typing import Any, List, Dict
 from game_action import Move
@@ -13,13 +12,13 @@ class RandomAIAgent(IPlayerAgent):
         valid_moves = game_model.get_valid_moves(self.party_id)
         if not valid_moves:
             raise RuntimeError(f"No valid moves for AI {self.party_id}")
-        chosen_move = random.choice(valid_moves)
+        chosen_move = self.rng.choice(valid_moves)
         print(f"[AI {self.party_id}] 결정: {chosen_move}")
         await asyncio.sleep(0.1)
         return chosen_move
 
     async def get_choice(self, options: List[Any], context: Dict[str, Any]) -> Any:
-        chosen_option = random.choice(options)
+        chosen_option = self.rng.choice(options)
         print(f"[AI {self.party_id}] 선택 ({context.get('action', '')}): {chosen_option}")
         await asyncio.sleep(0.1)
         return chosen_option
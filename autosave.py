@@ -0,0 +1,234 @@
+# autosave.py
+import glob
+import logging
+import os
+import pickle
+import queue
+import struct
+import threading
+import uuid
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import game_events
+from datas import GameKnowledge
+from engine import Request
+from enums import GamePhase
+from event_bus import EventBus
+from models import GameModel
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "snapshot.pkl"
+FORMAT_VERSION = 3  # 2: 대기 요청을 engine.Request로 저장, 3: 진행 상태도 모두 GameCommand로 기록 (volatile 제거)
+_RECORD_HEADER = struct.Struct("<II")  # 본문 길이, crc32
+
+
+def has_autosave(directory: str) -> bool:
+    return os.path.exists(os.path.join(directory, SNAPSHOT_FILE))
+
+
+def _fsync_directory(directory: str):
+    # 이름 바꾸기(os.replace)를 디스크에 확정. 디렉터리를 열 수 없는 플랫폼(Windows)에서는 생략
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class _AutosaveWriter(threading.Thread):
+    """
+    파일 쓰기와 fsync를 이벤트 루프 밖에서 처리하는 스레드. 작업은 큐로 받고,
+    큐에 쌓인 작업을 한 번에 쓴 뒤 fsync 한 번으로 확정합니다 (그룹 커밋).
+    """
+
+    def __init__(self, directory: str, fsync: bool):
+        super().__init__(name="autosave-writer", daemon=True)
+        self.directory = directory
+        self.fsync = fsync
+        self.jobs: "queue.Queue[Optional[Tuple[str, bytes, Optional[str]]]]" = queue.Queue()
+        self._log = None
+
+    def run(self):
+        running = True
+        while running:
+            jobs = [self.jobs.get()]
+            while True:
+                try:
+                    jobs.append(self.jobs.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                for job in jobs:
+                    if job is None:
+                        running = False
+                        break
+                    kind, payload, segment = job
+                    if kind == "snapshot":
+                        self._write_snapshot(payload, segment)
+                    elif self._log is not None:
+                        self._log.write(payload)
+                if self._log is not None:
+                    self._log.flush()
+                    if self.fsync:
+                        os.fsync(self._log.fileno())
+            except OSError as e:
+                logger.exception(f"Autosave write failed in {self.directory}: {e}")
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _write_snapshot(self, payload: bytes, segment: str):
+        """
+        새 로그 구간을 만든 뒤 스냅샷을 임시 파일에 쓰고 os.replace로 교체합니다.
+        교체 전에 중단되면 이전 스냅샷과 그 로그가 그대로 남으므로 언제 멈춰도 불러올 수 있습니다.
+        """
+        log = open(os.path.join(self.directory, segment), "wb")
+        tmp = os.path.join(self.directory, f".{SNAPSHOT_FILE}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(self.directory, SNAPSHOT_FILE))
+        if self.fsync:
+            _fsync_directory(self.directory)
+
+        if self._log is not None:
+            self._log.close()
+        self._log = log
+        for path in glob.glob(os.path.join(self.directory, "log-*.bin")):
+            if os.path.basename(path) != segment:
+                os.remove(path)
+
+
+class Autosave:
+    """
+    진행 중인 게임을 디렉터리에 계속 저장합니다. 비정상 종료 뒤 load_autosave()로 마지막 결정 지점부터 이어갈 수 있습니다.
+
+    - GameEngine이 입력을 기다릴 때(AWAITING_INPUT)마다, 지난 기록 이후 실행되거나 되돌려진 GameCommand(history.journal),
+      쓰인 난수 스트림의 상태, 답을 기다리는 요청을 로그에 한 건씩 덧붙입니다. 기록 크기는 그 사이의 변경량에 비례합니다.
+      Agent가 결정을 시작하기 전에 기록하므로, 이어할 때 Agent 난수도 같은 상태에서 다시 결정합니다.
+    - compact_every건마다 모델 전체를 스냅샷으로 쓰고 새 로그 구간을 시작합니다 (압축).
+    - 직렬화만 이벤트 루프에서 하고, 파일 쓰기와 fsync는 별도 스레드가 합니다.
+    """
+
+    def __init__(self, model: GameModel, directory: str, compact_every: int = 256, fsync: bool = True):
+        os.makedirs(directory, exist_ok=True)
+        self.model = model
+        self.directory = directory
+        self.compact_every = compact_every
+        self._records: Optional[int] = None  # 마지막 스냅샷 이후 로그 기록 수 (None: 아직 스냅샷 없음)
+        self._closed = False
+        model.history.journal = []
+        model.bus.subscribe(game_events.AWAITING_INPUT, lambda data: self.flush(data["requests"]))
+
+        self._writer = _AutosaveWriter(directory, fsync)
+        self._writer.start()
+
+    def flush(self, pending: List[Request]):
+        """지난 기록 이후의 변경을 로그에 덧붙입니다 (압축할 때가 되었으면 스냅샷)."""
+        if self._closed:
+            return
+        model = self.model
+        journal = model.history.journal
+        if self._records is None or self._records >= self.compact_every:
+            segment = f"log-{uuid.uuid4().hex}.bin"
+            payload = pickle.dumps({"version": FORMAT_VERSION, "segment": segment, "model": model, "pending": pending},
+                                   protocol=pickle.HIGHEST_PROTOCOL)
+            model.rng.take_changes()
+            self._records = 0
+            self._writer.jobs.put(("snapshot", payload, segment))
+        else:
+            body = pickle.dumps({
+                "commands": journal,
+                "rng": model.rng.take_changes(),
+                "state_version": model.state_version,
+                "pending": pending,
+            }, protocol=pickle.HIGHEST_PROTOCOL)
+            self._records += 1
+            self._writer.jobs.put(("record", _RECORD_HEADER.pack(len(body), zlib.crc32(body)) + body, None))
+        journal.clear()
+        if model.phase == GamePhase.GAME_OVER:
+            # 마지막 상태까지 기록했으면 쓰기 스레드를 멈춤 (close()가 끝나기를 기다림)
+            self._stop()
+
+    def _stop(self):
+        if self._closed:
+            return
+        self._closed = True
+        self.model.history.journal = None
+        self._writer.jobs.put(None)
+
+    def close(self):
+        """남은 기록을 모두 쓰고 쓰기 스레드를 끝냅니다. 저장 파일은 남습니다."""
+        self._stop()
+        self._writer.join()
+
+    def discard(self):
+        """자동 저장을 끝내고 저장 파일을 지웁니다 (게임을 정상적으로 마쳤을 때)."""
+        self.close()
+        for path in [os.path.join(self.directory, SNAPSHOT_FILE)] + glob.glob(os.path.join(self.directory, "log-*.bin")):
+            os.remove(path)
+
+
+def _read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """로그 구간의 기록을 순서대로 읽습니다. 쓰다 만(잘리거나 손상된) 기록에서 멈춥니다."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return
+    offset, count = 0, 0
+    while offset < len(data):
+        if offset + _RECORD_HEADER.size > len(data):
+            break
+        length, crc = _RECORD_HEADER.unpack_from(data, offset)
+        body = data[offset + _RECORD_HEADER.size:offset + _RECORD_HEADER.size + length]
+        if len(body) < length or zlib.crc32(body) != crc:
+            break
+        yield pickle.loads(body)
+        offset += _RECORD_HEADER.size + length
+        count += 1
+    if offset < len(data):
+        logger.warning(f"Autosave log {path} has an incomplete record after {count} records. Ignoring the rest.")
+
+
+def load_autosave(directory: str, bus: EventBus, knowledge: GameKnowledge) -> Tuple[GameModel, List[Request]]:
+    """
+    스냅샷을 불러와 로그의 기록을 차례로 다시 적용합니다.
+    반환: (모델, 답을 기다리던 요청 목록). GameEngine.resume(요청 목록)으로 그 지점부터 이어갑니다.
+    """
+    with open(os.path.join(directory, SNAPSHOT_FILE), "rb") as f:
+        snapshot = pickle.load(f)
+    if snapshot.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported autosave version {snapshot.get('version')} in {directory}")
+    model: GameModel = snapshot["model"]
+    model.attach(bus, knowledge)
+    pending: List[Request] = snapshot["pending"]
+
+    records = 0
+    model._muted = True  # 다시 적용하는 변경은 이미 발행되었던 것이므로 delta를 내보내지 않음
+    try:
+        for record in _read_records(os.path.join(directory, snapshot["segment"])):
+            for command, forward in record["commands"]:
+                if forward:
+                    command.apply(model)
+                else:
+                    command.revert(model)
+            model.rng.apply_changes(record["rng"])
+            model.state_version = record["state_version"]
+            pending = record["pending"]
+            records += 1
+    finally:
+        model._muted = False
+    logger.info(f"Autosave loaded from {directory}: snapshot + {records} log records "
+                f"(phase {model.phase.name}, round {model.round}, version {model.state_version}).")
+    return model, pending
@@ -0,0 +1,115 @@
+# batch_eval.py
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from board_eval import PARTIES, EvalWeights
+from datas import GameKnowledge
+from enums import PartyID
+
+
+logger = logging.getLogger(__name__)
+
+# 보드 인코딩에 포함되는 트래커 순서
+TRACKERS: List[str] = ["round", "economy_track"]
+
+
+@dataclass
+class BoardBatch:
+    """
+    N개의 보드 상태를 쌓은 배열 묶음. 도시/정당 축의 순서는 BatchEvaluator.city_ids / PARTIES를 따릅니다.
+    """
+    bases: np.ndarray     # (N, C, P) 도시별 정당 기반 수
+    threats: np.ndarray   # (N, C) 도시별 위협 마커 수
+    seats: np.ndarray     # (N, P) 의석 수
+    trackers: np.ndarray  # (N, T) TRACKERS 순서
+
+    def __len__(self) -> int:
+        return self.bases.shape[0]
+
+    @classmethod
+    def empty(cls, size: int, city_count: int) -> "BoardBatch":
+        return cls(
+            bases=np.zeros((size, city_count, len(PARTIES)), dtype=np.int16),
+            threats=np.zeros((size, city_count), dtype=np.int16),
+            seats=np.zeros((size, len(PARTIES)), dtype=np.int16),
+            trackers=np.zeros((size, len(TRACKERS)), dtype=np.float32),
+        )
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["BoardBatch"]) -> "BoardBatch":
+        return cls(
+            bases=np.concatenate([b.bases for b in batches]),
+            threats=np.concatenate([b.threats for b in batches]),
+            seats=np.concatenate([b.seats for b in batches]),
+            trackers=np.concatenate([b.trackers for b in batches]),
+        )
+
+
+class BatchEvaluator:
+    """
+    board_eval.IncrementalEvaluator와 같은 평가식을 N개의 보드에 대해 한 번의 벡터 연산으로 계산합니다.
+    탐색 AI가 후보 보드 수백 개를 한꺼번에 점수화할 때 사용합니다.
+    """
+
+    def __init__(self, knowledge: GameKnowledge, weights: Optional[EvalWeights] = None,
+                 tracker_weights: Optional[np.ndarray] = None):
+        self.weights = weights or EvalWeights()
+        self.city_ids: List[str] = list(knowledge.cities.keys())
+        self.city_index = {city_id: i for i, city_id in enumerate(self.city_ids)}
+        self.city_weights = np.array([knowledge.cities[c].max_party_bases for c in self.city_ids], dtype=np.float32)
+        # (T, P): 트래커 값이 정당별 점수에 주는 영향. 기본값은 0 (영향 없음)
+        if tracker_weights is None:
+            tracker_weights = np.zeros((len(TRACKERS), len(PARTIES)), dtype=np.float32)
+        if tracker_weights.shape != (len(TRACKERS), len(PARTIES)):
+            raise ValueError(f"tracker_weights must have shape {(len(TRACKERS), len(PARTIES))}, got {tracker_weights.shape}")
+        self.tracker_weights = tracker_weights.astype(np.float32)
+
+    # --- 인코딩 ---
+    def encode_into(self, batch: BoardBatch, row: int, model):
+        """GameModel 하나를 batch의 row번째 칸에 기록합니다."""
+        bases = batch.bases[row]
+        threats = batch.threats[row]
+        for city_id, city_state in model.cities_state.items():
+            c = self.city_index[city_id]
+            for p, party in enumerate(PARTIES):
+                bases[c, p] = city_state.party_bases.get(party, 0)
+            threats[c] = len(city_state.threats_on_city)
+        for p, party in enumerate(PARTIES):
+            batch.seats[row, p] = model.parliament_state.seats.get(party, 0)
+        for t, tracker in enumerate(TRACKERS):
+            value = getattr(model, tracker, None)
+            batch.trackers[row, t] = value if isinstance(value, (int, float)) else 0.0
+
+    def encode(self, models: Sequence) -> BoardBatch:
+        batch = BoardBatch.empty(len(models), len(self.city_ids))
+        for row, model in enumerate(models):
+            self.encode_into(batch, row, model)
+        return batch
+
+    # --- 평가 ---
+    def totals(self, batch: BoardBatch) -> np.ndarray:
+        """(N, P) 정당별 절대 점수."""
+        w = self.weights
+        bases = batch.bases.astype(np.float32)
+        ranked = np.sort(bases, axis=2)
+        top1, top2 = ranked[..., -1:], ranked[..., -2:-1]
+        # 단독 최다 기반 보유 여부 (동률이면 지배 아님)
+        control = (bases == top1) & (top1 > top2)
+        present = bases > 0
+
+        per_city = w.base * bases + w.city_control * control + w.threat * batch.threats[..., None]
+        per_city = np.where(present, per_city, 0.0) * self.city_weights[None, :, None]
+
+        totals = per_city.sum(axis=1) + w.seat * batch.seats
+        totals += batch.trackers @ self.tracker_weights
+        return totals
+
+    def score(self, batch: BoardBatch, party: PartyID) -> np.ndarray:
+        """(N,) 자신의 점수 - 가장 강한 상대의 점수. IncrementalEvaluator.score와 같은 의미."""
+        totals = self.totals(batch)
+        p = PARTIES.index(party)
+        opponents = np.delete(totals, p, axis=1)
+        return totals[:, p] - opponents.max(axis=1)
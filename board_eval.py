@@ -0,0 +1,117 @@
+# board_eval.py
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from datas import GameKnowledge
+from enums import PartyID
+from state_delta import BasePlaced, BaseRemoved, DeltaBatch, SeatsChanged, StateDelta, ThreatMoved, iter_deltas
+
+
+logger = logging.getLogger(__name__)
+
+PARTIES: List[PartyID] = list(PartyID)
+
+
+@dataclass
+class EvalWeights:
+    """보드 평가 가중치. 도시 관련 항목은 도시 크기(max_party_bases)를 곱해 적용됩니다."""
+    base: float = 1.0            # 기반 1개당
+    city_control: float = 2.0    # 도시에서 단독 최다 기반을 가진 정당
+    threat: float = -0.5         # 자신의 기반이 있는 도시의 위협 마커 1개당
+    seat: float = 0.5            # 의석 1개당
+
+
+def city_contribution(bases: Dict[PartyID, int], threat_count: int, city_weight: float,
+                      party: PartyID, weights: EvalWeights) -> float:
+    own = bases.get(party, 0)
+    if own == 0:
+        return 0.0
+    score = weights.base * own
+    if all(count < own for other, count in bases.items() if other != party):
+        score += weights.city_control
+    score += weights.threat * threat_count
+    return score * city_weight
+
+
+class IncrementalEvaluator:
+    """
+    정당별 보드 점수를 도시 단위 기여도의 합으로 유지하는 평가기.
+    STATE_DELTA가 들어오면 해당 도시의 기여도만 다시 계산하고,
+    후보 수(기반 배치/제거)의 점수도 그 도시 하나만 계산해서 구합니다.
+    """
+
+    def __init__(self, knowledge: GameKnowledge, weights: Optional[EvalWeights] = None):
+        self.weights = weights or EvalWeights()
+        self.city_weights: Dict[str, float] = {city_id: float(city.max_party_bases) for city_id, city in knowledge.cities.items()}
+        self.capacity: Dict[str, int] = {city_id: city.max_party_bases for city_id, city in knowledge.cities.items()}
+        self.version: int = 0
+
+        self.bases: Dict[str, Dict[PartyID, int]] = {city_id: {party: 0 for party in PARTIES} for city_id in knowledge.cities}
+        self.threat_counts: Dict[str, int] = {city_id: 0 for city_id in knowledge.cities}
+        self.seats: Dict[PartyID, int] = {party: 0 for party in PARTIES}
+
+        self._contrib: Dict[str, Dict[PartyID, float]] = {city_id: {party: 0.0 for party in PARTIES} for city_id in knowledge.cities}
+        self.totals: Dict[PartyID, float] = {party: 0.0 for party in PARTIES}
+
+    def sync(self, model):
+        """모델 전체에서 다시 계산합니다. delta를 놓쳤을 때만 사용."""
+        for city_id, city_state in model.cities_state.items():
+            self.bases[city_id] = dict(city_state.party_bases)
+            self.threat_counts[city_id] = len(city_state.threats_on_city)
+        self.seats = dict(model.parliament_state.seats)
+        self.totals = {party: self.weights.seat * self.seats.get(party, 0) for party in PARTIES}
+        for city_id in self.bases:
+            self._contrib[city_id] = {party: 0.0 for party in PARTIES}
+            self._refresh_city(city_id)
+        self.version = model.state_version
+
+    def apply_delta(self, delta: StateDelta):
+        if isinstance(delta, DeltaBatch):
+            for inner in iter_deltas(delta):
+                self.apply_delta(inner)
+            return
+        if delta.version <= self.version:
+            return
+        self.version = delta.version
+        if isinstance(delta, (BasePlaced, BaseRemoved)):
+            self.bases[delta.city_id][PartyID(delta.party_id)] = delta.count
+            self._refresh_city(delta.city_id)
+        elif isinstance(delta, ThreatMoved):
+            for location, change in ((delta.from_location, -1), (delta.to_location, +1)):
+                if location in self.threat_counts:
+                    self.threat_counts[location] += change
+                    self._refresh_city(location)
+        elif isinstance(delta, SeatsChanged):
+            party = PartyID(delta.party_id)
+            self.totals[party] += self.weights.seat * (delta.seats - self.seats[party])
+            self.seats[party] = delta.seats
+
+    def score(self, party: PartyID) -> float:
+        """자신의 점수 - 가장 강한 상대의 점수."""
+        return self._relative(party, self.totals)
+
+    def score_base_change(self, party: PartyID, city_id: str, changes: Dict[PartyID, int]) -> float:
+        """city_id의 기반 수를 changes만큼 바꿨을 때의 score(party). 상태는 바꾸지 않습니다."""
+        bases = dict(self.bases[city_id])
+        for changed_party, amount in changes.items():
+            bases[changed_party] = bases.get(changed_party, 0) + amount
+        old = self._contrib[city_id]
+        totals = dict(self.totals)
+        for p in PARTIES:
+            new = city_contribution(bases, self.threat_counts[city_id], self.city_weights[city_id], p, self.weights)
+            totals[p] += new - old[p]
+        return self._relative(party, totals)
+
+    def _refresh_city(self, city_id: str):
+        contrib = self._contrib[city_id]
+        bases = self.bases[city_id]
+        for party in PARTIES:
+            new = city_contribution(bases, self.threat_counts[city_id], self.city_weights[city_id], party, self.weights)
+            self.totals[party] += new - contrib[party]
+            contrib[party] = new
+
+    @staticmethod
+    def _relative(party: PartyID, totals: Dict[PartyID, float]) -> float:
+        best_opponent = max(value for other, value in totals.items() if other != party)
+        return totals[party] - best_opponent
@@ -0,0 +1,359 @@
+# commands.py
+import abc
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Tuple
+
+from enums import GamePhase, PartyID
+
+if TYPE_CHECKING:
+    from models import GameModel
+
+
+class GameCommand(abc.ABC):
+    """
+    GameModel 상태 변경 한 건. 변경분(delta)만 기록하므로 apply/revert 모두 O(변경량)입니다.
+    실제 상태 조작은 GameModel의 _apply_* 기본 연산이 담당합니다.
+    """
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def apply(self, model: "GameModel"):
+        pass
+
+    @abc.abstractmethod
+    def revert(self, model: "GameModel"):
+        pass
+
+
+@dataclass(slots=True)
+class PlaceBaseCommand(GameCommand):
+    party_id: PartyID
+    city_id: str
+
+    def apply(self, model):
+        model._apply_base_change(self.party_id, self.city_id, +1)
+
+    def revert(self, model):
+        model._apply_base_change(self.party_id, self.city_id, -1)
+
+
+@dataclass(slots=True)
+class RemoveBaseCommand(GameCommand):
+    party_id: PartyID
+    city_id: str
+
+    def apply(self, model):
+        model._apply_base_change(self.party_id, self.city_id, -1)
+
+    def revert(self, model):
+        model._apply_base_change(self.party_id, self.city_id, +1)
+
+
+@dataclass(slots=True)
+class MoveThreatCommand(GameCommand):
+    # 모두 IdRegistry의 정수 id (threat_instances / locations)
+    instance: int
+    from_location: int
+    to_location: int
+
+    def apply(self, model):
+        model._apply_threat_location(self.instance, self.to_location)
+
+    def revert(self, model):
+        model._apply_threat_location(self.instance, self.from_location)
+
+
+@dataclass(slots=True)
+class MoveUnitCommand(GameCommand):
+    # 모두 IdRegistry의 정수 id (unit_instances / locations)
+    instance: int
+    from_location: int
+    to_location: int
+
+    def apply(self, model):
+        model._apply_unit_location(self.instance, self.to_location)
+
+    def revert(self, model):
+        model._apply_unit_location(self.instance, self.from_location)
+
+
+@dataclass(slots=True)
+class SetPhaseCommand(GameCommand):
+    old: GamePhase
+    new: GamePhase
+
+    def apply(self, model):
+        model.phase = self.new
+
+    def revert(self, model):
+        model.phase = self.old
+
+
+@dataclass(slots=True)
+class SetPlayerIndexCommand(GameCommand):
+    old: int
+    new: int
+
+    def apply(self, model):
+        model._apply_player_index(self.new)
+
+    def revert(self, model):
+        model._apply_player_index(self.old)
+
+
+@dataclass(slots=True)
+class SetTrackerCommand(GameCommand):
+    tracker: str
+    old: Any
+    new: Any
+
+    def apply(self, model):
+        model._apply_tracker(self.tracker, self.new)
+
+    def revert(self, model):
+        model._apply_tracker(self.tracker, self.old)
+
+
+@dataclass(slots=True)
+class SetFieldCommand(GameCommand):
+    """화면에 표시되지 않는 진행 상태(셋업 순서, 리액션 스택 등) 하나. 리스트 값은 제자리에서 고치지 않고 새 리스트로 교체"""
+    field: str
+    old: Any
+    new: Any
+
+    def apply(self, model):
+        setattr(model, self.field, self.new)
+
+    def revert(self, model):
+        setattr(model, self.field, self.old)
+
+
+@dataclass(slots=True)
+class SetSeatsCommand(GameCommand):
+    party_id: PartyID
+    old: int
+    new: int
+
+    def apply(self, model):
+        model._apply_seats(self.party_id, self.new)
+
+    def revert(self, model):
+        model._apply_seats(self.party_id, self.old)
+
+
+@dataclass(slots=True)
+class ReshuffleDeckCommand(GameCommand):
+    party_id: Optional[PartyID]
+    kind: str  # "party" / "timeline"
+    before_draw: Optional[list] = None
+    before_discard: Optional[list] = None
+    after_draw: Optional[list] = None
+    # 덱 난수 스트림의 섞기 전/후 상태. 되돌리면 스트림도 되돌려, speculate()/undo가 이후 섞기 결과를 바꾸지 않도록 함
+    rng_before: Any = None
+    rng_after: Any = None
+
+    def apply(self, model):
+        deck, _ = model._deck_and_hand(self.party_id, self.kind)
+        if self.after_draw is None:
+            # 최초 실행: 실제로 섞고 결과를 기록해 redo가 같은 순서를 재현하도록 함
+            self.before_draw, self.before_discard = list(deck.draw_pile), list(deck.discard_pile)
+            self.rng_before = deck.rng.getstate()
+            deck.reshuffle()
+            self.after_draw = list(deck.draw_pile)
+            self.rng_after = deck.rng.getstate()
+        else:
+            deck.draw_pile, deck.discard_pile = list(self.after_draw), []
+            deck.rng.setstate(self.rng_after)
+
+    def revert(self, model):
+        deck, _ = model._deck_and_hand(self.party_id, self.kind)
+        deck.draw_pile, deck.discard_pile = list(self.before_draw), list(self.before_discard)
+        deck.rng.setstate(self.rng_before)
+
+
+@dataclass(slots=True)
+class DrawCardCommand(GameCommand):
+    party_id: PartyID
+    kind: str
+    card_id: str
+
+    def apply(self, model):
+        deck, hand = model._deck_and_hand(self.party_id, self.kind)
+        deck.draw_pile.pop()
+        hand.add(self.card_id)
+
+    def revert(self, model):
+        deck, hand = model._deck_and_hand(self.party_id, self.kind)
+        hand.remove(self.card_id)
+        deck.draw_pile.append(self.card_id)
+
+
+@dataclass(slots=True)
+class DiscardCardCommand(GameCommand):
+    party_id: PartyID
+    kind: str
+    card_id: str
+
+    def apply(self, model):
+        deck, hand = model._deck_and_hand(self.party_id, self.kind)
+        hand.remove(self.card_id)
+        deck.discard(self.card_id)
+
+    def revert(self, model):
+        deck, hand = model._deck_and_hand(self.party_id, self.kind)
+        deck.discard_pile.pop()
+        hand.add(self.card_id)
+
+
+_NO_CHOICE = object()
+
+
+@dataclass(slots=True)
+class SetAgendaChoiceCommand(GameCommand):
+    party_id: PartyID
+    old: Any  # 이전 선택이 없었으면 _NO_CHOICE
+    new: Any
+
+    def apply(self, model):
+        model._pending_agenda_choices[self.party_id] = self.new
+
+    def revert(self, model):
+        if self.old is _NO_CHOICE:
+            model._pending_agenda_choices.pop(self.party_id, None)
+        else:
+            model._pending_agenda_choices[self.party_id] = self.old
+
+
+@dataclass(slots=True)
+class ClearAgendaChoicesCommand(GameCommand):
+    old: dict
+
+    def apply(self, model):
+        model._pending_agenda_choices = {}
+
+    def revert(self, model):
+        model._pending_agenda_choices = dict(self.old)
+
+
+class HistoryMark(NamedTuple):
+    done_count: int
+    step_count: int
+    redo: List[Tuple[List[GameCommand], Any]]
+
+
+class CommandHistory:
+    """
+    실행된 GameCommand 기록.
+    - checkpoint()로 나뉜 '단계'(플레이어 결정 1회) 단위로 undo/redo. 단계마다 tag(예: 그때 기다리던 입력 요청)를 함께 보관
+    - 최근 max_steps 단계만 되돌릴 수 있고 그보다 오래된 명령은 버림 (None이면 제한 없음)
+    - mark()/rollback()으로 탐색 AI의 make/unmake
+    - journal이 있으면 상태를 바꾼 모든 적용/되돌림을 (명령, 정방향 여부)로 순서대로 남김 (자동 저장 로그)
+    """
+
+    def __init__(self, max_steps: Optional[int] = 256):
+        self.max_steps = max_steps
+        self._done: List[GameCommand] = []
+        self._step_starts: List[int] = []  # 각 단계가 시작된 _done 인덱스
+        self._step_tags: List[Any] = []
+        self._redo: List[Tuple[List[GameCommand], Any]] = []
+        self._marks: int = 0  # 진행 중인 mark() 수. 그동안은 오래된 명령을 버리지 않음 (mark의 인덱스 유지)
+        self.journal: Optional[List[Tuple[GameCommand, bool]]] = None
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def execute(self, command: GameCommand, model: "GameModel"):
+        command.apply(model)
+        self._done.append(command)
+        if self.journal is not None:
+            self.journal.append((command, True))
+        if self._redo:
+            # 새 변경이 생기면 redo 기록은 무효. (rollback 시 복원할 수 있도록 새 리스트로 교체)
+            self._redo = []
+
+    def checkpoint(self, tag: Any = None):
+        """
+        새 단계를 시작합니다. 이후의 명령들은 undo 한 번에 함께 되돌려집니다.
+        명령이 하나도 없는 단계도 남기므로, 단계 수는 checkpoint() 호출 수(플레이어 결정 수)와 같습니다.
+        """
+        self._step_starts.append(len(self._done))
+        self._step_tags.append(tag)
+        # 한도의 두 배가 되면 절반을 한 번에 버려 단계마다 목록을 옮기지 않도록 함
+        if self.max_steps is not None and not self._marks and len(self._step_starts) > 2 * self.max_steps:
+            self._forget(len(self._step_starts) - self.max_steps)
+
+    def _forget(self, steps: int):
+        """가장 오래된 steps개 단계(와 첫 checkpoint 이전 명령)를 버립니다. 더는 그 앞으로 되돌릴 수 없습니다."""
+        cut = self._step_starts[steps]
+        del self._done[:cut]
+        self._step_starts = [start - cut for start in self._step_starts[steps:]]
+        del self._step_tags[:steps]
+
+    @property
+    def step_tags(self) -> List[Any]:
+        """되돌릴 수 있는 단계들의 tag (오래된 것부터)."""
+        return list(self._step_tags)
+
+    def clear(self):
+        self._done.clear()
+        self._step_starts.clear()
+        self._step_tags.clear()
+        self._redo = []
+
+    def can_undo(self) -> bool:
+        return bool(self._step_starts)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def undo(self, model: "GameModel") -> bool:
+        """
+        마지막 단계를 되돌립니다. 첫 checkpoint 이전의 명령(게임 준비)은 되돌리지 않습니다.
+        되돌린 단계의 tag는 undone_tag로 확인할 수 있습니다.
+        """
+        if not self._step_starts:
+            return False
+        start = self._step_starts.pop()
+        tag = self._step_tags.pop()
+        step = self._done[start:]
+        del self._done[start:]
+        for command in reversed(step):
+            command.revert(model)
+        if self.journal is not None:
+            self.journal.extend((command, False) for command in reversed(step))
+        self._redo.append((step, tag))
+        return True
+
+    @property
+    def undone_tag(self) -> Any:
+        """마지막으로 되돌린(다음 redo가 다시 적용할) 단계의 tag."""
+        return self._redo[-1][1] if self._redo else None
+
+    def redo(self, model: "GameModel") -> bool:
+        if not self._redo:
+            return False
+        step, tag = self._redo.pop()
+        self._step_starts.append(len(self._done))
+        self._step_tags.append(tag)
+        for command in step:
+            command.apply(model)
+        self._done.extend(step)
+        if self.journal is not None:
+            self.journal.extend((command, True) for command in step)
+        return True
+
+    def mark(self) -> HistoryMark:
+        self._marks += 1
+        return HistoryMark(len(self._done), len(self._step_starts), self._redo)
+
+    def rollback(self, model: "GameModel", mark: HistoryMark):
+        """mark() 이후의 명령을 모두 되돌리고 redo 기록도 mark 시점으로 복원합니다."""
+        while len(self._done) > mark.done_count:
+            command = self._done.pop()
+            command.revert(model)
+            if self.journal is not None:
+                self.journal.append((command, False))
+        del self._step_starts[mark.step_count:]
+        del self._step_tags[mark.step_count:]
+        self._redo = mark.redo
+        self._marks -= 1
@@ -1,35 +1,135 @@
 # console_agent.py
 import asyncio # 기본 async 라이브러리
-from typing import Any, List, Dict
+import queue
+import sys
+import threading
+import weakref
+from typing import Any, List, Dict, Optional
 from colorama import Fore, Style # 색상 사용 예시
+from decision_context import DecisionContext
+from engine import TAKE_BACK
 from game_action import ActionTypeEnum, Move, PlayOptionEnum
 from player_agent import IPlayerAgent
 from models import GameModel
 from enums import PartyID
+from status_renderer import StatusRenderer
+from utils.localizer import Localizer
+
+class _StdinReader:
+    """
+    stdin을 읽는 프로세스 전체의 스레드 하나. 읽은 줄은 큐에 쌓고, 기다리는 프롬프트(어느 이벤트 루프든)를 깨웁니다.
+    프롬프트가 시간 초과로 취소되어도 읽기 스레드는 그대로이므로, 다음에 입력한 줄은 다음 프롬프트가 받습니다.
+    """
+
+    def __init__(self):
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._waiters: List[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self):
+        while True:
+            line = sys.stdin.readline()
+            self._lines.put(line.rstrip("\n") if line else None)  # None: EOF
+            with self._lock:
+                waiters, self._waiters = self._waiters, []
+            for loop, waiter in waiters:
+                try:
+                    loop.call_soon_threadsafe(lambda waiter=waiter: waiter.done() or waiter.set_result(None))
+                except RuntimeError:  # 이미 닫힌 이벤트 루프
+                    pass
+            if not line:
+                return
+
+    async def readline(self, prompt: str) -> str:
+        """프롬프트를 출력하고 한 줄을 기다립니다. 프롬프트가 뜨기 전에 입력된 줄(취소된 프롬프트의 답)은 버립니다."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="console-stdin", daemon=True)
+            self._thread.start()
+        while True:
+            try:
+                if self._lines.get_nowait() is None:
+                    self._lines.put(None)
+                    raise EOFError("stdin closed")
+            except queue.Empty:
+                break
+        print(prompt, end="", flush=True)
+        loop = asyncio.get_running_loop()
+        while True:
+            waiter = loop.create_future()
+            with self._lock:
+                self._waiters.append((loop, waiter))
+            # 대기자로 등록한 뒤에 큐를 확인해야 그 사이에 들어온 줄을 놓치지 않음
+            try:
+                line = self._lines.get_nowait()
+            except queue.Empty:
+                await waiter
+                continue
+            if line is None:
+                self._lines.put(None)
+                raise EOFError("stdin closed")
+            return line
 
-class ConsoleAgent(IPlayerAgent):
-    def localize(self, text): # Temporary localization function
-        temp_dict = {
-            PartyID.KPD: "KPD",
-            PartyID.SPD: "SPD",
-            PartyID.ZENTRUM: "Zentrum",
-            PartyID.DNVP: "DNVP",
-        }
-
-        if text in temp_dict:
-            return temp_dict[text]
 
-        return text  # Placeholder for localization logic
+class ConsoleAgent(IPlayerAgent):
+    # 같은 터미널을 쓰는 ConsoleAgent들은 언어 팩과 (같은 언어면) 렌더링 캐시를 공유
+    _localizer: Localizer | None = None
+    _terms: Dict[str, Dict[Any, str]] = {}  # 언어 -> 정당 id/도시 id -> 표시 이름
+    _shared_renderers: Dict[str, StatusRenderer] = {}
+    _stdin = _StdinReader()
+    # asyncio.Lock은 처음 쓰인 이벤트 루프에 묶이므로 루프(게임마다 asyncio.run)별로 따로 둠
+    _input_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, party_id: PartyID, language: str = "en"):
+        super().__init__(party_id)
+        self.language = language
+
+    @classmethod
+    def localizer(cls) -> Localizer:
+        if ConsoleAgent._localizer is None:
+            ConsoleAgent._localizer = Localizer()
+        return ConsoleAgent._localizer
+
+    @property
+    def renderer(self) -> StatusRenderer:
+        renderer = ConsoleAgent._shared_renderers.get(self.language)
+        if renderer is None:
+            renderer = StatusRenderer(self.localize, self.localizer().pack(self.language))
+            ConsoleAgent._shared_renderers[self.language] = renderer
+        return renderer
+
+    def on_game_start(self, game_model: GameModel):
+        super().on_game_start(game_model)
+        # 렌더러는 프로세스에서 공유되므로, 새 게임마다 이전 게임의 캐시와 version을 버림
+        # (새 게임의 state_version은 다시 1부터 시작해 그대로 두면 모든 delta가 무시됨)
+        self.renderer.reset(game_model.state_version)
+
+    def localize(self, text):
+        """정당 id(PartyID)나 도시 id를 표시 이름으로 바꿉니다. 카탈로그에 없으면 그대로 돌려줌."""
+        terms = ConsoleAgent._terms.get(self.language)
+        if terms is None:
+            pack = self.localizer().pack(self.language)
+            # PartyID는 str Enum이라 값 문자열과 같은 키로 조회됨
+            terms = {**pack.section("city"), **pack.section("party")}
+            ConsoleAgent._terms[self.language] = terms
+        try:
+            return terms.get(text, text)
+        except TypeError:  # 해시할 수 없는 선택지 (Move 등)
+            return text
 
     async def get_next_move(self, game_model: GameModel) -> 'Move':
         while True:
             # 1. 주 행동 선택
-            main_actions = ["Play Card", "Inspect"]
+            main_actions = ["Play Card", "Inspect", "Odds", "Take Back"]
             chosen_action = await self.get_choice(main_actions, {"prompt": "무엇을 하시겠습니까?"})
 
+            if chosen_action == "Take Back":
+                # 직전 결정으로 되돌림 (GamePresenter가 처리)
+                return TAKE_BACK
+
             if chosen_action == "Play Card":
                 # 2. 카드 선택
-                player_hand = game_model.party_states[self.party_id].hand_party
+                player_hand = list(game_model.party_states[self.party_id].hand_party)
                 if not player_hand:
                     print(f"{Fore.YELLOW}[INFO]{Style.RESET_ALL} 손에 카드가 없습니다.")
                     continue
@@ -66,27 +166,52 @@ class ConsoleAgent(IPlayerAgent):
 
             elif chosen_action == "Inspect":
                 status_data = {
+                    "version": game_model.state_version,
                     "round": game_model.round,
                     "turn": game_model.turn,
                     "parties": game_model.party_states,
                     "cities": game_model.cities_state,
                 }
-                self.receive_message("UI_SHOW_STATUS", status_data)
+                self.renderer.show(status_data, self.localize(self.party_id), repeat=True)
+                continue
+
+            elif chosen_action == "Odds":
+                self._print_odds(game_model)
                 continue
 
 
+    async def decide_choice(self, options: List[Any], context: Dict[str, Any], decision: DecisionContext) -> Any:
+        # 게임이 묻는 선택에만 '되돌리기'를 덧붙임 (카드/도시 같은 get_next_move 안의 세부 선택에는 없음)
+        choice = await self.get_choice(list(options) + ["Take Back"], context)
+        if choice == "Take Back":
+            choice = TAKE_BACK
+        decision.propose(choice)
+        return choice
+
     async def get_choice(self, options: List[Any], context: Dict[str, Any]) -> Any:
+            # 여러 정당의 선택이 동시에 요청되어도 터미널 입력은 한 번에 한 Agent만 사용
+            async with self._console_lock():
+                return await self._prompt_choice(options, context)
+
+    @staticmethod
+    def _console_lock() -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock = ConsoleAgent._input_locks.get(loop)
+        if lock is None:
+            lock = ConsoleAgent._input_locks[loop] = asyncio.Lock()
+        return lock
+
+    async def _prompt_choice(self, options: List[Any], context: Dict[str, Any]) -> Any:
             # main.py의 handle_request_player_choice 로직을 여기로 가져옴
             party_name = self.localize(self.party_id)
             prompt_str = context.get("prompt") or f"[{party_name}] 선택하세요:"
             print(f"\n🤔 [{party_name}] {prompt_str}")
-            # TODO: localize 함수 사용
-            localized_options = [str(opt) for opt in options] # 임시
+            localized_options = [str(self.localize(opt)) for opt in options]
             for i, option_str in enumerate(localized_options):
                 print(f"  {i+1}. {option_str}")
 
             while True:
-                choice_str = await asyncio.to_thread(input, f"[{party_name}] 번호 입력> ")
+                choice_str = await self._stdin.readline(f"[{party_name}] 번호 입력> ")
                 try:
                     choice_index = int(choice_str) - 1
                     if 0 <= choice_index < len(options):
@@ -96,6 +221,14 @@ class ConsoleAgent(IPlayerAgent):
                 except ValueError:
                     print(f"{Fore.RED}[ERROR]{Fore.RESET} 숫자를 입력하세요.")
 
+    def _print_odds(self, game_model: GameModel):
+        # 2d6 합계로 도시를 고를 때 각 도시가 뽑힐 확률
+        lines = [f"{Style.BRIGHT}--- 도시 선택 확률 (2d6) ---{Style.RESET_ALL}",
+                 f"  {'도시':<12} {'주사위':>4} {'확률':>7}"]
+        for city_id, roll, chance in game_model.odds.table():
+            lines.append(f"  {self.localize(city_id):<12} {roll:>4} {float(chance):>7.1%}")
+        print("\n".join(lines))
+
     def receive_message(self, event_type: str, data: Dict[str, Any]):
         party_name = self.localize(self.party_id)
         if event_type == "UI_SHOW_MESSAGE":
@@ -106,22 +239,8 @@ class ConsoleAgent(IPlayerAgent):
             error = data.get("error")
             if error:
                 print(f"{Fore.RED}[ERR] [{party_name}]: {error}{Style.RESET_ALL}")
+        elif event_type == "STATE_DELTA":
+            self.renderer.apply_delta(data["delta"])
         elif event_type == "UI_SHOW_STATUS":
-            status_message = Fore.GREEN + Style.BRIGHT + f"=== Game Status ({party_name}) ===\n"
-            status_message += Fore.CYAN + f"Round: {data['round']}\n"
-            status_message += Fore.CYAN + f"Turn: {self.localize(data['turn'])}\n"
-            status_message += Fore.YELLOW + "Parties:\n"
-            for party_id, party_data in data['parties'].items():
-                status_message += Fore.YELLOW + f" - {self.localize(party_id)}: {party_data.current_vp} VP, "
-                status_message += Fore.YELLOW + f"{len(party_data.hand_timeline)} Timeline Cards, "
-                status_message += Fore.YELLOW + f"{len(party_data.hand_party)} Party Cards\n"
-                status_message += Fore.WHITE + f"  ↳ Units in Supply: {', '.join(party_data.unit_supply) if party_data.unit_supply else 'None'}\n"
-            status_message += Fore.MAGENTA + "Cities:\n"
-            for city_id, city_data in data['cities'].items():
-                bases = ', '.join([f"{self.localize(party)}:{count}" for party, count in city_data.party_bases.items() if count > 0]) or "No bases"
-                units = ', '.join(city_data.units_on_city) or "No units"
-                threats = ', '.join(city_data.threats_on_city) or "No threats"
-                city_status = f"Bases: {bases} | Units: {units} | Threats: {threats}"
-                status_message += Fore.MAGENTA + f" - {self.localize(city_id)}: {city_status}\n"
-            status_message += Fore.RED + "===================\n"
-            print(status_message)
\ No newline at end of file
+            # 렌더러를 공유하는 다른 Agent가 이미 출력한 상태면 다시 출력하지 않음
+            self.renderer.show(data, party_name)
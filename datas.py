@@ -1,6 +1,6 @@
 from dataclasses import dataclass, asdict
 from pydantic import BaseModel
-from typing import Dict, Any, List, Mapping, Optional
+from typing import Dict, Any, List, Literal, Mapping, Optional
 from enum import Enum
 import logging
 
@@ -110,10 +110,21 @@ class UnitData(BaseModel):
     faction: Faction
     max_count: int
 
+class ThreatOverflowData(BaseModel):
+    """도시의 max_per_city에 이미 도달했을 때의 처리."""
+    action: Literal["place_in_dr_box", "remove_from_dr_box"]
+    threat_id: Optional[str] = None  # remove_from_dr_box: DR Box에서 제거할 위협 (기본값: 자기 자신)
+
+
 class ThreatData(BaseModel):
     id: str
     max_count: int
-    
+    max_per_city: Optional[int] = None   # None이면 제한 없음
+    max_in_dr_box: Optional[int] = None  # None이면 제한 없음
+    cancels: List[str] = []   # 같은 도시에 이 위협이 있으면 하나를 제거하고, 자신은 배치되지 않음
+    replaces: List[str] = []  # 같은 도시에 이 위협이 있으면 하나를 제거하고, 자신이 배치됨
+    overflow: Optional[ThreatOverflowData] = None
+
 
 class SocietyData(BaseModel):
     id: str
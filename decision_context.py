@@ -0,0 +1,70 @@
+# decision_context.py
+import asyncio
+import math
+import time
+from typing import Any, Optional
+
+
+class CancellationToken:
+    """결정을 더 이상 기다리지 않는다는 신호. Presenter가 cancel()하고 Agent는 cancelled를 확인합니다."""
+    __slots__ = ("_cancelled",)
+
+    def __init__(self):
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+
+class DecisionContext:
+    """
+    결정 하나의 시간 예산. 마감 시각(time.monotonic 기준)과 취소 토큰, 그리고 Agent가 지금까지 찾은 최선의 답을 담습니다.
+
+    - Agent(anytime)는 탐색하면서 propose()로 중간 답을 올리고, expired가 True가 되면 멈춥니다.
+      계산이 동기 코드라 이벤트 루프의 타이머가 끼어들 수 없으므로, 마감 확인은 Agent가 직접 해야 합니다.
+    - Presenter는 마감이 지나면 cancel()하고 그때까지 올라온 best를 사용합니다.
+    """
+    __slots__ = ("deadline", "token", "best", "best_score", "has_answer")
+
+    def __init__(self, deadline: Optional[float] = None, token: Optional[CancellationToken] = None):
+        self.deadline = deadline
+        self.token = token or CancellationToken()
+        self.best: Any = None
+        self.best_score: Optional[float] = None
+        self.has_answer = False
+
+    @classmethod
+    def with_budget(cls, seconds: Optional[float]) -> "DecisionContext":
+        """지금부터 seconds초 뒤가 마감인 결정. None이면 무제한."""
+        return cls(None if seconds is None else time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """마감까지 남은 초 (무제한이면 inf, 지났으면 0)."""
+        if self.deadline is None:
+            return math.inf
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.token.cancelled or (self.deadline is not None and time.monotonic() >= self.deadline)
+
+    def cancel(self):
+        self.token.cancel()
+
+    def propose(self, answer: Any, score: Optional[float] = None):
+        """
+        중간 답을 올립니다. score를 주면 더 높은 점수일 때만 바꾸고, 주지 않으면 항상 최신 답으로 바꿉니다
+        (반복 심화처럼 나중 답이 더 정확한 경우).
+        """
+        if score is not None and self.best_score is not None and score <= self.best_score:
+            return
+        self.best, self.best_score, self.has_answer = answer, score, True
+
+    async def checkpoint(self) -> bool:
+        """이벤트 루프에 한 번 양보하고 마감 여부를 돌려줍니다. 긴 탐색의 단계 사이에서 호출."""
+        await asyncio.sleep(0)
+        return self.expired
@@ -0,0 +1,150 @@
+# deck.py
+import logging
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from datas import GameKnowledge, PartyCardData, TimelineCardData
+
+
+logger = logging.getLogger(__name__)
+
+AnyCardData = Union[PartyCardData, TimelineCardData]
+
+
+_ABSENT = object()
+
+
+class Hand:
+    """
+    손패. 삽입 순서를 유지하는 dict 기반 집합이라 추가/제거/포함 확인이 모두 O(1)입니다.
+    (같은 카드 id는 한 장만 존재한다고 가정)
+    """
+    __slots__ = ("_cards",)
+
+    def __init__(self, cards: Iterable[str] = ()):
+        self._cards: Dict[str, None] = dict.fromkeys(cards)
+
+    def add(self, card_id: str):
+        self._cards[card_id] = None
+
+    def remove(self, card_id: str):
+        del self._cards[card_id]
+
+    def discard(self, card_id: str) -> bool:
+        return self._cards.pop(card_id, _ABSENT) is not _ABSENT
+
+    def __contains__(self, card_id: object) -> bool:
+        return card_id in self._cards
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._cards)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __bool__(self) -> bool:
+        return bool(self._cards)
+
+    def __repr__(self) -> str:
+        return f"Hand({list(self._cards)})"
+
+
+class Deck:
+    """
+    뽑을 더미(draw_pile)와 버린 더미(discard_pile). 더미의 맨 위는 리스트의 끝이라 draw/discard 모두 O(1).
+    뽑을 카드가 없으면 버린 더미를 섞어 새 더미로 만듭니다.
+    """
+
+    def __init__(self, cards: Iterable[str] = (), rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+        self.draw_pile: List[str] = list(cards)
+        self.discard_pile: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.draw_pile)
+
+    def shuffle(self):
+        self.rng.shuffle(self.draw_pile)
+
+    def needs_reshuffle(self) -> bool:
+        return not self.draw_pile and bool(self.discard_pile)
+
+    def reshuffle(self):
+        """버린 더미를 섞어 뽑을 더미 아래로 넣습니다."""
+        pile = self.discard_pile
+        self.discard_pile = []
+        self.rng.shuffle(pile)
+        self.draw_pile = pile + self.draw_pile
+        logger.debug(f"Deck reshuffled: {len(self.draw_pile)} cards.")
+
+    def draw(self) -> Optional[str]:
+        if not self.draw_pile:
+            if not self.discard_pile:
+                return None
+            self.reshuffle()
+        return self.draw_pile.pop()
+
+    def discard(self, card_id: str):
+        self.discard_pile.append(card_id)
+
+
+@dataclass
+class DeckStats:
+    total: int = 0
+    by_type: Counter = field(default_factory=Counter)      # "party" / "timeline"
+    by_party: Counter = field(default_factory=Counter)     # PartyCardData.party_id
+    by_era: Counter = field(default_factory=Counter)       # TimelineCardData.era 각 값
+    action_points_main: int = 0
+    action_points_sub: int = 0
+    removed_on_use: int = 0
+    unknown: int = 0
+
+    @property
+    def average_action_points(self) -> float:
+        known = self.total - self.unknown
+        return self.action_points_main / known if known else 0.0
+
+
+class CardIndex:
+    """카드 id -> PartyCardData/TimelineCardData 조회표 (GameKnowledge 기반)."""
+
+    def __init__(self, knowledge: GameKnowledge):
+        self._cards: Dict[str, AnyCardData] = {}
+        self._cards.update(knowledge.party_cards)
+        self._cards.update(knowledge.timeline_cards)
+
+    def get(self, card_id: str) -> Optional[AnyCardData]:
+        return self._cards.get(card_id)
+
+    def __contains__(self, card_id: object) -> bool:
+        return card_id in self._cards
+
+    def party_card_ids(self, party_id) -> List[str]:
+        return [card_id for card_id, card in self._cards.items()
+                if isinstance(card, PartyCardData) and card.party_id == party_id]
+
+    def timeline_card_ids(self, era: Optional[int] = None) -> List[str]:
+        return [card_id for card_id, card in self._cards.items()
+                if isinstance(card, TimelineCardData) and (era is None or era in card.era)]
+
+    def stats(self, card_ids: Iterable[str]) -> DeckStats:
+        """주어진 카드 묶음(덱, 손패, 버린 더미 등)의 구성 통계."""
+        stats = DeckStats()
+        for card_id in card_ids:
+            stats.total += 1
+            card = self._cards.get(card_id)
+            if card is None:
+                stats.unknown += 1
+                continue
+            if isinstance(card, PartyCardData):
+                stats.by_type["party"] += 1
+                stats.by_party[card.party_id] += 1
+            else:
+                stats.by_type["timeline"] += 1
+                stats.by_era.update(card.era)
+            stats.action_points_main += card.action_point_main
+            stats.action_points_sub += card.action_point_sub
+            stats.removed_on_use += card.is_removed_on_use
+        return stats
@@ -0,0 +1,44 @@
+# dice_odds.py
+from fractions import Fraction
+from typing import Dict, List, Tuple
+
+from datas import GameKnowledge
+
+
+def sum_counts(dice: int = 2, sides: int = 6) -> Dict[int, int]:
+    """dice개의 sides면 주사위 합계별 경우의 수 (정확한 정수). 예: 2d6 -> {2: 1, 3: 2, ..., 7: 6, ..., 12: 1}"""
+    counts = {0: 1}
+    for _ in range(dice):
+        next_counts: Dict[int, int] = {}
+        for total, ways in counts.items():
+            for face in range(1, sides + 1):
+                next_counts[total + face] = next_counts.get(total + face, 0) + ways
+        counts = next_counts
+    return counts
+
+
+class DiceOdds:
+    """
+    CityData.city_dice_roll 기반 도시 선택 확률표.
+    city_dice_roll은 도시마다 다른 2~12의 값이므로, 2d6 합계로 도시를 고를 때 각 도시가 뽑힐 정확한 확률을
+    게임 시작 시 한 번 계산해 두고 O(1)로 조회합니다.
+    """
+
+    def __init__(self, knowledge: GameKnowledge, dice: int = 2, sides: int = 6):
+        self.dice = dice
+        self.sides = sides
+        self.counts = sum_counts(dice, sides)
+        self.outcomes = sides ** dice
+        self.rolls: Dict[str, int] = {city_id: city.city_dice_roll for city_id, city in knowledge.cities.items()}
+        self._selection: Dict[str, Fraction] = {
+            city_id: Fraction(self.counts.get(roll, 0), self.outcomes) for city_id, roll in self.rolls.items()
+        }
+
+    def selection_chance(self, city_id: str) -> Fraction:
+        """주사위 합계가 이 도시의 city_dice_roll과 같을 확률."""
+        return self._selection[city_id]
+
+    def table(self) -> List[Tuple[str, int, Fraction]]:
+        """odds 화면 등에서 쓰는 (도시, city_dice_roll, 선택 확률) 목록 (city_dice_roll 순)."""
+        return sorted(((city_id, roll, self._selection[city_id]) for city_id, roll in self.rolls.items()),
+                      key=lambda row: row[1])
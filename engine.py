@@ -0,0 +1,185 @@
+# engine.py
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from enums import GamePhase, PartyID
+import game_events
+from models import GameModel
+from scenario_model import ScenarioModel
+
+
+logger = logging.getLogger(__name__)
+
+MOVE = "move"
+CHOICE = "choice"
+# Agent가 답 대신 돌려주면 그 정당의 직전 결정을 되돌림 (GamePresenter가 GameEngine.take_back으로 처리)
+TAKE_BACK = "TAKE_BACK"
+
+# 입력 없이는 진행할 수 없는 단계. 이 단계에서 대기 중인 요청이 없으면 게임이 멈춘 것
+WAITING_PHASES = (
+    GamePhase.SETUP,
+    GamePhase.AGENDA_PHASE_AWAIT_CHOICES,
+    GamePhase.IMPULSE_PHASE_AWAIT_MOVE,
+    GamePhase.IMPULSE_PHASE_AWAIT_REACTION,
+    GamePhase.REACTION_WINDOW_AWAIT_CHOICE,
+)
+
+
+@dataclass(eq=False)
+class Request:
+    """답을 기다리는 입력 하나. kind가 MOVE면 options는 가능한 Move 목록, CHOICE면 선택지."""
+    kind: str
+    player_id: PartyID
+    options: List[Any]
+    context: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def default(self) -> Any:
+        """Agent가 답하지 못했을 때 쓰는 기본 답."""
+        return self.options[0] if self.options else None
+
+
+class Answered(NamedTuple):
+    """답 하나로 시작된 결정 단계의 checkpoint tag. 되돌리면 pending(답하기 직전의 대기 요청)이 다시 대기합니다."""
+    pending: List[Request]
+    request: Request
+
+
+class GameEngine:
+    """
+    규칙 진행의 동기 API. Model을 다음 입력이 필요할 때까지 진행시키고 답을 기다리는 Request를 돌려줍니다.
+    asyncio도 Agent도 모르므로, 시뮬레이션과 탐색은 이벤트 루프 없이 step()으로 게임을 직접 진행할 수 있습니다.
+    GamePresenter는 이 위에서 Agent에게 묻고 답을 넘기는 asyncio 어댑터입니다.
+
+    Model이 버스에 발행하는 REQUEST_* 이벤트를 받아 대기 목록에 쌓고, run()이 멈출 때마다
+    AWAITING_INPUT을 발행합니다 (자동 저장 등은 이 시점의 안정된 상태를 기록).
+    답마다 Model에 checkpoint를 남기므로 GameModel.undo()/redo()를 하면 대기 요청도 그 시점으로 돌아갑니다.
+    """
+
+    def __init__(self, model: GameModel):
+        self.model = model
+        self._pending: List[Request] = []
+        self._redo_pending: List[List[Request]] = []  # undo 직전의 대기 요청 (redo하면 복원)
+        self._stalled = False
+        bus = model.bus
+        bus.subscribe(game_events.REQUEST_PLAYER_MOVE, self._on_move_request)
+        bus.subscribe(game_events.REQUEST_PLAYER_CHOICE, self._on_choice_request)
+        bus.subscribe(game_events.REQUEST_SIMULTANEOUS_CHOICES, self._on_simultaneous_request)
+        bus.subscribe(game_events.HISTORY_UNDONE, self._on_undone)
+        bus.subscribe(game_events.HISTORY_REDONE, self._on_redone)
+
+    # --- Model -> Engine ---
+    def _on_move_request(self, data: dict):
+        player_id = data["player_id"]
+        self._pending.append(Request(MOVE, player_id, self.model.get_valid_moves(player_id)))
+
+    def _on_choice_request(self, data: dict):
+        self._pending.append(Request(CHOICE, data["player_id"], list(data["options"]), data.get("context") or {}))
+
+    def _on_simultaneous_request(self, data: dict):
+        for request in data.get("requests", []):
+            self._on_choice_request(request)
+
+    def _on_undone(self, data: dict):
+        tag = data["tag"]
+        self._redo_pending.append(self._pending)
+        self._pending = list(tag.pending) if isinstance(tag, Answered) else []
+
+    def _on_redone(self, data: dict):
+        self._pending = self._redo_pending.pop() if self._redo_pending else []
+
+    # --- 진행 ---
+    @property
+    def pending(self) -> List[Request]:
+        """답을 기다리는 요청들 (동시 선택이면 여러 개). 순서대로 답하면 됩니다."""
+        return list(self._pending)
+
+    @property
+    def finished(self) -> bool:
+        return self.model.phase == GamePhase.GAME_OVER
+
+    @property
+    def stalled(self) -> bool:
+        """게임이 끝나지 않았는데 대기 요청도 없어 더 진행할 수 없는 상태 (run()이 None을 돌려준 경우)."""
+        return self._stalled
+
+    def start(self, scenario: ScenarioModel) -> Optional[Request]:
+        """시나리오로 게임을 준비하고 첫 입력까지 진행합니다."""
+        self.model.setup_game_from_scenario(scenario)
+        return self.run()
+
+    def resume(self, requests: Iterable[Request]):
+        """저장된 게임을 불러왔을 때 답을 기다리던 요청을 복원합니다."""
+        self._pending = list(requests)
+        self._redo_pending.clear()
+
+    def run(self, max_transitions: int = 100000) -> Optional[Request]:
+        """
+        대기 중인 요청이 생길 때까지 규칙을 진행하고 첫 번째 요청을 돌려줍니다.
+        게임이 끝났거나, advance()가 아무 명령도 실행하지 않아 더 진행할 수 없으면(stalled) None.
+        """
+        model = self.model
+        self._stalled = False
+        for _ in range(max_transitions):
+            if self._pending or model.phase == GamePhase.GAME_OVER or self._stalled:
+                model.bus.publish(game_events.AWAITING_INPUT, {"requests": list(self._pending)})
+                return self._pending[0] if self._pending else None
+            if model.phase in WAITING_PHASES:
+                raise RuntimeError(f"Game is waiting in {model.phase.name} but no request is pending.")
+            # advance()는 상태만 보고 진행하므로, 아무것도 바꾸지 않았다면 다시 불러도 마찬가지
+            commands = len(model.history)
+            model.advance()
+            if not self._pending and len(model.history) == commands:
+                logger.warning(f"Game cannot advance in {model.phase.name}: no rule moves this state forward.")
+                self._stalled = True
+        raise RuntimeError(f"No input was requested within {max_transitions} transitions (phase {model.phase.name}).")
+
+    def answer(self, request: Request, action: Any):
+        """대기 중인 요청 하나에 답합니다. 진행은 하지 않으므로, 동시 선택에 모두 답한 뒤 run()을 부르면 됩니다."""
+        if request not in self._pending:
+            raise ValueError(f"Request {request.kind} for {request.player_id} is not pending.")
+        self.model.checkpoint(Answered(list(self._pending), request))
+        self._pending.remove(request)
+        self._redo_pending.clear()
+        if request.kind == MOVE:
+            self.model.submit_move(action)
+        else:
+            self.model.submit_choice(request.player_id, action, request.context)
+
+    def take_back(self, player_id: PartyID) -> bool:
+        """
+        player_id의 마지막 답을 되돌립니다. 그 뒤에 다른 정당이 한 답도 함께 되돌려지고, 그때 기다리던 요청이 다시 대기합니다.
+        되돌릴 수 있는 답이 없으면 아무것도 바꾸지 않고 False. 이어서 run()으로 대기 요청을 받으면 됩니다.
+        """
+        for depth, tag in enumerate(reversed(self.model.history.step_tags), 1):
+            if isinstance(tag, Answered) and tag.request.player_id == player_id:
+                break
+        else:
+            return False
+        for _ in range(depth):
+            self.model.undo()
+        logger.info(f"{player_id} took back its last decision ({depth} step(s) undone).")
+        return True
+
+    def step(self, action: Any, request: Optional[Request] = None) -> Optional[Request]:
+        """요청(기본: 첫 번째 대기 요청)에 답하고 다음 입력이 필요할 때까지 진행합니다."""
+        if request is None:
+            if not self._pending:
+                raise ValueError("No request is pending.")
+            request = self._pending[0]
+        self.answer(request, action)
+        return self.run()
+
+
+def play(engine: GameEngine, policy: Callable[[GameModel, Request], Any], max_steps: Optional[int] = None) -> Optional[Request]:
+    """
+    policy(model, request) -> 답 으로 게임을 끝까지(또는 max_steps번 결정할 때까지) 동기로 진행합니다.
+    반환: 멈춘 시점의 대기 요청 (게임이 끝났거나 더 진행할 수 없으면 None. engine.finished/stalled로 구분).
+    """
+    request = engine.run()
+    steps = 0
+    while request is not None and (max_steps is None or steps < max_steps):
+        request = engine.step(policy(engine.model, request), request)
+        steps += 1
+    return request
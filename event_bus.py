@@ -6,19 +6,21 @@ logger = logging.getLogger(__name__)
 
 
 class EventBus:
-    listeners = {}
+    def __init__(self):
+        # 게임(버스)마다 따로 유지. 한 프로세스에서 여러 게임을 돌려도 서로의 구독자가 섞이지 않음
+        self.listeners = {}
 
     def subscribe(self, event_type, listener):
-        if event_type not in EventBus.listeners:
-            EventBus.listeners[event_type] = []
-        EventBus.listeners[event_type].append(listener)
+        if event_type not in self.listeners:
+            self.listeners[event_type] = []
+        self.listeners[event_type].append(listener)
         logger.debug(f"Listener subscribed to event '{event_type}'")
 
     def publish(self, event_type, data):
-        if event_type in EventBus.listeners:
-            for listener in EventBus.listeners[event_type]:
+        if event_type in self.listeners:
+            for listener in self.listeners[event_type]:
                 if inspect.iscoroutinefunction(listener):
                     asyncio.create_task(listener(data))
                 else:
                     listener(data)
-            logger.debug(f"Event '{event_type}' published to {len(EventBus.listeners[event_type])} listeners")
\ No newline at end of file
+            logger.debug(f"Event '{event_type}' published to {len(self.listeners[event_type])} listeners")
\ No newline at end of file
@@ -9,10 +9,21 @@ REQUEST_PLAYER_MOVE = "REQUEST_PLAYER_MOVE"   # Presenter -> View
 
 REQUEST_PLAYER_CHOICE = "REQUEST_PLAYER_CHOICE" # Presenter -> View
 
-PLAYER_CHOICE_MADE = "PLAYER_CHOICE_MADE"       # View -> Presenter
+# data: {"requests": [{"player_id", "options", "context"}, ...]}. 모든 요청을 동시에 진행
+REQUEST_SIMULTANEOUS_CHOICES = "REQUEST_SIMULTANEOUS_CHOICES"
 
 # --- Data Events (Model -> Presenter) ---
 DATA_PARTY_BASE_PLACED = "DATA_PARTY_BASE_PLACED"
+DATA_PARTY_BASE_REMOVED = "DATA_PARTY_BASE_REMOVED"
 
 # --- Game Flow Events (Model -> Presenter) ---
-SETUP_PHASE_COMPLETE = "SETUP_PHASE_COMPLETE"
\ No newline at end of file
+SETUP_PHASE_COMPLETE = "SETUP_PHASE_COMPLETE"
+# data: {"requests": [engine.Request, ...]}. GameEngine이 진행을 멈추고 입력을 기다림 (게임이 끝났으면 빈 목록)
+AWAITING_INPUT = "AWAITING_INPUT"
+# data: {"tag": GameModel.checkpoint()에 넘긴 tag}. GameModel.undo()/redo()가 결정 단계 하나를 되돌림/다시 적용함
+HISTORY_UNDONE = "HISTORY_UNDONE"
+HISTORY_REDONE = "HISTORY_REDONE"
+
+# --- State Delta Events (Model -> Subscribers) ---
+# data: {"delta": StateDelta}. version은 모델 단위로 단조 증가
+STATE_DELTA = "STATE_DELTA"
@@ -1,7 +1,9 @@
 import logging
 import json
+from typing import Optional
 
 
+from autosave import Autosave, load_autosave
 from enums import PartyID
 from player_agent import IPlayerAgent
 from presenter import GamePresenter
@@ -21,26 +23,66 @@ class GameManager:
         logger.info("Loading static data...")
         self.loader = DataLoader()
 
-        party_data = self.loader.load("data/parties.json")
-        city_data = self.loader.load("data/cities.json")
-        unit_data = self.loader.load("data/units.json")
-        threat_data = self.loader.load("data/threats.json")
+        data = self.loader.load_many({
+            "party": "data/parties.json",
+            "cities": "data/cities.json",
+            "units": "data/units.json",
+            "threat": "data/threats.json",
+        })
 
-        self.game_knowledge = GameKnowledge(party=party_data, cities=city_data, units=unit_data, threat=threat_data # type: ignore
-                                       
-                                       )
+        self.game_knowledge = GameKnowledge(**data) # type: ignore
         self.bus = EventBus()
+        self.autosave: Optional[Autosave] = None
 
-    def start_game(self, agents: dict[PartyID, IPlayerAgent]):
+    def start_game(self, agents: dict[PartyID, IPlayerAgent], choice_timeouts: Optional[dict[PartyID, float]] = None,
+                   seed: Optional[int] = None, autosave: Optional[str] = None):
+        """autosave(디렉터리)를 주면 진행 중인 게임을 그곳에 계속 저장합니다 (resume_game으로 이어하기)."""
         logger.info("Setting up game...")
-        self.model = GameModel(self.bus, knowledge=self.game_knowledge)
-        
-        self.presenter = GamePresenter(self.bus, self.model, agents)
+        self.close_autosave()
+        # 게임마다 새 버스를 사용해 이전 게임의 구독자(presenter 등)가 남지 않도록 함
+        self.bus = EventBus()
+        self.model = GameModel(self.bus, knowledge=self.game_knowledge, seed=seed)
+        logger.info(f"Game seed: {self.model.seed}")
+        if autosave:
+            self.autosave = Autosave(self.model, autosave)
+
+        self.presenter = GamePresenter(self.bus, self.model, agents, choice_timeouts=choice_timeouts)
+        for agent in agents.values():
+            agent.on_game_start(self.model)
 
         logger.info("Game setup complete.")
 
         return self.model, self.presenter
 
+    def resume_game(self, agents: dict[PartyID, IPlayerAgent], autosave: str,
+                    choice_timeouts: Optional[dict[PartyID, float]] = None):
+        """자동 저장에서 게임을 불러와 이어서 저장합니다. presenter.play()가 답을 기다리던 요청부터 진행합니다."""
+        logger.info(f"Resuming game from {autosave}...")
+        self.close_autosave()
+        self.bus = EventBus()
+        self.model, pending = load_autosave(autosave, self.bus, self.game_knowledge)
+        logger.info(f"Game seed: {self.model.seed}")
+        self.autosave = Autosave(self.model, autosave)
+
+        self.presenter = GamePresenter(self.bus, self.model, agents, choice_timeouts=choice_timeouts)
+        self.presenter.engine.resume(pending)
+        for agent in agents.values():
+            agent.on_game_start(self.model)
+
+        logger.info("Game resumed.")
+
+        return self.model, self.presenter
+
+    def close_autosave(self, discard: bool = False):
+        """자동 저장 스레드를 끝냅니다. discard면 저장 파일도 지웁니다 (게임을 정상적으로 마쳤을 때)."""
+        if self.autosave is None:
+            return
+        if discard:
+            self.autosave.discard()
+        else:
+            self.autosave.close()
+        self.autosave = None
+
     async def load_scenario(self, filepath: str):
         scenario_model = load_and_validate_scenario(filepath, self.game_knowledge)
         if not scenario_model:
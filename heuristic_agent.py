@@ -0,0 +1,167 @@
+# heuristic_agent.py
+import logging
+from typing import Any, Dict, List, Optional
+
+from action_space import ActionSpace
+from board_eval import PARTIES, EvalWeights, IncrementalEvaluator
+from decision_context import DecisionContext
+from enums import PartyID
+from game_action import ActionTypeEnum, Move
+from models import GameModel
+from opening_book import OpeningBook
+from player_agent import IPlayerAgent
+from setup_solver import SetupSolver
+from state_encoder import StateEncoder
+
+
+logger = logging.getLogger(__name__)
+
+
+class HeuristicAgent(IPlayerAgent):
+    """
+    후보 수마다 보드 평가 점수를 계산해 가장 좋은 수를 고르는 탐욕적(greedy) AI.
+    평가는 IncrementalEvaluator가 STATE_DELTA로 유지하므로, 후보 하나를 평가하는 데 도시 하나만 계산합니다.
+    opening_book이 주어지면 책에 있는 국면은 탐색/평가 없이 책의 수를 둡니다.
+    """
+
+    def __init__(self, party_id: PartyID, weights: Optional[EvalWeights] = None, setup_depth: int = 4,
+                 opening_book: Optional[OpeningBook] = None):
+        super().__init__(party_id)
+        self.weights = weights or EvalWeights()
+        self.setup_depth = setup_depth
+        self.opening_book = opening_book
+        self.game_model: Optional[GameModel] = None
+        self.evaluator: Optional[IncrementalEvaluator] = None
+        self.setup_solver: Optional[SetupSolver] = None
+        self._encoder: Optional[StateEncoder] = None
+        self._action_space: Optional[ActionSpace] = None
+
+    def on_game_start(self, game_model: GameModel):
+        super().on_game_start(game_model)
+        self.game_model = game_model
+        self.evaluator = IncrementalEvaluator(game_model.knowledge, self.weights)
+        self.evaluator.sync(game_model)
+        self.setup_solver = None
+        if self.opening_book is not None:
+            self._encoder = StateEncoder(game_model.knowledge)
+            self._action_space = ActionSpace(game_model.knowledge)
+
+    def _ensure_synced(self):
+        # delta가 전달되지 않는 환경에서도 동작하도록, 버전이 어긋나면 전체 재계산
+        if self.evaluator and self.game_model and self.evaluator.version != self.game_model.state_version:
+            self.evaluator.sync(self.game_model)
+
+    async def get_next_move(self, game_model: GameModel) -> 'Move':
+        return await self.decide_move(game_model, DecisionContext())
+
+    async def get_choice(self, options: List[Any], context: Dict[str, Any]) -> Any:
+        return await self.decide_choice(options, context, DecisionContext())
+
+    async def decide_move(self, game_model: GameModel, decision: DecisionContext) -> 'Move':
+        if self.game_model is not game_model:
+            self.on_game_start(game_model)
+        self._ensure_synced()
+
+        valid_moves = game_model.get_valid_moves(self.party_id)
+        if not valid_moves:
+            raise RuntimeError(f"No valid moves for AI {self.party_id}")
+        booked = self._book_select(valid_moves, self._action_space.move_index if self._action_space else None)
+        if booked is not None:
+            decision.propose(booked)
+            return booked
+        return self._best(valid_moves, self._score_move, decision)
+
+    async def decide_choice(self, options: List[Any], context: Dict[str, Any], decision: DecisionContext) -> Any:
+        options = list(options)
+        action = context.get("action")
+        if self.evaluator is None:
+            choice = self.rng.choice(options)
+            decision.propose(choice)
+            return choice
+        self._ensure_synced()
+
+        booked = self._book_select(options, self._action_space.choice_index if self._action_space else None)
+        if booked is not None:
+            decision.propose(booked)
+            return booked
+        if action == "initial_base_placement":
+            if self.setup_depth > 0 and self.game_model is not None:
+                scores = self._setup_scores(options, decision)
+                if scores is not None:
+                    return self._best(options, scores.__getitem__, decision)
+            return self._best(options, lambda city_id: self._score_place_base(city_id), decision)
+        if action == "resolve_place_base":
+            city_id = context["city_id"]
+            return self._best(options, lambda party: self.evaluator.score_base_change(
+                self.party_id, city_id, {self.party_id: +1, PartyID(party): -1}), decision)
+        if action == "reaction" and "PASS" in options:
+            decision.propose("PASS")
+            return "PASS"
+        choice = self.rng.choice(options)
+        decision.propose(choice)
+        return choice
+
+    def receive_message(self, event_type: str, data: Dict[str, Any]):
+        if event_type == "STATE_DELTA" and self.evaluator:
+            self.evaluator.apply_delta(data["delta"])
+
+    def _book_select(self, candidates: List[Any], index) -> Optional[Any]:
+        if self.opening_book is None or self.game_model is None or index is None:
+            return None
+        state = self._encoder.encode(self.game_model)
+        return self.opening_book.select(state, PARTIES.index(self.party_id), candidates, index)
+
+    def _setup_scores(self, options: List[Any], decision: DecisionContext) -> Optional[Dict[str, float]]:
+        """
+        반복 심화: 깊이 1부터 setup_depth까지 탐색하며 깊이마다 최선 도시를 decision에 올립니다.
+        마감이 지나면 마지막으로 끝까지 계산한 깊이의 점수를 돌려줍니다 (깊이 1도 못 끝냈으면 None).
+        """
+        # 시나리오는 on_game_start 이후에 로드되므로 첫 배치 요청 때 solver를 만듦
+        if self.setup_solver is None:
+            self.setup_solver = SetupSolver.from_model(self.game_model, self.weights, self.setup_depth)
+        solver = self.setup_solver
+        state = solver.state_from_model(self.game_model)
+        completed = None
+        for depth in range(1, self.setup_depth + 1):
+            scores = solver.score_placements(state, depth, stop=lambda: decision.expired)
+            if any(option not in scores for option in options):
+                break
+            completed = scores
+            decision.propose(max(options, key=scores.__getitem__))
+            if decision.expired:
+                break
+        return completed
+
+    def _score_move(self, move: Move) -> float:
+        if move.card_action_type == ActionTypeEnum.DEMONSTRATION and move.target:
+            return self._score_place_base(move.target)
+        return self.evaluator.score(self.party_id)
+
+    def _score_place_base(self, city_id: str) -> float:
+        evaluator = self.evaluator
+        bases = evaluator.bases[city_id]
+        if sum(bases.values()) < evaluator.capacity[city_id]:
+            return evaluator.score_base_change(self.party_id, city_id, {self.party_id: +1})
+        # 도시가 가득 찼으면 상대 기반 하나를 제거하고 배치 (_execute_place_base와 동일)
+        removable = [party for party, count in bases.items() if count > 0 and party != self.party_id]
+        if not removable:
+            return evaluator.score(self.party_id)
+        return max(evaluator.score_base_change(self.party_id, city_id, {self.party_id: +1, party: -1}) for party in removable)
+
+    def _best(self, candidates: List[Any], score, decision: Optional[DecisionContext] = None) -> Any:
+        best_score = None
+        best: List[Any] = []
+        for candidate in candidates:
+            value = score(candidate)
+            if best_score is None or value > best_score:
+                best_score, best = value, [candidate]
+                if decision is not None:
+                    decision.propose(candidate, value)
+            elif value == best_score:
+                best.append(candidate)
+            if decision is not None and decision.expired:
+                break
+        choice = best[0] if len(best) == 1 else self.rng.choice(best)
+        if decision is not None:
+            decision.propose(choice)
+        return choice
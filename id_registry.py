@@ -0,0 +1,111 @@
+# id_registry.py
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from datas import GameKnowledge
+
+
+# 도시가 아닌 특수 위치. 위치 id 0~2로 고정
+AVAILABLE_POOL = 0
+DR_BOX = 1
+DISSOLVED = 2
+SENTINEL_LOCATIONS = ("AVAILABLE_POOL", "DR_BOX", "DISSOLVED")
+
+
+class Interner:
+    """문자열 이름 <-> 0부터 시작하는 연속 정수 id. 한 번 부여된 id는 바뀌지 않습니다."""
+    __slots__ = ("_names", "_ids")
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str) -> int:
+        num = self._ids.get(name)
+        if num is None:
+            num = len(self._names)
+            self._names.append(name)
+            self._ids[name] = num
+        return num
+
+    def id(self, name: str) -> int:
+        return self._ids[name]
+
+    def get(self, name: str, default: Optional[int] = None) -> Optional[int]:
+        return self._ids.get(name, default)
+
+    def name(self, num: int) -> str:
+        return self._names[num]
+
+    @property
+    def names(self) -> List[str]:
+        return self._names
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._ids
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+
+class IdRegistry:
+    """
+    GameKnowledge로부터 도시, 위치, 위협/유닛 템플릿과 인스턴스에 연속 정수 id를 부여합니다.
+    엔진 내부(풀, 위치 비교, 커맨드)는 정수 id를 쓰고, 문자열 이름은 이벤트/UI 같은 API 경계에서만 사용합니다.
+
+    - 위치 id: 0~2는 SENTINEL_LOCATIONS, 그 뒤로 도시가 knowledge.cities 순서대로 이어짐
+    - 같은 템플릿의 인스턴스 id는 연속 구간이라 템플릿별 풀은 range 하나로 표현됨
+    """
+
+    def __init__(self, knowledge: GameKnowledge):
+        self.cities = Interner(knowledge.cities.keys())
+        self.locations = Interner(SENTINEL_LOCATIONS)
+        self.first_city_location = len(self.locations)
+        for city_id in self.cities:
+            self.locations.add(city_id)
+
+        self.threat_templates = Interner(knowledge.threat.keys())
+        self.unit_templates = Interner(knowledge.units.keys())
+
+        self.threat_instances = Interner()
+        self.threat_template_of: List[int] = []
+        self._threat_ranges: List[range] = []
+        for template_num, (template_id, threat_data) in enumerate(knowledge.threat.items()):
+            start = len(self.threat_instances)
+            for i in range(threat_data.max_count):
+                self.threat_instances.add(self.instance_name(template_id, i))
+                self.threat_template_of.append(template_num)
+            self._threat_ranges.append(range(start, len(self.threat_instances)))
+
+        self.unit_instances = Interner()
+        self.unit_template_of: List[int] = []
+        self._unit_ranges: List[range] = []
+        for template_num, (template_id, unit_data) in enumerate(knowledge.units.items()):
+            start = len(self.unit_instances)
+            for i in range(unit_data.max_count):
+                self.unit_instances.add(self.instance_name(template_id, i))
+                self.unit_template_of.append(template_num)
+            self._unit_ranges.append(range(start, len(self.unit_instances)))
+
+    @staticmethod
+    def instance_name(template_id: str, index: int) -> str:
+        """인스턴스의 외부 이름. 예: poverty 템플릿의 첫 인스턴스 -> "poverty_1"."""
+        return f"{template_id}_{index + 1}"
+
+    def threat_range(self, template_num: int) -> range:
+        return self._threat_ranges[template_num]
+
+    def unit_range(self, template_num: int) -> range:
+        return self._unit_ranges[template_num]
+
+    def city_location(self, city_num: int) -> int:
+        return self.first_city_location + city_num
+
+    def location_city(self, location: int) -> Optional[int]:
+        """위치 id가 도시면 도시 id, 아니면 None."""
+        city_num = location - self.first_city_location
+        return city_num if city_num >= 0 else None
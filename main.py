@@ -3,6 +3,7 @@ import asyncio
 from colorama import Fore, Style, init as init_colorama
 import logging
 from ai_player import RandomAIAgent
+from autosave import has_autosave
 from console_agent import ConsoleAgent
 from enums import GamePhase, PartyID
 import game_events
@@ -10,6 +11,8 @@ import log
 from game_manager import GameManager
 
 
+AUTOSAVE_DIR = "saves/autosave"
+
 class GameApp:
     def __init__(self):
         # colorama 및 로거 초기화
@@ -30,15 +33,19 @@ class GameApp:
         self.logger.info(f"Player agents assigned: {agent_types}")
 
         self.installer = GameManager()
-        start_result = self.installer.start_game(self.agents)
+        start_result = self.installer.start_game(self.agents, autosave=AUTOSAVE_DIR)
         if start_result is None:
             self.logger.error("게임을 시작하지 못했습니다.")
             exit(1)
         self.model, self.presenter = start_result
+        self._subscribe_ui()
 
+    def _subscribe_ui(self):
+        # 게임을 새로 시작하거나 이어할 때마다 버스가 바뀌므로 다시 구독
         self.installer.bus.subscribe(game_events.UI_SHOW_MESSAGE, lambda data: self.message_router("UI_SHOW_MESSAGE", data))
         self.installer.bus.subscribe(game_events.UI_SHOW_ERROR, lambda data: self.message_router("UI_SHOW_ERROR", data))
         self.installer.bus.subscribe(game_events.UI_SHOW_STATUS, lambda data: self.message_router("UI_SHOW_STATUS", data))
+        self.installer.bus.subscribe(game_events.STATE_DELTA, lambda data: self.message_router("STATE_DELTA", data))
 
     def message_router(self, event_type, data):
         target_party_id_str = data.get("target_party_id")
@@ -55,33 +62,37 @@ class GameApp:
         while True:
             print("\n=== 시나리오 선택 ===")
             print("1. 기본 시나리오 로드")
+            can_resume = has_autosave(AUTOSAVE_DIR)
+            if can_resume:
+                print("2. 자동 저장된 게임 이어하기")
             user_input = input("시나리오를 선택하세요: ").strip()
             if user_input.lower() == '1':
                 scenario_file = "data/scenarios/main_scenario.json"
                 await self.installer.load_scenario(scenario_file)
                 self.logger.info("기본 시나리오가 로드되었습니다.")
                 break
+            elif user_input == '2' and can_resume:
+                try:
+                    self.model, self.presenter = self.installer.resume_game(self.agents, AUTOSAVE_DIR)
+                except Exception as e:
+                    self.logger.exception(f"Failed to resume autosave: {e}")
+                    print(f"{Fore.RED}[ERROR]{Fore.RESET} 자동 저장을 불러오지 못했습니다: {e}")
+                    continue
+                self._subscribe_ui()
+                self.logger.info("자동 저장된 게임을 불러왔습니다.")
+                break
             else:
                 print(f"{Fore.RED}[ERROR]{Fore.RESET} 유효한 시나리오 번호를 입력하세요.")
 
-        # 초기 설정(기반 배치 등)이 완료될 때까지 대기합니다.
-        self.logger.info("Waiting for initial setup to complete...")
-        while self.model.phase == GamePhase.SETUP:
-            await asyncio.sleep(0.1)
-        self.logger.info("Initial setup complete.")
-
+        # 초기 설정(기반 배치 등)부터 게임이 끝날 때까지 Engine이 요청하는 입력을 Agent에게 물어 진행
         self.logger.info("Entering main game loop...")
-        while self.model.phase != GamePhase.GAME_OVER:
-            try:
-                # 3. GameModel이 현재 상태에 따라 알아서 행동함
-                await self.model.advance_game_state()
-                
-                # 4. 다른 비동기 작업(예: Agent 응답)을 위해 잠시 대기
-                await asyncio.sleep(0.01) 
+        try:
+            await self.presenter.play()
+        except Exception as e:
+            self.logger.exception(f"Error in main loop: {e}")
 
-            except Exception as e:
-                self.logger.exception(f"Error in main loop: {e}")
-                break
+        # 정상적으로 끝난 게임의 자동 저장은 지우고, 오류로 멈췄으면 이어할 수 있도록 남김
+        self.installer.close_autosave(discard=self.model.phase == GamePhase.GAME_OVER)
 
 def main():
     app = GameApp()
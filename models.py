@@ -1,20 +1,39 @@
 
 import logging
 import random
-from typing import Any, Dict, List, Optional, Set
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Set
 import uuid
 
 from datas import GameKnowledge, ThreatData, UnitData
-from enums import GamePhase, PartyID
+from enums import Faction, GamePhase, PartyID
 from datas import CityData
+from deck import CardIndex, Deck, DeckStats, Hand
+from dice_odds import DiceOdds
 from event_bus import EventBus
+from id_registry import AVAILABLE_POOL, DISSOLVED, DR_BOX, IdRegistry, Interner
+from threat_rules import ThreatRule, compile_threat_rules
+from rng import GameRNG
 import game_events
 from scenario_model import ScenarioModel
 from game_action import Move, ActionTypeEnum, PlayOptionEnum
+from commands import (
+    _NO_CHOICE, ClearAgendaChoicesCommand, CommandHistory, DiscardCardCommand, DrawCardCommand, GameCommand,
+    MoveThreatCommand, MoveUnitCommand, PlaceBaseCommand, RemoveBaseCommand, ReshuffleDeckCommand,
+    SetAgendaChoiceCommand, SetFieldCommand, SetPhaseCommand, SetPlayerIndexCommand, SetSeatsCommand, SetTrackerCommand,
+)
+from scoring import ScoringEngine
+from state_delta import (
+    BasePlaced, BaseRemoved, DeltaBatch, SeatsChanged, StateDelta, ThreatMoved, TrackerChanged, TurnChanged, UnitMoved,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# 아젠다 단계에서 제시하는 선택지
+AGENDA_OPTIONS: List[str] = ["Agenda1", "Agenda2", "Agenda3", "Agenda4"]
+
+
 class CityState:
     def __init__(self, city: CityData):
         self.city: CityData = city
@@ -22,21 +41,36 @@ class CityState:
         self.party_bases: dict[PartyID, int] = {party: 0 for party in PartyID}
         self.units_on_city: Set[str] = set()  # List of unit IDs
         self.threats_on_city: Set[str] = set()  # List of threat IDs
+        # units_on_city의 세력별 UnitData.strength 합계. 유닛 이동 시 함께 갱신됨
+        self.faction_strength: dict[Faction, int] = {faction: 0 for faction in Faction}
+        self.total_strength: int = 0
 
 
 class UnitOnBoard:
-    def __init__(self, unit_data: UnitData, id: str):
+    def __init__(self, unit_data: UnitData, id: str, num: int, locations: Interner):
         self.unit_data = unit_data
         self.id: str = id
-        self.current_location: str = "AVAILABLE_POOL"
+        self.num: int = num  # IdRegistry.unit_instances의 정수 id
+        self.location: int = AVAILABLE_POOL  # IdRegistry.locations의 정수 id
         self.is_flipped: bool = False
+        self._locations = locations
+
+    @property
+    def current_location(self) -> str:
+        return self._locations.name(self.location)
 
 
 class ThreatOnBoard:
-    def __init__(self, threat_type: ThreatData, id: str):
+    def __init__(self, threat_type: ThreatData, id: str, num: int, locations: Interner):
         self.threat_data = threat_type
         self.id: str = id
-        self.current_location: str = "AVAILABLE_POOL"
+        self.num: int = num  # IdRegistry.threat_instances의 정수 id
+        self.location: int = AVAILABLE_POOL  # IdRegistry.locations의 정수 id
+        self._locations = locations
+
+    @property
+    def current_location(self) -> str:
+        return self._locations.name(self.location)
 
 
 class PartyState:
@@ -50,15 +84,18 @@ class PartyState:
 
         self.unit_supply: Set[str] = set()  # List of unit IDs
 
-        self.hand_timeline: list[str] = []
-        self.hand_party: list[str] = []
-        self.party_deck: list[str] = []
-        self.party_discard_pile: list[str] = []
+        self.hand_timeline: Hand = Hand()
+        self.hand_party: Hand = Hand()
+        self.party_deck: Deck = Deck()
 
         self.agenda = None
         
         self.controlling_minor_parties: list[str] = []
 
+    @property
+    def party_discard_pile(self) -> list[str]:
+        return self.party_deck.discard_pile
+
 
 class ParliamentState:
     def __init__(self):
@@ -66,28 +103,66 @@ class ParliamentState:
         
 
 class GameModel:
-    def __init__(self, bus: EventBus, knowledge: GameKnowledge):
+    def __init__(self, bus: EventBus, knowledge: GameKnowledge, seed: Optional[int] = None):
         self.bus = bus
         self.knowledge = knowledge
+        # 도시/위치/템플릿/인스턴스의 정수 id. 내부 연산은 정수 id, 이벤트와 UI는 문자열 이름을 사용
+        self.ids = IdRegistry(knowledge)
+        # 위협 상한/상호작용 규칙 (threats.json). 템플릿 id로 바로 조회
+        self.threat_rules: List[ThreatRule] = compile_threat_rules(knowledge, self.ids)
+        self._threat_overflow_handlers = (
+            self._threat_overflow_reject,
+            self._threat_overflow_place_in_dr_box,
+            self._threat_overflow_remove_from_dr_box,
+        )
+        # 같은 seed면 셋업/덱 섞기/주사위/Agent 난수가 모두 같음. 전역 random 모듈은 사용하지 않음
+        self.seed: int = seed if seed is not None else random.randrange(2 ** 63)
+        self.rng = GameRNG(self.seed)
+        # 2d6 도시 선택(city_dice_roll) 확률표. 지식 데이터가 같으면 내용도 같으므로 게임 시작 시 한 번만 계산
+        self.odds = DiceOdds(knowledge)
 
         self.round = 0
+        self.foreign_affairs_track: Optional[str] = None
+        self.economy_track: Optional[int] = None
         self.phase = GamePhase.SETUP
         self.current_turn_order: List[PartyID] = []
+        self.current_player_index: int = 0
+        self.turn: Optional[PartyID] = None
+
+        # 상태 변경마다 1씩 증가. STATE_DELTA 이벤트의 version과 일치
+        self.state_version: int = 0
+
+        # 모든 상태 변경은 GameCommand로 실행되어 여기에 기록됨 (undo/redo, make/unmake)
+        self.history = CommandHistory()
+        self._muted: bool = False
+        self._delta_buffer: Optional[List[StateDelta]] = None  # coalesce_deltas() 중에 모아 둔 delta
 
         self.parliament_state = ParliamentState()
         self.governing_parties: set[PartyID] = set()
         self.chancellor: Optional[PartyID] = None
+        # 의석/연정/VP 집계. 기본 연산(_apply_seats, _apply_base_change)이 직접 갱신하므로 speculate() 중에도 정확함
+        self.scoring = ScoringEngine(knowledge)
         self.party_states: dict[str, PartyState] = {}
         self.cities_state: dict[str, CityState] = {}
+        self._city_by_location: List[Optional[CityState]] = []  # 위치 id -> CityState (도시가 아니면 None)
 
         # --- Object Pools ---
         self.all_threats: Dict[str, ThreatOnBoard] = {}
         self.all_units: Dict[str, UnitOnBoard] = {}
-        self._threat_pool_by_type: Dict[str, List[str]] = {}
-        self._unit_pool_by_type: Dict[str, List[str]] = {}
+        self._threats_by_num: List[ThreatOnBoard] = []
+        # [위치 id][템플릿 id] -> 그 위치의 인스턴스 id 집합. 여러 개 중 하나를 고를 때는 가장 작은 id를 골라
+        # undo/speculate 이력과 무관하게 결과가 같도록 함
+        self._threats_at: List[List[Set[int]]] = [
+            [set() for _ in self.ids.threat_templates] for _ in self.ids.locations
+        ]
+        self._units_by_num: List[UnitOnBoard] = []
         self.dr_box_threats: Set[str] = set()
         self.dissolved_units: Set[str] = set()
 
+        # --- Cards ---
+        self.card_index = CardIndex(knowledge)
+        self.timeline_deck = Deck()
+
         # --- Setup Phase State ---
         self.placement_order: List[PartyID] = []
         self.setup_current_party_index: int = 0
@@ -95,8 +170,7 @@ class GameModel:
         self.scenario_data: Optional[ScenarioModel] = None
 
         # --- Agenda Phase State ---
-        self._pending_agenda_choices = {} # 아젠다 단계에서 선택을 기록
-        self.agenda_choice_player_index = 0
+        self._pending_agenda_choices = {} # 아젠다 단계에서 선택을 기록 (모든 정당이 동시에 선택)
 
 
         # --- Reaction State ---
@@ -113,36 +187,44 @@ class GameModel:
             # Initialize City States
             if self.knowledge.cities:
                 self.cities_state = {city_id: CityState(city_data) for city_id, city_data in self.knowledge.cities.items()}
+            self._city_by_location = [self.cities_state.get(name) for name in self.ids.locations]
 
-            # Initialize Threat Pool
+            # Initialize Threat Pool (인스턴스 이름과 정수 id는 IdRegistry가 부여)
+            ids = self.ids
             if self.knowledge.threat:
                 logger.debug("Initializing threat pool...")
-                for template_id, threat_data in self.knowledge.threat.items():
-                    self._threat_pool_by_type[template_id] = []
-                    for i in range(threat_data.max_count):
-                        instance_id = f"{template_id}_{i+1}"
-                        threat_instance = ThreatOnBoard(id=instance_id, threat_type=threat_data)
-                        self.all_threats[instance_id] = threat_instance
-                        self._threat_pool_by_type[template_id].append(instance_id)
+                for num, instance_id in enumerate(ids.threat_instances):
+                    threat_data = self.knowledge.threat[ids.threat_templates.name(ids.threat_template_of[num])]
+                    threat_instance = ThreatOnBoard(threat_data, instance_id, num, ids.locations)
+                    self.all_threats[instance_id] = threat_instance
+                    self._threats_by_num.append(threat_instance)
+                    self._threats_at[AVAILABLE_POOL][ids.threat_template_of[num]].add(num)
                 logger.info(f"Threat pool initialized with {len(self.all_threats)} instances.")
 
             # Initialize Unit Pool
             if self.knowledge.units:
                 logger.debug("Initializing unit pool...")
-                for template_id, unit_data in self.knowledge.units.items():
-                    self._unit_pool_by_type[template_id] = []
-                    for i in range(unit_data.max_count):
-                        instance_id = f"{template_id}_{i+1}"
-                        unit_instance = UnitOnBoard(id=instance_id, unit_data=unit_data)
-                        self.all_units[instance_id] = unit_instance
-                        self._unit_pool_by_type[template_id].append(instance_id)
+                for num, instance_id in enumerate(ids.unit_instances):
+                    unit_data = self.knowledge.units[ids.unit_templates.name(ids.unit_template_of[num])]
+                    unit_instance = UnitOnBoard(unit_data, instance_id, num, ids.locations)
+                    self.all_units[instance_id] = unit_instance
+                    self._units_by_num.append(unit_instance)
                 logger.info(f"Unit pool initialized with {len(self.all_units)} instances.")
 
+            # Initialize Decks
+            for party_id, party_state in self.party_states.items():
+                party_state.party_deck = Deck(self.card_index.party_card_ids(party_id),
+                                              rng=self.rng.stream(f"shuffle:{party_id.value}"))
+                party_state.party_deck.shuffle()
+            self.timeline_deck = Deck(self.card_index.timeline_card_ids(), rng=self.rng.stream("shuffle:timeline"))
+            self.timeline_deck.shuffle()
+
     def get_current_player(self) -> Optional[PartyID]:
         return self.current_turn_order[self.current_player_index]
 
     def get_status_data(self) -> dict[str, Any]:
         status = {
+            "version": self.state_version,
             "round": self.round,
             "turn": self.current_turn_order[self.current_player_index],
             "parties": self.party_states,
@@ -150,6 +232,224 @@ class GameModel:
         }
         return status
 
+    def _emit_delta(self, delta_cls: type[StateDelta], **fields) -> Optional[StateDelta]:
+        """버전을 올리고 STATE_DELTA 이벤트를 발행합니다. speculate() 중에는 발행하지 않습니다."""
+        if self._muted:
+            return None
+        self.state_version += 1
+        delta = delta_cls(version=self.state_version, **fields)
+        if self._delta_buffer is not None:
+            self._delta_buffer.append(delta)
+        else:
+            self.bus.publish(game_events.STATE_DELTA, {"delta": delta})
+        return delta
+
+    @contextmanager
+    def coalesce_deltas(self):
+        """
+        블록 안에서 생긴 delta를 모아 블록이 끝날 때 DeltaBatch 하나로 발행합니다.
+        version은 평소처럼 하나씩 증가하므로 구독자는 묶음을 펼쳐 순서대로 적용하면 됩니다. 중첩 가능.
+        """
+        if self._delta_buffer is not None:
+            yield self
+            return
+        self._delta_buffer = []
+        try:
+            yield self
+        finally:
+            deltas, self._delta_buffer = self._delta_buffer, None
+            if len(deltas) == 1:
+                self.bus.publish(game_events.STATE_DELTA, {"delta": deltas[0]})
+            elif deltas:
+                self.bus.publish(game_events.STATE_DELTA, {"delta": DeltaBatch(version=deltas[-1].version, deltas=tuple(deltas))})
+
+    # --- Undo / Redo / Make-Unmake ---
+    def _execute(self, command: GameCommand):
+        self.history.execute(command, self)
+
+    def checkpoint(self, tag: Any = None):
+        """
+        플레이어 결정 하나가 시작됨을 기록합니다. undo()는 이 단위로 되돌립니다.
+        tag는 되돌릴 때 HISTORY_UNDONE으로 돌려받습니다 (GameEngine은 그때 기다리던 요청을 넘김).
+        """
+        self.history.checkpoint(tag)
+
+    def undo(self) -> bool:
+        """마지막 결정 단계를 되돌리고 HISTORY_UNDONE을 발행합니다. 되돌릴 단계가 없으면 False."""
+        if not self.history.undo(self):
+            return False
+        self.bus.publish(game_events.HISTORY_UNDONE, {"tag": self.history.undone_tag})
+        return True
+
+    def redo(self) -> bool:
+        """undo()로 되돌린 단계를 다시 적용하고 HISTORY_REDONE을 발행합니다."""
+        tag = self.history.undone_tag
+        if not self.history.redo(self):
+            return False
+        self.bus.publish(game_events.HISTORY_REDONE, {"tag": tag})
+        return True
+
+    @contextmanager
+    def speculate(self):
+        """
+        탐색 AI의 make/unmake용. 블록 안의 변경은 이벤트 없이 적용되고,
+        블록을 벗어나면 변경분만 역순으로 되돌려 원래 상태로 복원됩니다.
+        """
+        mark = self.history.mark()
+        was_muted = self._muted
+        # 블록 안의 변경은 모두 되돌려지므로 자동 저장 journal에도 남기지 않음
+        journal, self.history.journal = self.history.journal, None
+        self._muted = True
+        try:
+            yield self
+        finally:
+            self.history.rollback(self, mark)
+            self._muted = was_muted
+            self.history.journal = journal
+
+    # --- Persistence (autosave) ---
+    def __getstate__(self) -> Dict[str, Any]:
+        # 버스(구독자), 이력, 정적 지식 데이터는 저장하지 않음. 불러온 뒤 attach()로 다시 연결
+        state = self.__dict__.copy()
+        for name in ("bus", "history", "knowledge", "_threat_overflow_handlers", "_delta_buffer"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self.bus = None
+        self.knowledge = None
+        self.history = CommandHistory()
+        self._delta_buffer = None
+        self._threat_overflow_handlers = (
+            self._threat_overflow_reject,
+            self._threat_overflow_place_in_dr_box,
+            self._threat_overflow_remove_from_dr_box,
+        )
+
+    def attach(self, bus: EventBus, knowledge: GameKnowledge):
+        """pickle에서 복원한 모델에 버스와 지식 데이터를 연결합니다. undo 이력은 복원 시점부터 새로 시작."""
+        self.bus = bus
+        self.knowledge = knowledge
+
+    # --- Reversible setters ---
+    def _set_phase(self, phase: GamePhase):
+        if self.phase != phase:
+            self._execute(SetPhaseCommand(self.phase, phase))
+
+    def _set_tracker(self, tracker: str, value: Any):
+        if getattr(self, tracker) == value:
+            return
+        self._execute(SetTrackerCommand(tracker, getattr(self, tracker), value))
+
+    def _set_field(self, field: str, value: Any):
+        if getattr(self, field) != value:
+            self._execute(SetFieldCommand(field, getattr(self, field), value))
+
+    def _set_current_player_index(self, index: int):
+        self._execute(SetPlayerIndexCommand(self.current_player_index, index))
+
+    def _set_seats(self, party_id: PartyID, seats: int):
+        old = self.parliament_state.seats.get(party_id, 0)
+        if old != seats:
+            self._execute(SetSeatsCommand(party_id, old, seats))
+
+    def _set_agenda_choice(self, party_id: PartyID, choice: Any):
+        old = self._pending_agenda_choices.get(party_id, _NO_CHOICE)
+        self._execute(SetAgendaChoiceCommand(party_id, old, choice))
+
+    def _clear_agenda_choices(self):
+        self._execute(ClearAgendaChoicesCommand(dict(self._pending_agenda_choices)))
+
+    # --- Primitive mutations (GameCommand에서만 호출) ---
+    def _apply_tracker(self, tracker: str, value: Any):
+        setattr(self, tracker, value)
+        self._emit_delta(TrackerChanged, tracker=tracker, value=value)
+
+    def _apply_seats(self, party_id: PartyID, seats: int):
+        self.scoring.on_seats_changed(party_id, self.parliament_state.seats.get(party_id, 0), seats)
+        self.parliament_state.seats[party_id] = seats
+        if party_id in self.party_states:
+            self.party_states[party_id].current_seats = seats
+        self._emit_delta(SeatsChanged, party_id=party_id.value, seats=seats)
+
+    def _apply_player_index(self, index: int):
+        self.current_player_index = index
+        self.turn = self.current_turn_order[index] if self.current_turn_order else None
+        self._emit_delta(TurnChanged, party_id=self.turn.value if self.turn else None, player_index=index)
+
+    def _apply_base_change(self, party_id: PartyID, city_id: str, amount: int):
+        bases = self.cities_state[city_id].party_bases
+        bases[party_id] += amount
+        self.scoring.on_bases_changed(party_id, city_id, bases[party_id])
+        delta_cls = BasePlaced if amount > 0 else BaseRemoved
+        self._emit_delta(delta_cls, party_id=party_id.value, city_id=city_id, count=bases[party_id])
+
+    def _apply_threat_location(self, num: int, new_location: int):
+        threat = self._threats_by_num[num]
+        old_location = threat.location
+        instance_id = threat.id
+        template = self.ids.threat_template_of[num]
+        self._threats_at[old_location][template].discard(num)
+        self._threats_at[new_location][template].add(num)
+
+        # 이전 위치에서 제거
+        if old_location == DR_BOX:
+            self.dr_box_threats.discard(instance_id)
+        else:
+            city_state = self._city_by_location[old_location]
+            if city_state is not None:
+                city_state.threats_on_city.discard(instance_id)
+
+        # 위치 정보 갱신
+        threat.location = new_location
+
+        # 새 위치에 추가 (AVAILABLE_POOL은 별도 관리 필요 없음)
+        if new_location == DR_BOX:
+            self.dr_box_threats.add(instance_id)
+        else:
+            city_state = self._city_by_location[new_location]
+            if city_state is not None:
+                city_state.threats_on_city.add(instance_id)
+
+        if not self._muted:
+            locations = self.ids.locations
+            self._emit_delta(ThreatMoved, threat_id=instance_id, template_id=threat.threat_data.id,
+                             from_location=locations.name(old_location), to_location=locations.name(new_location))
+
+    def _apply_unit_location(self, num: int, new_location: int):
+        unit = self._units_by_num[num]
+        old_location = unit.location
+        instance_id = unit.id
+        faction, strength = unit.unit_data.faction, unit.unit_data.strength
+
+        # 이전 위치에서 제거
+        if old_location == DISSOLVED:
+            self.dissolved_units.discard(instance_id)
+        else:
+            city_state = self._city_by_location[old_location]
+            if city_state is not None:
+                city_state.units_on_city.discard(instance_id)
+                city_state.faction_strength[faction] -= strength
+                city_state.total_strength -= strength
+
+        unit.location = new_location
+
+        # 새 위치에 추가
+        if new_location == DISSOLVED:
+            self.dissolved_units.add(instance_id)
+        else:
+            city_state = self._city_by_location[new_location]
+            if city_state is not None:
+                city_state.units_on_city.add(instance_id)
+                city_state.faction_strength[faction] += strength
+                city_state.total_strength += strength
+
+        if not self._muted:
+            locations = self.ids.locations
+            self._emit_delta(UnitMoved, unit_id=instance_id, template_id=unit.unit_data.id,
+                             from_location=locations.name(old_location), to_location=locations.name(new_location))
+
     def setup_game_from_scenario(self, scenario: ScenarioModel):
         """Pydantic ScenarioModel 객체를 기반으로 게임의 초기 상태를 설정합니다."""
         logger.info(f"Setting up game from scenario: {scenario.name}")
@@ -163,15 +463,15 @@ class GameModel:
         # --- 1. 기본 상태 설정 ---
         try:
             trackers = scenario.starting_trackers
-            self.round = trackers.round
-            # self.foreign_affairs_track_position = trackers.foreign_affairs_track
-            # self.economy_track_position = trackers.economy_track
+            self._set_tracker("round", trackers.round)
+            self._set_tracker("foreign_affairs_track", trackers.foreign_affairs_track)
+            self._set_tracker("economy_track", trackers.economy_track)
             logger.debug(f"Trackers set: Round={self.round}, FA={trackers.foreign_affairs_track}, Eco={trackers.economy_track}")
 
             # --- 2. 정부 및 마이너 정당 설정 ---
             gov_info = scenario.starting_government
-            self.governing_parties = gov_info.parties
-            self.chancellor = gov_info.chancellor
+            self._set_field("governing_parties", set(gov_info.parties))
+            self._set_field("chancellor", gov_info.chancellor)
             logger.debug(f"Government set: Chancellor={self.chancellor}, Parties={self.governing_parties}")
 
             minor_parties_control = scenario.starting_minor_parties
@@ -181,22 +481,19 @@ class GameModel:
             logger.debug(f"Minor parties assigned: {minor_parties_control}")
 
 
-            # --- 3. 위협 마커 배치 ---
+            # --- 3. 위협 마커 배치 (한 번에 검증/적용하고 이벤트도 하나로 묶음) ---
             threats_setup = scenario.initial_threats
+            placements: List[tuple[str, str]] = []
 
             # DR Box
-            for threat_id in threats_setup.dr_box:
-                self._place_threat("DR_BOX", threat_id)
+            placements.extend(("DR_BOX", threat_id) for threat_id in threats_setup.dr_box)
 
             # 특정 도시
             for city_id, threat_list in threats_setup.specific_cities.items():
-                if city_id not in self.cities_state:
-                    logger.warning(f"Scenario tries to place threat in unknown city '{city_id}'. Skipping.")
-                    continue
-                for threat_id in threat_list:
-                    self._place_threat(city_id, threat_id)
+                placements.extend((city_id, threat_id) for threat_id in threat_list)
 
             # 랜덤 도시
+            setup_rng = self.rng.stream("setup")
             all_city_ids = list(self.cities_state.keys())
             for task in threats_setup.random_cities:
                 # task는 이제 RandomThreatTask 객체임
@@ -209,15 +506,16 @@ class GameModel:
                      chosen_cities = all_city_ids
                 elif unique:
                      if count <= len(all_city_ids):
-                          chosen_cities = random.sample(all_city_ids, count)
+                          chosen_cities = setup_rng.sample(all_city_ids, count)
                      else: # 요청 수가 도시 수보다 많으면 가능한 모든 도시 선택
                           chosen_cities = all_city_ids
                           logger.warning(f"Requested {count} unique cities for threat {threat_id_to_place}, but only {len(all_city_ids)} exist. Placing in all.")
                 else: # 중복 허용 (룰북 규칙 확인 필요)
-                     chosen_cities = random.choices(all_city_ids, k=count)
+                     chosen_cities = setup_rng.choices(all_city_ids, k=count)
+
+                placements.extend((city_id, threat_id_to_place) for city_id in chosen_cities)
 
-                for city_id in chosen_cities:
-                     self._place_threat(city_id, threat_id_to_place)
+            self.place_threats(placements)
 
             # --- 4. 정당 초기 설정 (의석만 설정) ---
             party_setup = scenario.initial_party_setup # Key가 PartyID Enum임 (Pydantic 덕분)
@@ -227,18 +525,21 @@ class GameModel:
                     logger.warning(f"Scenario contains setup for unknown party '{party_id}'. Skipping.")
                     continue
                 # 의석 설정만 수행
-                self.parliament_state.seats[party_id] = setup_details.parliament_seats
+                self._set_seats(party_id, setup_details.parliament_seats)
 
             # --- 5. 초기 턴 설정 ---
             # 시나리오에 정의되어 있지 않다면 기본값 사용
-            self.current_turn_order = [PartyID.SPD, PartyID.ZENTRUM, PartyID.KPD, PartyID.DNVP]
-            self.current_player_index = 0
+            self._set_field("current_turn_order", [PartyID.SPD, PartyID.ZENTRUM, PartyID.KPD, PartyID.DNVP])
+            self._set_current_player_index(0)
 
             # --- 6. 완료 알림 ---
+            # 구독자가 이후 delta를 적용할 기준이 되는 전체 상태는 여기서 한 번만 발행
             logger.info("Game setup from scenario complete.")
             self.bus.publish(game_events.UI_SHOW_STATUS, self.get_status_data())
 
             # --- 7. 초기 기반 배치 단계 시작 ---
+            # 시나리오 배치는 되돌릴 수 없는 초기 상태로 취급
+            self.history.clear()
             self.scenario_data = scenario
             self.start_initial_setup()
 
@@ -257,15 +558,15 @@ class GameModel:
             return
 
         # 여기서 플레이 순서 정의 (나중에 시나리오에서 읽어올 수도 있음)
-        self.placement_order = [
+        self._set_field("placement_order", [
             PartyID.SPD,
             PartyID.ZENTRUM,
             PartyID.KPD,
             PartyID.DNVP
-        ]
+        ])
 
-        self.setup_current_party_index = 0
-        self.setup_bases_placed_count = 0
+        self._set_field("setup_current_party_index", 0)
+        self._set_field("setup_bases_placed_count", 0)
 
         logger.info("Initial base placement phase started.")
         self._request_next_setup_action() # 첫 액션 요청
@@ -279,7 +580,7 @@ class GameModel:
 
         # 모든 정당의 배치가 끝났는지 확인
         if self.setup_current_party_index >= len(self.placement_order):
-            self.phase = GamePhase.AGENDA_PHASE_START
+            self._set_phase(GamePhase.AGENDA_PHASE_START)
             logger.info("Initial base placement complete.")
             self.bus.publish(game_events.SETUP_PHASE_COMPLETE, {})
             return
@@ -289,16 +590,14 @@ class GameModel:
             bases_to_place = self.scenario_data.initial_party_setup[current_party_id].city_bases
         except (KeyError, AttributeError):
             logger.error(f"Invalid bases_to_place info for party {current_party_id}. Skipping party.")
-            self.setup_current_party_index += 1
-            self.setup_bases_placed_count = 0
+            self._next_setup_party()
             self._request_next_setup_action() # 다음 정당으로 넘어감
             return
 
         # 해당 정당이 모든 기반을 배치했는지 확인
         if self.setup_bases_placed_count >= bases_to_place:
             # 다음 정당으로 이동
-            self.setup_current_party_index += 1
-            self.setup_bases_placed_count = 0
+            self._next_setup_party()
             self._request_next_setup_action() # 다음 액션 요청
             return
 
@@ -306,8 +605,7 @@ class GameModel:
         valid_cities = self.get_valid_base_placement_cities(current_party_id)
         if not valid_cities:
             logger.warning(f"No valid cities for {current_party_id} to place base. Skipping party.")
-            self.setup_current_party_index += 1
-            self.setup_bases_placed_count = 0
+            self._next_setup_party()
             self._request_next_setup_action()
             return
 
@@ -324,6 +622,10 @@ class GameModel:
             }
         })
 
+    def _next_setup_party(self):
+        self._set_field("setup_current_party_index", self.setup_current_party_index + 1)
+        self._set_field("setup_bases_placed_count", 0)
+
     def resolve_initial_base_placement(self, party_id: PartyID, selected_city: str):
         """
         플레이어의 초기 기반 배치 선택을 처리합니다.
@@ -336,7 +638,7 @@ class GameModel:
         if selected_city in valid_cities:
             success = self._place_party_base(party_id, selected_city)
             if success:
-                self.setup_bases_placed_count += 1
+                self._set_field("setup_bases_placed_count", self.setup_bases_placed_count + 1)
                 self.bus.publish(game_events.DATA_PARTY_BASE_PLACED, {
                     "party_id": party_id,
                     "city_id": selected_city,
@@ -358,150 +660,199 @@ class GameModel:
     
     def _find_available_unit(self, unit_template_id: str) -> Optional[str]:
         """주어진 유닛 타입의 사용 가능한 인스턴스 ID를 풀에서 찾아 반환합니다."""
-        if unit_template_id not in self._unit_pool_by_type:
+        template_num = self.ids.unit_templates.get(unit_template_id)
+        if template_num is None:
             return None
-        for instance_id in self._unit_pool_by_type[unit_template_id]:
-            if self.all_units[instance_id].current_location == "AVAILABLE_POOL":
-                return instance_id
+        units = self._units_by_num
+        for num in self.ids.unit_range(template_num):
+            if units[num].location == AVAILABLE_POOL:
+                return units[num].id
         return None
-    
+
+    def _move_unit_instance(self, instance_id: str, new_location: str):
+        """유닛 인스턴스를 이동시키고, 위치 및 세력별 전력 합계를 갱신합니다."""
+        unit = self._get_unit_instance(instance_id)
+        if not unit:
+            return
+        location = self.ids.locations.get(new_location)
+        if location is None:
+            logger.warning(f"Invalid location '{new_location}' for unit '{instance_id}'.")
+            return
+        old_location = unit.location
+        if old_location == location:
+            return
+        self._execute(MoveUnitCommand(unit.num, old_location, location))
+        logger.debug(f"Moved unit '{unit.unit_data.id}' (ID: {instance_id}) to '{new_location}'.")
+
+    def _place_unit(self, location_id: str, unit_template_id: str) -> Optional[str]:
+        """
+        유닛을 풀에서 찾아 도시에 배치합니다.
+        성공 시 배치된 인스턴스 ID를 반환, 실패 시 None 반환.
+        """
+        if unit_template_id not in self.knowledge.units:
+            logger.warning(f"Attempted to place unknown unit '{unit_template_id}'. Skipping.")
+            return None
+        if location_id not in self.cities_state:
+            logger.warning(f"Invalid location_id '{location_id}' for unit placement.")
+            return None
+
+        available_instance_id = self._find_available_unit(unit_template_id)
+        if not available_instance_id:
+            logger.debug(f"Cannot place unit '{unit_template_id}': No available instances in pool.")
+            return None
+        self._move_unit_instance(available_instance_id, location_id)
+        return available_instance_id
+
+    def _remove_unit(self, instance_id: str):
+        """유닛을 보드에서 풀로 되돌립니다."""
+        self._move_unit_instance(instance_id, "AVAILABLE_POOL")
+
+    def _dissolve_unit(self, instance_id: str):
+        """유닛을 해산 상자로 보냅니다."""
+        self._move_unit_instance(instance_id, "DISSOLVED")
+
+    def get_faction_strength(self, city_id: str, faction: Faction) -> int:
+        """도시에 있는 해당 세력 유닛의 전력 합계. O(1)"""
+        return self.cities_state[city_id].faction_strength[faction]
+
+    def get_opposing_strength(self, city_id: str, faction: Faction) -> int:
+        """도시에서 해당 세력을 제외한 모든 유닛의 전력 합계 (FIGHT/COUP/COUNTER_COUP 판정용). O(1)"""
+        city_state = self.cities_state[city_id]
+        return city_state.total_strength - city_state.faction_strength[faction]
 
     def _get_threat_instance(self, instance_id: str) -> Optional[ThreatOnBoard]:
         return self.all_threats.get(instance_id)
 
     def _find_available_threat(self, threat_template_id: str) -> Optional[str]:
         """주어진 위협 타입의 사용 가능한 인스턴스 ID를 풀에서 찾아 반환합니다."""
-        if threat_template_id not in self._threat_pool_by_type:
+        template_num = self.ids.threat_templates.get(threat_template_id)
+        if template_num is None:
             return None
-        for instance_id in self._threat_pool_by_type[threat_template_id]:
-            if self.all_threats[instance_id].current_location == "AVAILABLE_POOL":
-                return instance_id
-        return None
+        available = self._threats_at[AVAILABLE_POOL][template_num]
+        return self._threats_by_num[min(available)].id if available else None
 
     def _move_threat_instance(self, instance_id: str, new_location: str):
         """위협 인스턴스를 이동시키고, 위치 및 관련 리스트를 업데이트합니다."""
         threat = self._get_threat_instance(instance_id)
         if not threat:
             return
-        old_location = threat.current_location
-
-        # 이전 위치에서 제거
-        if old_location == "DR_BOX":
-            self.dr_box_threats.discard(instance_id)
-        elif old_location in self.cities_state:
-            self.cities_state[old_location].threats_on_city.discard(instance_id)
-
-        # 위치 정보 갱신
-        threat.current_location = new_location
-
-        # 새 위치에 추가
-        if new_location == "DR_BOX":
-            self.dr_box_threats.add(instance_id)
-        elif new_location in self.cities_state:
-            self.cities_state[new_location].threats_on_city.add(instance_id)
-        # AVAILABLE_POOL은 별도 관리 필요 없음
-
-        logger.debug(f"Moved threat '{threat.id}' (ID: {instance_id}) from '{old_location}' to '{new_location}'.")
+        location = self.ids.locations.get(new_location)
+        if location is None:
+            logger.warning(f"Invalid location '{new_location}' for threat '{instance_id}'.")
+            return
+        self._execute(MoveThreatCommand(threat.num, threat.location, location))
+        logger.debug(f"Moved threat '{threat.id}' (ID: {instance_id}) to '{new_location}'.")
 
     def _get_threats_in_location(self, location_id: str, threat_template_id: Optional[str] = None) -> List[str]:
         """특정 위치에 있는 위협 인스턴스 ID 목록을 반환합니다. (template ID로 필터링 가능)"""
-        instance_ids = []
-        target_set = set()
-        if location_id == "DR_BOX":
-            target_set = self.dr_box_threats
-        elif location_id in self.cities_state:
-            target_set = self.cities_state[location_id].threats_on_city
-        else:
+        location = self.ids.locations.get(location_id)
+        if location is None or location == AVAILABLE_POOL:
             return []
-
-        for inst_id in target_set:
-            threat = self._get_threat_instance(inst_id)
-            if threat:
-                if threat_template_id is None or threat.threat_data.id == threat_template_id:
-                    instance_ids.append(inst_id)
-        return instance_ids
+        here = self._threats_at[location]
+        if threat_template_id is None:
+            nums = sorted(num for by_template in here for num in by_template)
+        else:
+            template_num = self.ids.threat_templates.get(threat_template_id)
+            nums = sorted(here[template_num]) if template_num is not None else []
+        return [self._threats_by_num[num].id for num in nums]
 
     def _place_threat(self, location_id: str, threat_template_id: str) -> Optional[str]:
         """
-        위협 마커를 풀에서 찾아 지정된 위치에 배치하며, 게임 규칙을 적용합니다.
+        위협 마커를 풀에서 찾아 지정된 위치에 배치하며, threats.json에 선언된 규칙을 적용합니다.
         성공 시 배치된 인스턴스 ID를 반환, 실패 시 None 반환.
         """
-        threat_template = self.knowledge.threat.get(threat_template_id)
-        if not threat_template:
+        template = self.ids.threat_templates.get(threat_template_id)
+        if template is None:
             logger.warning(f"Attempted to place unknown threat '{threat_template_id}'. Skipping.")
             return None
+        location = self.ids.locations.get(location_id)
+        if location is None or (location != DR_BOX and self._city_by_location[location] is None):
+            logger.warning(f"Attempted to place threat in unknown location '{location_id}'. Skipping.")
+            return None
+        return self._place_threat_at(location, template)
 
-        # --- DR Box 배치 ---
-        if location_id == "DR_BOX":
-            max_in_dr = getattr(threat_template, 'max_in_dr_box', float('inf'))
-            current_in_dr = len(self._get_threats_in_location("DR_BOX", threat_template_id))
-            if current_in_dr >= max_in_dr:
-                logger.debug(f"Cannot place '{threat_template_id}' in DR Box: Maximum count ({max_in_dr}) reached.")
-                return None
-
-            available_instance_id = self._find_available_threat(threat_template_id)
-            if available_instance_id:
-                self._move_threat_instance(available_instance_id, "DR_BOX")
-                return available_instance_id
+    def place_threats(self, placements: Iterable[tuple[str, str]]) -> List[Optional[str]]:
+        """
+        (위치, 위협 템플릿) 요청 여러 개를 순서대로 배치합니다. _place_threat와 같은 규칙이 적용됩니다.
+        이름 조회와 검증은 요청 전체에 대해 먼저 한 번 하고, 변경 이벤트는 DeltaBatch 하나로 발행합니다.
+        요청마다 배치된 인스턴스 ID 또는 None을 반환합니다.
+        """
+        locations, templates = self.ids.locations, self.ids.threat_templates
+        resolved: List[Optional[tuple[int, int]]] = []
+        invalid = []
+        for location_id, threat_template_id in placements:
+            location, template = locations.get(location_id), templates.get(threat_template_id)
+            if location is None or template is None or (location != DR_BOX and self._city_by_location[location] is None):
+                invalid.append((location_id, threat_template_id))
+                resolved.append(None)
             else:
-                logger.debug(f"Cannot place threat '{threat_template_id}': No available instances in pool.")
+                resolved.append((location, template))
+        if invalid:
+            logger.warning(f"Skipping {len(invalid)} invalid threat placement(s): {invalid}")
+
+        results: List[Optional[str]] = []
+        with self.coalesce_deltas():
+            for request in resolved:
+                results.append(self._place_threat_at(*request) if request else None)
+        placed = sum(result is not None for result in results)
+        logger.debug(f"Bulk threat placement: {placed}/{len(results)} placed.")
+        return results
+
+    def _place_threat_at(self, location: int, template: int) -> Optional[str]:
+        rule = self.threat_rules[template]
+        here = self._threats_at[location]
+
+        if location == DR_BOX:
+            if len(here[template]) >= rule.max_in_dr_box:
+                logger.debug(f"Cannot place '{self._threat_name(template)}' in DR Box: Maximum count ({rule.max_in_dr_box}) reached.")
                 return None
-            
-        # --- 도시 배치 ---
-        elif location_id in self.cities_state:
-            city_state = self.cities_state[location_id]
-            max_per_city = getattr(threat_template, 'max_per_city', float('inf'))
-            current_in_city = len(self._get_threats_in_location(location_id, threat_template_id))
-            if current_in_city >= max_per_city:
-                if threat_template_id == "poverty":
-                    logger.debug(f"'poverty' already in '{location_id}' at max ({max_per_city}). Attempting DR Box.")
-                    return self._place_threat("DR_BOX", threat_template_id)
-                elif threat_template_id == "prosperity":
-                    logger.debug(f"'prosperity' already in '{location_id}' at max ({max_per_city}). Attempting to remove 'poverty' from DR Box.")
-                    dr_poverty_id = self._get_threats_in_location("DR_BOX", "poverty")
-                    if dr_poverty_id:
-                        self._move_threat_instance(dr_poverty_id[0], "AVAILABLE_POOL")
-                    return None
-                else:
-                    logger.debug(f"Cannot place '{threat_template_id}' in '{location_id}': Max per city ({max_per_city}) reached.")
-                    return None
-
+        else:
+            if len(here[template]) >= rule.max_per_city:
+                return self._threat_overflow_handlers[rule.overflow](location, rule)
             # 상호작용 규칙 적용
-            if threat_template_id == "poverty":
-                prosperity_ids = self._get_threats_in_location(location_id, "prosperity")
-                if prosperity_ids:
-                    self._move_threat_instance(prosperity_ids[0], "AVAILABLE_POOL")
-                    logger.debug(f"Removed 'prosperity' from city '{location_id}' due to 'poverty' placement attempt.")
+            for other in rule.cancels:
+                if here[other]:
+                    self._return_threat_to_pool(min(here[other]))
+                    logger.debug(f"Removed '{self._threat_name(other)}' from '{self.ids.locations.name(location)}' "
+                                 f"instead of placing '{self._threat_name(template)}'.")
                     return None
-            elif threat_template_id == "prosperity":
-                poverty_ids = self._get_threats_in_location(location_id, "poverty")
-                if poverty_ids:
-                    self._move_threat_instance(poverty_ids[0], "AVAILABLE_POOL")
-                    logger.debug(f"Removed 'poverty' from city '{location_id}' due to 'prosperity' placement attempt.")
-                    return None
-            elif threat_template_id == "council":
-                regime_ids = self._get_threats_in_location(location_id, "regime")
-                if regime_ids:
-                    self._move_threat_instance(regime_ids[0], "AVAILABLE_POOL")
-                    logger.debug(f"Removed 'regime' from city '{location_id}' to place 'council'.")
-            elif threat_template_id == "regime":
-                council_ids = self._get_threats_in_location(location_id, "council")
-                if council_ids:
-                    self._move_threat_instance(council_ids[0], "AVAILABLE_POOL")
-                    logger.debug(f"Removed 'council' from city '{location_id}' to place 'regime'.")
-
-            available_instance_id = self._find_available_threat(threat_template_id)
-            if available_instance_id:
-                self._move_threat_instance(available_instance_id, location_id)
-                return available_instance_id
-            else:
-                logger.debug(f"Cannot place threat '{threat_template_id}': No available instances in pool.")
-                return None
-
-        # --- 알 수 없는 위치 ---
-        else:
-            logger.warning(f"Attempted to place threat in unknown location '{location_id}'. Skipping.")
+            for other in rule.replaces:
+                if here[other]:
+                    self._return_threat_to_pool(min(here[other]))
+                    logger.debug(f"Removed '{self._threat_name(other)}' from '{self.ids.locations.name(location)}' "
+                                 f"to place '{self._threat_name(template)}'.")
+
+        available = self._threats_at[AVAILABLE_POOL][template]
+        if not available:
+            logger.debug(f"Cannot place threat '{self._threat_name(template)}': No available instances in pool.")
             return None
+        num = min(available)
+        self._execute(MoveThreatCommand(num, AVAILABLE_POOL, location))
+        return self._threats_by_num[num].id
+
+    def _return_threat_to_pool(self, num: int):
+        self._execute(MoveThreatCommand(num, self._threats_by_num[num].location, AVAILABLE_POOL))
+
+    def _threat_name(self, template: int) -> str:
+        return self.ids.threat_templates.name(template)
+
+    # --- 도시 상한 초과 시 처리 (ThreatRule.overflow 코드로 선택) ---
+    def _threat_overflow_reject(self, location: int, rule: ThreatRule) -> Optional[str]:
+        logger.debug(f"Cannot place '{self._threat_name(rule.template)}' in '{self.ids.locations.name(location)}': "
+                     f"Max per city ({rule.max_per_city}) reached.")
+        return None
+
+    def _threat_overflow_place_in_dr_box(self, location: int, rule: ThreatRule) -> Optional[str]:
+        logger.debug(f"'{self._threat_name(rule.template)}' already at max in '{self.ids.locations.name(location)}'. Attempting DR Box.")
+        return self._place_threat_at(DR_BOX, rule.template)
+
+    def _threat_overflow_remove_from_dr_box(self, location: int, rule: ThreatRule) -> Optional[str]:
+        logger.debug(f"'{self._threat_name(rule.template)}' already at max in '{self.ids.locations.name(location)}'. "
+                     f"Attempting to remove '{self._threat_name(rule.overflow_target)}' from DR Box.")
+        in_dr_box = self._threats_at[DR_BOX][rule.overflow_target]
+        if in_dr_box:
+            self._return_threat_to_pool(min(in_dr_box))
+        return None
 
 
     def _place_party_base(self, party_id: PartyID, city_id: str) -> bool:
@@ -517,7 +868,7 @@ class GameModel:
         if current_bases >= city_capacity:
             logger.debug(f"Cannot place base for '{party_id}' in '{city_id}': City capacity ({city_capacity}) reached.")
             return False
-        self.cities_state[city_id].party_bases[party_id] += 1
+        self._execute(PlaceBaseCommand(party_id, city_id))
         logger.debug(f"Placed base for {party_id} in city '{city_id}'.")
         return True
 
@@ -533,10 +884,48 @@ class GameModel:
         if current_bases <= 0:
             logger.debug(f"No base to remove for '{party_id}' in '{city_id}'.")
             return False
-        self.cities_state[city_id].party_bases[party_id] -= 1
+        self._execute(RemoveBaseCommand(party_id, city_id))
         logger.debug(f"Removed base for {party_id} in city '{city_id}'.")
         return True
     
+    def _deck_and_hand(self, party_id: Optional[PartyID], kind: str) -> tuple[Deck, Optional[Hand]]:
+        """kind: "party"(정당 덱/손패) 또는 "timeline"(공용 타임라인 덱/해당 정당의 타임라인 손패)"""
+        party_state = self.party_states.get(party_id) if party_id else None
+        if kind == "timeline":
+            return self.timeline_deck, party_state.hand_timeline if party_state else None
+        return party_state.party_deck, party_state.hand_party
+
+    def draw_cards(self, party_id: PartyID, count: int = 1, kind: str = "party") -> list[str]:
+        """덱에서 카드를 뽑아 손패에 넣습니다. 덱이 비면 버린 더미를 섞어 이어서 뽑습니다."""
+        drawn = []
+        deck, _ = self._deck_and_hand(party_id, kind)
+        for _ in range(count):
+            if deck.needs_reshuffle():
+                self._execute(ReshuffleDeckCommand(party_id if kind == "party" else None, kind))
+            if not deck.draw_pile:
+                logger.debug(f"No cards left to draw for {party_id} ({kind}).")
+                break
+            card_id = deck.draw_pile[-1]
+            self._execute(DrawCardCommand(party_id, kind, card_id))
+            drawn.append(card_id)
+        return drawn
+
+    def discard_card(self, party_id: PartyID, card_id: str, kind: str = "party") -> bool:
+        _, hand = self._deck_and_hand(party_id, kind)
+        if hand is None or card_id not in hand:
+            logger.warning(f"Card '{card_id}' is not in {party_id}'s {kind} hand.")
+            return False
+        self._execute(DiscardCardCommand(party_id, kind, card_id))
+        return True
+
+    def get_deck_stats(self, party_id: PartyID) -> DeckStats:
+        """정당 덱(뽑을 더미) 구성 통계."""
+        return self.card_index.stats(self.party_states[party_id].party_deck.draw_pile)
+
+    def is_government_viable(self) -> bool:
+        """현재 governing_parties가 의회 과반을 확보하고 있는지."""
+        return self.scoring.is_viable(self.governing_parties)
+
     def get_valid_base_placement_cities(self, party_id: PartyID) -> list[str]:
         """
         해당 정당이 아직 기반을 배치하지 않았고, 도시의 최대 기반 수를 넘지 않은 도시 목록 반환
@@ -621,8 +1010,6 @@ class GameModel:
                 "party_id": player_id,
                 "city_id": city_id
             })
-            
-            self.bus.publish(game_events.UI_SHOW_STATUS, self.get_status_data())
 
         except KeyError as e:
             logger.error(f"_resolve_place_base_choice failed due to missing key: {e}")
@@ -637,38 +1024,48 @@ class GameModel:
             # 아젠다 카드 적용 로직 구현 필요
             # 예: self.party_states[party_id].agenda = selected_agenda
 
-    def _request_next_agenda_choice(self):
-        if self.agenda_choice_player_index < len(self.current_turn_order):
-            party_id = self.current_turn_order[self.agenda_choice_player_index]
-            agenda_options = ["Agenda1", "Agenda2", "Agenda3", "Agenda4"]
-            context = {
-                "action": "agenda_selection",
-                "party": party_id,
-                "prompt": "이번 라운드의 아젠다 카드를 선택하세요."
-            }
-            self.bus.publish(game_events.REQUEST_PLAYER_CHOICE, {
+    def _request_agenda_choices(self):
+        """룰상 아젠다 선택은 동시에 이루어지므로, 모든 정당에게 한 번에 요청합니다."""
+        requests = []
+        for party_id in self.current_turn_order:
+            requests.append({
                 "player_id": party_id,
-                "options": agenda_options,
-                "context": context
+                "options": list(AGENDA_OPTIONS),
+                "context": {
+                    "action": "agenda_selection",
+                    "party": party_id,
+                    "prompt": "이번 라운드의 아젠다 카드를 선택하세요."
+                }
             })
-        else:
+        self.bus.publish(game_events.REQUEST_SIMULTANEOUS_CHOICES, {"requests": requests})
+
+    def _resolve_agenda_choice(self, party_id: PartyID, choice: Any):
+        if self.phase != GamePhase.AGENDA_PHASE_AWAIT_CHOICES or party_id not in self.current_turn_order:
+            logger.warning(f"Received unexpected agenda choice from {party_id}.")
+            return
+        self._set_agenda_choice(party_id, choice)
+
+        if len(self._pending_agenda_choices) == len(self.current_turn_order):
             # 모든 플레이어가 선택 완료
             self._resolve_agenda_choices()
-            self.phase = GamePhase.IMPULSE_PHASE_START
-            self.current_player_index = 0
+            self._set_phase(GamePhase.IMPULSE_PHASE_START)
+            self._set_current_player_index(0)
 
 
-    async def advance_game_state(self):
+    def advance(self):
+        """
+        현재 단계를 한 번 진행합니다. 입력이 필요한 단계(AWAIT_*)에서는 아무것도 하지 않습니다.
+        동기 함수이며, 다음 입력이 필요할 때까지 반복 호출하는 것은 GameEngine.run()이 담당합니다.
+        """
         match self.phase:
             case GamePhase.SETUP:
                 raise Exception("Game Started Not Setuped Properly.")
 
             case GamePhase.AGENDA_PHASE_START:
                 # 1. 아젠다 선택 단계 시작
-                self._pending_agenda_choices = {}
-                self.agenda_choice_player_index = 0
-                self.phase = GamePhase.AGENDA_PHASE_AWAIT_CHOICES
-                self._request_next_agenda_choice()
+                self._clear_agenda_choices()
+                self._set_phase(GamePhase.AGENDA_PHASE_AWAIT_CHOICES)
+                self._request_agenda_choices()
 
             case GamePhase.AGENDA_PHASE_AWAIT_CHOICES:
                 # Agent가 'submit_choice'를 호출할 때까지 대기
@@ -677,10 +1074,17 @@ class GameModel:
             case GamePhase.IMPULSE_PHASE_START:
                 # 1. 이번 턴 플레이어 결정
                 player_id = self.current_turn_order[self.current_player_index]
-                self.turn = player_id # 현재 턴 플레이어 설정
-                
+                if not self.get_valid_moves(player_id):
+                    if not any(self.get_valid_moves(party_id) for party_id in self.current_turn_order):
+                        # 아무 정당도 할 수 있는 행동이 없음. 임펄스 단계를 끝내는 규칙이 아직 없으므로
+                        # 상태를 바꾸지 않고 멈춤 (GameEngine.run이 진행할 수 없는 상태로 처리)
+                        return
+                    logger.info(f"{player_id} has no valid moves. Skipping impulse.")
+                    self._advance_to_next_impulse_turn()
+                    return
+
                 # 2. 상태 변경: 이제 이 플레이어의 'Move'를 기다림
-                self.phase = GamePhase.IMPULSE_PHASE_AWAIT_MOVE
+                self._set_phase(GamePhase.IMPULSE_PHASE_AWAIT_MOVE)
                 
                 # 3. Presenter/Agent에게 'Move'를 요청하라고 알림
                 # 'get_next_move'를 호출하라는 신호!
@@ -696,7 +1100,7 @@ class GameModel:
                 if self._reaction_ask_index == self.current_player_index:
                     logger.debug("Reaction window closed. All players passed.")
                     # 2. 모두 "Pass"함. 스택 실행 단계로 이동
-                    self.phase = GamePhase.REACTION_CHAIN_RESOLVING
+                    self._set_phase(GamePhase.REACTION_CHAIN_RESOLVING)
                     return # 👈 즉시 다음 루프로
 
                 # 3. 현재 물어볼 플레이어
@@ -709,14 +1113,14 @@ class GameModel:
                 
                 if not valid_reactions:
                     # 5. 반응할 수단이 없음. 다음 플레이어로
-                    self._reaction_ask_index = (self._reaction_ask_index + 1) % len(self.current_turn_order)
-                    # (다음 advance_game_state 루프에서 계속)
+                    self._set_field("_reaction_ask_index", (self._reaction_ask_index + 1) % len(self.current_turn_order))
+                    # (다음 advance() 호출에서 계속)
                 else:
                     # 6. 반응할 수단이 있음! "Pass" 옵션 추가
                     valid_reactions.append("PASS")
                     
                     # 7. 응답 대기 상태로 변경
-                    self.phase = GamePhase.REACTION_WINDOW_AWAIT_CHOICE
+                    self._set_phase(GamePhase.REACTION_WINDOW_AWAIT_CHOICE)
                     
                     # 8. Agent에게 'get_choice' 요청
                     self.bus.publish(game_events.REQUEST_PLAYER_CHOICE, {
@@ -739,19 +1143,16 @@ class GameModel:
                 
                 # 1. 스택이 빌 때까지 역순으로 실행
                 while self._reaction_chain:
-                    item_to_resolve = self._reaction_chain.pop() # 맨 위(마지막) 아이템
+                    item_to_resolve = self._reaction_chain[-1] # 맨 위(마지막) 아이템
+                    self._set_field("_reaction_chain", self._reaction_chain[:-1])
                     
-                    if self._is_politician_card(item_to_resolve):
-                        self._resolve_politician_card(item_to_resolve)
-                    
-                    elif self._is_board_reaction(item_to_resolve):
-                        self._resolve_board_reaction(item_to_resolve)
-
-                    elif isinstance(item_to_resolve, Move):
+                    if isinstance(item_to_resolve, Move):
                         self._execute_action(item_to_resolve) # 최종 실행
+                    else:
+                        logger.error(f"Cannot resolve reaction {item_to_resolve}: no reaction rules are defined.")
 
                 # 4. 스택 해결 완료. 다음 턴으로.
-                self._pending_move = None
+                self._set_field("_pending_move", None)
                 self._advance_to_next_impulse_turn()
 
 
@@ -777,7 +1178,7 @@ class GameModel:
 
     def submit_move(self, move: Move):
         """Presenter가 Agent로부터 받은 Move를 실행"""
-        
+
         # 0. 현재 턴 플레이어의 Move가 맞는지 확인
         if move.player_id != self.turn or self.phase != GamePhase.IMPULSE_PHASE_AWAIT_MOVE:
             self.bus.publish(game_events.UI_SHOW_ERROR, {"error": "지금은 당신의 턴이 아닙니다."})
@@ -789,17 +1190,16 @@ class GameModel:
         if move.card_action_type in (ActionTypeEnum.DEMONSTRATION, ActionTypeEnum.COUP, ActionTypeEnum.COUNTER_COUP, ActionTypeEnum.FIGHT):
             
             # 2. Move를 "보류"하고 스택(체인)의 맨 밑에 둠
-            self._pending_move = move
-            self._reaction_chain = [move] # 원본 행동이 스택의 0번
+            self._set_field("_pending_move", move)
+            self._set_field("_reaction_chain", [move]) # 원본 행동이 스택의 0번
             
             # 3. 현재 플레이어의 '다음' 사람부터 물어보기 시작
-            self.phase = GamePhase.REACTION_WINDOW_GATHERING
-            self.current_player_index = self.current_player_index # 턴 플레이어 인덱스
-            self._reaction_ask_index = (self.current_player_index + 1) % len(self.current_turn_order)
+            self._set_phase(GamePhase.REACTION_WINDOW_GATHERING)
+            self._set_field("_reaction_ask_index", (self.current_player_index + 1) % len(self.current_turn_order))
 
             logger.info(f"Action {move} announced. Opening reaction window starting from {self.current_turn_order[self._reaction_ask_index]}.")
             
-            # (advance_game_state가 이어서 처리)
+            # (advance()가 이어서 처리)
         
         else:
             # 4. 리액션 불가능한 행동 (예: Pass, Debate)은 즉시 실행
@@ -830,16 +1230,43 @@ class GameModel:
         else:
             logger.warning(f"Unknown action type: {move.action_type}")
 
+    def _execute_action(self, move: Move):
+        """보류(리액션 창)가 끝났거나 리액션이 불가능한 Move를 실제로 실행합니다."""
+        if move.play_option == PlayOptionEnum.EVENT and move.card_id:
+            # 카드 데이터에 이벤트 효과가 정의되어 있지 않으므로, 이벤트로 낸 카드는 버린 더미로 감
+            logger.info(f"{move.player_id} plays card {move.card_id} as an event.")
+            self.discard_card(move.player_id, move.card_id)
+        elif move.card_action_type == ActionTypeEnum.DEMONSTRATION and move.target:
+            logger.info(f"{move.player_id} demonstrates in {move.target}.")
+            self._execute_place_base(move.player_id, move.target)
+        else:
+            # 규칙이 정의되지 않은 행동 (쿠데타, 토론 등)
+            logger.warning(f"Unsupported move: {move}")
+
+    def _get_valid_reactions_for_player(self, player_id: PartyID, target: Any) -> list:
+        """
+        player_id가 target(스택 맨 위의 항목)에 낼 수 있는 리액션.
+        리액션 수단(정당 보드 리액션, 정치가 카드)은 게임 데이터에 정의되어 있지 않으므로 없음.
+        따라서 리액션 창은 모든 정당이 넘긴 것으로 닫히고, 스택에는 원래 Move만 남습니다.
+        """
+        return []
+
+    def _is_politician_card(self, item: Any) -> bool:
+        return False  # 정치가 카드 데이터 없음 (_get_valid_reactions_for_player 참고)
+
+    def _is_board_reaction(self, item: Any) -> bool:
+        return False  # 정당 보드 리액션 데이터 없음
+
     def _resolve_reaction_choice(self, player_id: PartyID, choice: Any, context: dict):
         if choice == "PASS":
             # 1. "Pass" 선택. 다음 사람에게 물어봄
-            self._reaction_ask_index = (self._reaction_ask_index + 1) % len(self.current_turn_order)
-            self.phase = GamePhase.REACTION_WINDOW_GATHERING
+            self._set_field("_reaction_ask_index", (self._reaction_ask_index + 1) % len(self.current_turn_order))
+            self._set_phase(GamePhase.REACTION_WINDOW_GATHERING)
             
         else:
             # 2. "React" 선택! (예: "DNVP의 Street Fight")
             logger.info(f"{player_id} reacts with {choice}.")
-            self._reaction_chain.append(choice) # 스택(체인)에 추가!
+            self._set_field("_reaction_chain", self._reaction_chain + [choice]) # 스택(체인)에 추가!
             
             # 3. 룰북: "Only 1 reaction is allowed per trigger"
             # (이것은 "Party Board" 리액션에만 해당)
@@ -849,18 +1276,18 @@ class GameModel:
                 # 4a. 보드 리액션임. 다른 사람은 더 이상 '보드 리액션' 불가.
                 # 하지만 "정치가 카드"는 이 리액션에 반응할 수 있음.
                 # 따라서 스택이 쌓였으므로, '다음' 사람부터 다시 물어봄
-                self._reaction_ask_index = (self._reaction_ask_index + 1) % len(self.current_turn_order)
-                self.phase = GamePhase.REACTION_WINDOW_GATHERING # 루프 리셋
+                self._set_field("_reaction_ask_index", (self._reaction_ask_index + 1) % len(self.current_turn_order))
+                self._set_phase(GamePhase.REACTION_WINDOW_GATHERING) # 루프 리셋
 
             elif self._is_politician_card(choice):
                 # 4b. 정치가 카드임. 이 카드에 또 반응할 수 있음.
                 # '다음' 사람부터 다시 물어봄
-                self._reaction_ask_index = (self._reaction_ask_index + 1) % len(self.current_turn_order)
-                self.phase = GamePhase.REACTION_WINDOW_GATHERING # 루프 리셋
+                self._set_field("_reaction_ask_index", (self._reaction_ask_index + 1) % len(self.current_turn_order))
+                self._set_phase(GamePhase.REACTION_WINDOW_GATHERING) # 루프 리셋
 
     def submit_choice(self, player_id: PartyID, choice: Any, context: dict):
         """Presenter가 Agent로부터 받은 Choice를 처리"""
-        
+
         action = context.get("action")
         
 
@@ -868,9 +1295,7 @@ class GameModel:
             self.resolve_initial_base_placement(player_id, choice)
 
         elif action == "agenda_selection":
-            self._pending_agenda_choices[player_id] = choice
-            self.agenda_choice_player_index += 1
-            self._request_next_agenda_choice()
+            self._resolve_agenda_choice(player_id, choice)
 
         elif action == "resolve_place_base":
             self._resolve_place_base_choice(player_id, context["city_id"], PartyID(choice))
@@ -885,5 +1310,12 @@ class GameModel:
             # else:
             
             # 아니면 다음 플레이어로 인덱스 이동
-            self.current_player_index = (self.current_player_index + 1) % len(self.current_turn_order)
-            self.phase = GamePhase.IMPULSE_PHASE_START
\ No newline at end of file
+            self._set_current_player_index((self.current_player_index + 1) % len(self.current_turn_order))
+            self._set_phase(GamePhase.IMPULSE_PHASE_START)
+
+    def get_standings(self) -> List[PartyID]:
+        """VP 순위 (동점이면 의석이 많은 쪽, 그다음 PartyID 순서)."""
+        order = list(PartyID)
+        parties = [party for party in order if party in self.party_states]
+        return sorted(parties, key=lambda party: (-self.party_states[party].current_vp,
+                                                  -self.parliament_state.seats.get(party, 0), order.index(party)))
@@ -0,0 +1,204 @@
+# opening_book.py
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from batch_eval import TRACKERS
+from enums import GamePhase
+from state_encoder import PHASES, StateEncoder
+from trajectory import TrajectoryReader
+
+
+logger = logging.getLogger(__name__)
+
+META_FILE = "meta.json"
+CURRENT_FILE = "CURRENT"  # 지금 쓰는 판(book-*) 디렉터리 이름. os.replace로 교체
+FORMAT_VERSION = 1
+COLUMNS = ("keys", "actions", "visits", "values")
+
+# 오프닝으로 보는 단계: 초기 배치, 첫 라운드의 아젠다/임펄스 결정
+OPENING_PHASES = (
+    GamePhase.SETUP,
+    GamePhase.AGENDA_PHASE_START,
+    GamePhase.AGENDA_PHASE_AWAIT_CHOICES,
+    GamePhase.IMPULSE_PHASE_START,
+    GamePhase.IMPULSE_PHASE_AWAIT_MOVE,
+)
+
+
+def position_key(state: np.ndarray, player: int) -> int:
+    """
+    인코딩된 상태(StateEncoder)와 결정하는 정당(PARTIES 인덱스)의 64비트 키.
+    아젠다처럼 같은 상태에서 여러 정당이 동시에 결정하므로 정당도 키에 포함합니다.
+    프로세스마다 값이 달라지는 hash() 대신 blake2b를 씁니다.
+    """
+    digest = hashlib.blake2b(np.ascontiguousarray(state, dtype=np.float32).tobytes(), digest_size=8,
+                             person=b"opening", salt=bytes([player]))
+    return int.from_bytes(digest.digest(), "little")
+
+
+@dataclass(frozen=True)
+class BookEntry:
+    action: int      # ActionSpace 번호
+    visits: int      # 시뮬레이션에서 이 행동이 선택된 횟수
+    value: float     # 결정한 정당 기준 평균 결과 (자신의 최종 VP - 최강 상대의 최종 VP)
+
+
+class OpeningBook:
+    """
+    build_opening_book()이 만든 표를 np.load(mmap_mode="r")로 엽니다.
+    키로 정렬된 열이라 조회는 이진 탐색 한 번이고, 파일은 읽기 전용으로 매핑되어
+    같은 책을 여는 여러 워커 프로세스가 OS 페이지 캐시를 공유합니다 (프로세스별 복사본 없음).
+    path의 CURRENT가 가리키는 판을 열며, 연 뒤에 책이 다시 만들어져도 이미 연 판을 계속 읽습니다.
+    """
+
+    def __init__(self, path: str, min_visits: int = 1):
+        self.path = path
+        self.min_visits = min_visits
+        version = _read_current(path)
+        if version is None:
+            raise FileNotFoundError(f"No opening book in {path}: {CURRENT_FILE} is missing")
+        directory = os.path.join(path, version)
+        with open(os.path.join(directory, META_FILE), "r", encoding="utf-8") as f:
+            self.meta: Dict[str, Any] = json.load(f)
+        if self.meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported opening book version {self.meta.get('version')} in {directory}")
+        self.state_dim: int = self.meta["state_dim"]
+        self.action_count: int = self.meta["action_count"]
+        columns = {column: np.load(os.path.join(directory, f"{column}.npy"), mmap_mode="r") for column in COLUMNS}
+        self.keys: np.ndarray = columns["keys"]
+        self.actions: np.ndarray = columns["actions"]
+        self.visits: np.ndarray = columns["visits"]
+        self.values: np.ndarray = columns["values"]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def entries(self, key: int) -> List[BookEntry]:
+        key = np.uint64(key)
+        start = int(np.searchsorted(self.keys, key, side="left"))
+        end = int(np.searchsorted(self.keys, key, side="right"))
+        return [BookEntry(int(self.actions[i]), int(self.visits[i]), float(self.values[i])) for i in range(start, end)]
+
+    def best(self, key: int, legal: Optional[Iterable[int]] = None) -> Optional[int]:
+        """
+        가장 평균 결과가 좋은 행동 번호. min_visits 미만이거나 legal에 없는 행동은 제외.
+        책에 없는 국면이면 None.
+        """
+        legal = None if legal is None else set(legal)
+        best: Optional[BookEntry] = None
+        for entry in self.entries(key):
+            if entry.visits < self.min_visits or (legal is not None and entry.action not in legal):
+                continue
+            if best is None or (entry.value, entry.visits) > (best.value, best.visits):
+                best = entry
+        return None if best is None else best.action
+
+    def select(self, state: np.ndarray, player: int, candidates: List[Any],
+               index: Callable[[Any], Optional[int]]) -> Optional[Any]:
+        """후보(Move 또는 선택지) 중 책이 고른 것. index는 후보 -> ActionSpace 번호."""
+        if len(state) != self.state_dim:
+            return None
+        by_action = {}
+        for candidate in candidates:
+            action = index(candidate)
+            if action is not None:
+                by_action.setdefault(action, candidate)
+        action = self.best(position_key(state, player), by_action)
+        return None if action is None else by_action[action]
+
+
+def _read_current(path: str) -> Optional[str]:
+    """path/CURRENT가 가리키는 판(book-*) 디렉터리 이름. 아직 만든 책이 없으면 None."""
+    try:
+        with open(os.path.join(path, CURRENT_FILE), "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def build_opening_book(reader: TrajectoryReader, path: str, encoder: StateEncoder,
+                       max_round: int = 1, batch_size: int = 65536) -> int:
+    """
+    시뮬레이션 궤적(trajectory 샤드)에서 오프닝 국면의 (키, 행동)별 선택 횟수와 평균 결과를 모아
+    키 순으로 정렬한 표를 path 아래 새 판(book-*) 디렉터리에 쓰고, 다 쓴 뒤 CURRENT를 os.replace로 바꿔 가리킵니다.
+    읽는 쪽은 언제나 완성된 판 하나를 보며, 직전 판은 그 판을 막 열던 OpeningBook을 위해 다음 빌드까지 남깁니다.
+    encoder는 궤적을 기록할 때와 같은 StateEncoder여야 합니다. 기록한 (키, 행동) 항목 수를 반환합니다.
+    """
+    if reader.state_dim != encoder.size:
+        raise ValueError(f"Trajectory state_dim {reader.state_dim} does not match encoder size {encoder.size}")
+    opening_phases = [PHASES.index(phase) for phase in OPENING_PHASES]
+    round_index = TRACKERS.index("round")
+
+    keys: List[np.ndarray] = []
+    actions: List[np.ndarray] = []
+    values: List[np.ndarray] = []
+    for batch in reader.batches(batch_size=batch_size, shuffle=False):
+        phase = encoder.view(batch.states, "phase").argmax(axis=1)
+        rounds = encoder.view(batch.states, "trackers")[:, round_index]
+        opening = np.isin(phase, opening_phases) & (rounds <= max_round)
+        rows = np.flatnonzero(opening)
+        if not len(rows):
+            continue
+        outcomes = batch.outcomes[rows]
+        players = batch.players[rows].astype(np.int64)
+        own = outcomes[np.arange(len(rows)), players]
+        others = outcomes.copy()
+        others[np.arange(len(rows)), players] = -np.inf
+        keys.append(np.fromiter((position_key(batch.states[row], int(batch.players[row])) for row in rows),
+                                dtype=np.uint64, count=len(rows)))
+        actions.append(batch.actions[rows])
+        values.append(own - others.max(axis=1))
+
+    if keys:
+        all_keys, all_actions, all_values = np.concatenate(keys), np.concatenate(actions), np.concatenate(values)
+    else:
+        all_keys, all_actions, all_values = np.empty(0, np.uint64), np.empty(0, np.int32), np.empty(0, np.float32)
+
+    # (키, 행동)으로 정렬 후 같은 쌍을 합침
+    order = np.lexsort((all_actions, all_keys))
+    all_keys, all_actions, all_values = all_keys[order], all_actions[order], all_values[order]
+    starts = np.flatnonzero(np.r_[True, (all_keys[1:] != all_keys[:-1]) | (all_actions[1:] != all_actions[:-1])]) \
+        if len(all_keys) else np.empty(0, np.int64)
+    visits = np.diff(np.r_[starts, len(all_keys)]).astype(np.uint32)
+    sums = np.add.reduceat(all_values.astype(np.float64), starts) if len(starts) else np.empty(0)
+    table = {
+        "keys": all_keys[starts],
+        "actions": all_actions[starts].astype(np.int32),
+        "visits": visits,
+        "values": (sums / np.maximum(visits, 1)).astype(np.float32),
+    }
+
+    os.makedirs(path, exist_ok=True)
+    previous = _read_current(path)
+    version = f"book-{uuid.uuid4().hex}"
+    directory = os.path.join(path, version)
+    os.makedirs(directory)
+    for column in COLUMNS:
+        np.save(os.path.join(directory, f"{column}.npy"), table[column])
+    with open(os.path.join(directory, META_FILE), "w", encoding="utf-8") as f:
+        json.dump({
+            "version": FORMAT_VERSION,
+            "state_dim": encoder.size,
+            "action_count": reader.action_count,
+            "max_round": max_round,
+            "positions": int(len(np.unique(table["keys"]))),
+        }, f)
+    pointer = os.path.join(path, f".{CURRENT_FILE}.tmp")
+    with open(pointer, "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(pointer, os.path.join(path, CURRENT_FILE))
+
+    # 지금 판과 직전 판만 남김
+    for name in os.listdir(path):
+        if name.startswith("book-") and name not in (version, previous):
+            shutil.rmtree(os.path.join(path, name), ignore_errors=True)
+    logger.info(f"Opening book written to {path}: {len(starts)} entries from {len(all_keys)} opening decisions.")
+    return len(starts)
@@ -1,6 +1,8 @@
 # player_agent.py
 import abc
+import random
 from typing import Any, List, Dict, Optional
+from decision_context import DecisionContext
 from game_action import Move
 from models import GameModel # GameModel 임포트 가정
 from enums import PartyID
@@ -11,6 +13,15 @@ class IPlayerAgent(abc.ABC):
 
     def __init__(self, party_id: PartyID):
         self.party_id = party_id
+        self.rng = random.Random()
+
+    def on_game_start(self, game_model: GameModel):
+        """
+        게임(GameModel)이 만들어진 직후 한 번 호출됩니다.
+        기본 구현은 게임 seed에서 파생된 이 Agent 전용 난수 스트림을 연결합니다.
+        재정의할 때는 super().on_game_start()를 호출하세요.
+        """
+        self.rng = game_model.rng.stream(f"agent:{self.party_id.value}")
 
     @abc.abstractmethod
     async def get_next_move(self, game_model: GameModel) -> 'Move':
@@ -27,6 +38,22 @@ class IPlayerAgent(abc.ABC):
         """
         pass
 
+    async def decide_move(self, game_model: GameModel, decision: DecisionContext) -> 'Move':
+        """
+        시간 예산이 있는 get_next_move. Presenter는 이 메서드를 호출하고, 마감이 지나면 decision.best를 사용합니다.
+        기본 구현은 get_next_move를 그대로 기다립니다. 중간 답을 낼 수 있는 Agent는 재정의해
+        decision.propose()로 답을 갱신하고 decision.expired를 확인하세요.
+        """
+        move = await self.get_next_move(game_model)
+        decision.propose(move)
+        return move
+
+    async def decide_choice(self, options: List[Any], context: Dict[str, Any], decision: DecisionContext) -> Any:
+        """시간 예산이 있는 get_choice. decide_move와 같은 규칙."""
+        choice = await self.get_choice(options, context)
+        decision.propose(choice)
+        return choice
+
     @abc.abstractmethod
     def receive_message(self, event_type: str, data: Dict[str, Any]):
         """
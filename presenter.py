@@ -2,7 +2,9 @@
 
 import asyncio
 import logging
-from typing import Any, TypedDict
+from typing import Any, Awaitable, Callable, Optional, TypedDict
+from decision_context import DecisionContext
+from engine import MOVE, TAKE_BACK, GameEngine, Request
 from enums import PartyID
 from event_bus import EventBus
 import game_events
@@ -23,18 +25,22 @@ class SetupState(TypedDict):
 from game_action import Move
 
 class GamePresenter:
-    def __init__(self, bus: EventBus, model: GameModel, agents: dict[PartyID, IPlayerAgent]):
+    """
+    GameEngine 위의 asyncio 어댑터. Engine이 돌려준 요청을 Agent에게 (시간 예산 안에서) 묻고 답을 Engine에 넘깁니다.
+    규칙 진행 자체는 Engine이 동기로 처리하므로, 여기서 기다리는 것은 Agent의 결정뿐입니다.
+    """
+
+    def __init__(self, bus: EventBus, model: GameModel, agents: dict[PartyID, IPlayerAgent],
+                 choice_timeouts: Optional[dict[PartyID, float]] = None):
         self.bus = bus
         self.model = model
         self.agents = agents
+        self.engine = GameEngine(model)
+        # Agent별 결정(Move/선택) 하나당 시간 예산(초). 없으면 무제한.
+        # 마감이 지나면 Agent가 DecisionContext에 올린 최선의 답, 그것도 없으면 기본값을 사용
+        self.choice_timeouts: dict[PartyID, float] = choice_timeouts or {}
 
-        
-        self.bus.subscribe(game_events.REQUEST_PLAYER_MOVE, self.handle_request_player_move)
-        # PLAYER_CHOICE_MADE 이벤트 구독
-        self.bus.subscribe(game_events.PLAYER_CHOICE_MADE, self.handle_player_choice_made)
-        # REQUEST_PLAYER_CHOICE 이벤트 구독 (Model -> Presenter)
-        self.bus.subscribe(game_events.REQUEST_PLAYER_CHOICE, self.handle_request_player_choice)
-        # 데이터 변경 및 게임 흐름 이벤트 구독 추가
+        # 데이터 변경 및 게임 흐름 이벤트 구독
         self.bus.subscribe(game_events.DATA_PARTY_BASE_PLACED, self.handle_party_base_placed)
         self.bus.subscribe(game_events.SETUP_PHASE_COMPLETE, self.handle_setup_phase_complete)
 
@@ -42,7 +48,7 @@ class GamePresenter:
     async def handle_load_scenario(self, scenario: ScenarioModel):
         """
         검증된 ScenarioModel 객체를 Model에 전달하여 게임 상태 설정을 위임합니다.
-        Model이 설정 과정에서 필요한 이벤트를 발생시킬 것입니다.
+        설정 중에 생긴 요청(초기 기반 배치)은 Engine이 받아 두고 play()가 처리합니다.
         """
         try:
             logger.debug(f"Handling scenario load request for scenario ID: {scenario.id}")
@@ -53,75 +59,81 @@ class GamePresenter:
             logger.exception(error_message)
             self.bus.publish(game_events.UI_SHOW_ERROR, {"error": error_message})
 
-
-    async def handle_request_player_move(self, data: dict):
-        """GameModel이 Agent에게 get_next_move를 요청함"""
-        player_id = data.get("player_id")
-        agent = self.agents.get(player_id)
-        if not agent:
-            return
-
-        # 1. Agent에게 'get_next_move' 호출 (ConsoleAgent는 명령어 입력 대기)
-        move = await agent.get_next_move(self.model)
-        
-        # 2. Agent가 만든 'Move' 객체를 Model에 제출
-        self.model.submit_move(move)
-
-    def handle_move(self, move: Move):
+    async def play(self, max_steps: Optional[int] = None) -> bool:
         """
-        main.py 등에서 전달받은 Move 객체를 실행합니다.
+        게임이 끝날 때까지 (또는 max_steps번 답하거나 더 진행할 수 없을 때까지) 진행합니다. 게임이 끝났으면 True.
+        동시에 대기 중인 요청(아젠다 선택 등)은 모든 Agent에게 한꺼번에 묻고, 답을 모두 받은 뒤 진행합니다.
+        Agent가 TAKE_BACK을 답하면 그 정당의 직전 결정까지 되돌리고 그때의 요청부터 다시 묻습니다 (같이 받은 다른 답은 버림).
         """
+        engine = self.engine
+        steps = 0
+        request = engine.run()
+        while request is not None:
+            if max_steps is not None and steps >= max_steps:
+                return False
+            pending = engine.pending
+            if len(pending) == 1:
+                answers = [await self._ask(request)]
+            else:
+                # 전체 소요 시간은 가장 느린 Agent 한 명의 시간
+                answers = await asyncio.gather(*(self._ask(item) for item in pending))
+            take_back = next((item for item, answer in zip(pending, answers) if answer == TAKE_BACK), None)
+            if take_back is not None:
+                if not engine.take_back(take_back.player_id):
+                    self.bus.publish(game_events.UI_SHOW_ERROR, {"error": "되돌릴 수 있는 결정이 없습니다."})
+            else:
+                for item, answer in zip(pending, answers):
+                    engine.answer(item, answer)
+            request = engine.run()
+            steps += 1
+            # 다른 작업(원격 Agent 연결, 입력 등)에 양보
+            await asyncio.sleep(0)
+        return engine.finished
+
+    async def _ask(self, request: Request) -> Any:
+        """요청 하나를 해당 Agent에게 묻습니다. Agent가 없거나 오류가 나면 기본 답을 사용."""
+        player_id = request.player_id
+        agent = self.agents.get(player_id)
+        if not agent:
+            logger.error(f"Agent not found for party {player_id}. Using default option '{request.default}'.")
+            return request.default
+
+        if request.kind == MOVE:
+            # ConsoleAgent는 명령어 입력 대기. 마감이 지나면 지금까지의 최선의 수
+            decide = lambda decision: agent.decide_move(self.model, decision)
+        else:
+            decide = lambda decision: agent.decide_choice(request.options, request.context, decision)
         try:
-            result = self.model.execute_move(move)
-            self.bus.publish(game_events.UI_SHOW_MESSAGE, {"message": f"Action executed: {move.action_type}"})
-            # 필요시 result에 따라 추가 이벤트 발행 가능
+            return await self._decide(player_id, decide, request.default)
         except Exception as e:
-            self.bus.publish(game_events.UI_SHOW_ERROR, {"error": f"Move 실행 중 오류: {e}"})
+            logger.exception(f"Error getting decision from agent {player_id}: {e}")
+            self.bus.publish(game_events.UI_SHOW_ERROR, {"error": f"에이전트 선택 중 오류 발생: {e}"})
+            return request.default
 
-    def handle_request_player_choice(self, data: dict):
+    async def _decide(self, player_id: PartyID, decide: Callable[[DecisionContext], Awaitable[Any]], default: Any) -> Any:
         """
-        Model로부터 플레이어의 선택이 필요하다는 요청을 동기적으로 받아,
-        실제 비동기 선택 로직을 백그라운드 작업으로 스케줄링합니다.
+        Agent의 결정을 시간 예산 안에서 받습니다.
+        마감이 지나면 결정을 취소하고 Agent가 올린 최선의 답(decision.best)을, 답이 없으면 default를 사용합니다.
         """
-        async def do_choice():
-            player_id = data.get("player_id")
-            options = data.get("options")
-            context = data.get("context")
-
-            agent = self.agents.get(player_id)
-            if not agent:
-                logger.error(f"Agent not found for party {player_id}. Cannot get choice.")
-                return
-
-            try:
-                # Agent에게 비동기적으로 선택을 요청
-                selected_option = await agent.get_choice(options, context)
-
-                # Agent의 선택을 다른 이벤트로 발행하여 handle_player_choice_made에서 처리
-                self.bus.publish(game_events.PLAYER_CHOICE_MADE, {
-                    "player_id": player_id,
-                    "selected_option": selected_option,
-                    "context": context
-                })
-            except Exception as e:
-                logger.error(f"Error getting choice from agent {player_id}: {e.with_traceback()}")
-                self.bus.publish(game_events.UI_SHOW_ERROR, {"error": f"에이전트 선택 중 오류 발생: {e.with_traceback()}"})
-        
-        # 비동기 작업을 이벤트 루프에서 실행하도록 스케줄링
-        asyncio.create_task(do_choice())
-
-
-    def handle_player_choice_made(self, data: dict):
-        """PLAYER_CHOICE_MADE 이벤트 핸들러. Model에 선택 전달."""
-        context = data.get("context", {})
-        selected_option = data.get("selected_option")
-        player_id = context.get("party")
-
-        if not player_id:
-            logger.error("PLAYER_CHOICE_MADE: context에 party가 없습니다.")
-            return
-
-        self.model.submit_choice(player_id, selected_option, context)
+        decision = DecisionContext.with_budget(self.choice_timeouts.get(player_id))
+        if decision.deadline is None:
+            return await decide(decision)
+
+        task = asyncio.ensure_future(decide(decision))
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), decision.remaining())
+        except asyncio.TimeoutError:
+            decision.cancel()
+            task.cancel()
+            if decision.has_answer:
+                logger.info(f"Agent {player_id} reached its deadline. Using best answer so far: {decision.best}")
+                return decision.best
+            # 중간 답도 없으면 기본값 사용
+            logger.warning(f"Agent {player_id} did not answer within {self.choice_timeouts[player_id]}s. Using default option '{default}'.")
+            self.bus.publish(game_events.UI_SHOW_MESSAGE, {
+                "message": f"[{player_id.value}] 시간 초과로 기본 선택 '{default}'이(가) 적용되었습니다."
+            })
+            return default
 
     def handle_party_base_placed(self, data: dict):
         """기반 배치 결과를 UI에 표시합니다."""
@@ -0,0 +1,148 @@
+# remote_agent.py
+import asyncio
+import itertools
+import logging
+from typing import Any, Dict, List, Optional
+
+from enums import PartyID
+from game_action import Move
+from models import GameModel
+from player_agent import IPlayerAgent
+import remote_protocol as proto
+
+
+logger = logging.getLogger(__name__)
+
+
+class RemotePlayerAgent(IPlayerAgent):
+    """
+    외부 클라이언트(다른 프로세스의 사람/봇)와 TCP 또는 Unix 소켓으로 통신하는 Agent.
+    Agent가 서버 역할을 하며, 클라이언트 하나가 접속하면 그 클라이언트가 이 정당을 조종합니다.
+
+    상태는 UI_SHOW_STATUS 전체를 보내지 않고, 마지막으로 보낸 스냅샷과의 차이(delta)만 전송합니다.
+    """
+
+    def __init__(self, party_id: PartyID):
+        super().__init__(party_id)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connected = asyncio.Event()
+        self._reader_task: Optional[asyncio.Task] = None
+
+        self._request_ids = itertools.count(1)
+        self._pending_replies: Dict[int, asyncio.Future] = {}
+        self._sent_snapshot: Dict[str, Any] = {}
+
+    # --- 연결 관리 ---
+    async def serve_tcp(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """TCP 서버를 열고 실제로 바인딩된 포트를 반환합니다."""
+        self._server = await asyncio.start_server(self._on_client, host, port)
+        bound_port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Remote agent for {self.party_id} listening on {host}:{bound_port}")
+        return bound_port
+
+    async def serve_unix(self, path: str):
+        self._server = await asyncio.start_unix_server(self._on_client, path)
+        logger.info(f"Remote agent for {self.party_id} listening on unix socket {path}")
+
+    async def wait_connected(self, timeout: Optional[float] = None):
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    async def close(self):
+        if self._reader_task:
+            self._reader_task.cancel()
+        if self._writer:
+            self._writer.close()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _on_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        if self._writer is not None:
+            logger.warning(f"Remote agent for {self.party_id} already has a client. Rejecting new connection.")
+            writer.close()
+            return
+        self._reader, self._writer = reader, writer
+        # 새 클라이언트는 빈 뷰에서 시작하므로 다음 상태는 전체가 delta로 전송됨
+        self._sent_snapshot = {}
+        self._send({"t": proto.MSG_HELLO, "party": self.party_id.value})
+        self._connected.set()
+        self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self):
+        try:
+            while True:
+                message = await proto.read_frame(self._reader)
+                if message is None:
+                    break
+                if message["t"] != proto.MSG_REPLY:
+                    logger.warning(f"Unexpected message from remote client of {self.party_id}: {message}")
+                    continue
+                future = self._pending_replies.pop(message.get("id"), None)
+                if future and not future.done():
+                    future.set_result(message)
+        except (proto.ProtocolError, ConnectionError) as e:
+            logger.error(f"Remote client of {self.party_id} disconnected: {e}")
+        finally:
+            for future in self._pending_replies.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"Remote client of {self.party_id} disconnected."))
+            self._pending_replies.clear()
+            self._writer = None
+            self._connected.clear()
+
+    def _send(self, message: Dict[str, Any]):
+        if self._writer is None:
+            return
+        self._writer.write(proto.encode_frame(message))
+
+    async def _request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        await self._connected.wait()
+        request_id = next(self._request_ids)
+        message["id"] = request_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending_replies[request_id] = future
+        self._send(message)
+        await self._writer.drain()
+        return await future
+
+    # --- IPlayerAgent ---
+    async def get_next_move(self, game_model: GameModel) -> 'Move':
+        valid_moves = game_model.get_valid_moves(self.party_id)
+        if not valid_moves:
+            raise RuntimeError(f"No valid moves for remote player {self.party_id}")
+        reply = await self._request({
+            "t": proto.MSG_MOVE,
+            "moves": [move.model_dump(mode="json", exclude_none=True) for move in valid_moves],
+        })
+        return valid_moves[self._reply_index(reply, len(valid_moves))]
+
+    async def get_choice(self, options: List[Any], context: Dict[str, Any]) -> Any:
+        options = list(options)
+        reply = await self._request({
+            "t": proto.MSG_CHOICE,
+            "options": [str(getattr(opt, "value", opt)) for opt in options],
+            "context": context,
+        })
+        return options[self._reply_index(reply, len(options))]
+
+    def receive_message(self, event_type: str, data: Dict[str, Any]):
+        if event_type == "UI_SHOW_STATUS":
+            snapshot = proto.snapshot_status(data)
+            changed, removed = proto.diff_snapshot(self._sent_snapshot, snapshot)
+            if changed or removed:
+                self._send({"t": proto.MSG_DELTA, "set": changed, "del": removed})
+            self._sent_snapshot = snapshot
+        elif event_type == "STATE_DELTA":
+            self._send({"t": proto.MSG_EVENT, "d": data["delta"].to_dict()})
+        elif event_type in ("UI_SHOW_MESSAGE", "UI_SHOW_ERROR"):
+            text = data.get("message") or data.get("error")
+            if text:
+                self._send({"t": proto.MSG_TEXT, "kind": event_type, "text": text})
+
+    def _reply_index(self, reply: Dict[str, Any], option_count: int) -> int:
+        index = reply.get("i")
+        if not isinstance(index, int) or not 0 <= index < option_count:
+            raise proto.ProtocolError(f"Remote client of {self.party_id} replied with invalid index {index!r} (options: {option_count}).")
+        return index
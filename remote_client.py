@@ -0,0 +1,76 @@
+# remote_client.py
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+import remote_protocol as proto
+from state_delta import BoardView, delta_from_dict
+
+
+logger = logging.getLogger(__name__)
+
+
+# (요청 메시지 타입, 옵션 목록, context) -> 선택한 인덱스
+ReplyPolicy = Callable[[str, List[Any], Dict[str, Any]], int]
+
+
+def first_option_policy(kind: str, options: List[Any], context: Dict[str, Any]) -> int:
+    return 0
+
+
+class LocalRemoteClient:
+    """
+    RemotePlayerAgent에 접속하는 로컬 대역 클라이언트. (테스트/봇 연동 확인용)
+    수신한 delta로 자신의 평탄한 상태 뷰(view)를 갱신하고, 요청에는 policy가 고른 인덱스로 응답합니다.
+    """
+
+    def __init__(self, policy: ReplyPolicy = first_option_policy):
+        self.policy = policy
+        self.party: Optional[str] = None
+        self.view: Dict[str, Any] = {}
+        self.board = BoardView()
+        self.texts: List[str] = []
+        self.requests: List[Dict[str, Any]] = []
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect_tcp(self, host: str, port: int):
+        self._reader, self._writer = await asyncio.open_connection(host, port)
+
+    async def connect_unix(self, path: str):
+        self._reader, self._writer = await asyncio.open_unix_connection(path)
+
+    async def run(self):
+        """연결이 끊길 때까지 메시지를 처리합니다."""
+        try:
+            while True:
+                message = await proto.read_frame(self._reader)
+                if message is None:
+                    break
+                await self._handle(message)
+        finally:
+            self.close()
+
+    def close(self):
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+
+    async def _handle(self, message: Dict[str, Any]):
+        kind = message["t"]
+        if kind == proto.MSG_HELLO:
+            self.party = message.get("party")
+        elif kind == proto.MSG_DELTA:
+            proto.apply_snapshot_diff(self.view, message.get("set", {}), message.get("del", []))
+        elif kind == proto.MSG_EVENT:
+            self.board.apply(delta_from_dict(message["d"]))
+        elif kind == proto.MSG_TEXT:
+            self.texts.append(message.get("text", ""))
+        elif kind in (proto.MSG_MOVE, proto.MSG_CHOICE):
+            self.requests.append(message)
+            options = message.get("moves") if kind == proto.MSG_MOVE else message.get("options")
+            index = self.policy(kind, options or [], message.get("context", {}))
+            self._writer.write(proto.encode_frame({"t": proto.MSG_REPLY, "id": message["id"], "i": index}))
+            await self._writer.drain()
+        else:
+            logger.warning(f"Unknown message type from remote agent: {kind}")
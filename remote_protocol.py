@@ -0,0 +1,95 @@
+# remote_protocol.py
+import asyncio
+import json
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# --- 프레임 형식 ---
+# [4바이트 big-endian 길이][compact JSON 본문]
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 1 << 20
+
+_MISSING = object()
+
+# --- 메시지 타입 (키 't') ---
+MSG_HELLO = "hello"       # Agent -> Client: 연결 직후 담당 정당 알림
+MSG_MOVE = "move"         # Agent -> Client: 가능한 Move 목록 중 하나를 요청
+MSG_CHOICE = "choice"     # Agent -> Client: 옵션 중 하나를 요청
+MSG_DELTA = "delta"       # Agent -> Client: 마지막으로 보낸 상태 대비 변경분
+MSG_EVENT = "event"       # Agent -> Client: 타입이 있는 StateDelta 한 건 (state_delta.py)
+MSG_TEXT = "text"         # Agent -> Client: UI 메시지/오류
+MSG_REPLY = "reply"       # Client -> Agent: 요청에 대한 응답 (옵션 인덱스)
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def encode_frame(message: Dict[str, Any]) -> bytes:
+    body = json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+    if len(body) > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {len(body)} bytes")
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    """프레임 하나를 읽어 반환합니다. 연결이 정상적으로 닫혔으면 None."""
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise ProtocolError("Connection closed in the middle of a frame header.")
+    (length,) = FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {length} bytes")
+    body = await reader.readexactly(length)
+    message = json.loads(body.decode("utf-8"))
+    if not isinstance(message, dict) or "t" not in message:
+        raise ProtocolError(f"Malformed message: {message!r}")
+    return message
+
+
+def snapshot_status(status: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    UI_SHOW_STATUS 데이터(라이브 객체 포함)를 'a.b.c' 경로 -> 값 형태의 평탄한 dict로 변환합니다.
+    값은 모두 JSON으로 직렬화 가능한 기본 타입입니다.
+    """
+    turn = status.get("turn")
+    flat: Dict[str, Any] = {
+        "round": status.get("round"),
+        "turn": getattr(turn, "value", turn),
+    }
+    for party_id, party in status.get("parties", {}).items():
+        key = f"party.{getattr(party_id, 'value', party_id)}"
+        flat[f"{key}.vp"] = party.current_vp
+        flat[f"{key}.seats"] = party.current_seats
+        flat[f"{key}.hand_party"] = len(party.hand_party)
+        flat[f"{key}.hand_timeline"] = len(party.hand_timeline)
+        flat[f"{key}.supply"] = sorted(party.unit_supply)
+    for city_id, city in status.get("cities", {}).items():
+        key = f"city.{city_id}"
+        for party_id, count in city.party_bases.items():
+            if count:
+                flat[f"{key}.bases.{getattr(party_id, 'value', party_id)}"] = count
+        if city.units_on_city:
+            flat[f"{key}.units"] = sorted(city.units_on_city)
+        if city.threats_on_city:
+            flat[f"{key}.threats"] = sorted(city.threats_on_city)
+    return flat
+
+
+def diff_snapshot(old: Dict[str, Any], new: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """두 스냅샷의 차이를 (변경/추가된 항목, 삭제된 키 목록)으로 반환합니다."""
+    changed = {key: value for key, value in new.items() if old.get(key, _MISSING) != value}
+    removed = [key for key in old if key not in new]
+    return changed, removed
+
+
+def apply_snapshot_diff(view: Dict[str, Any], changed: Dict[str, Any], removed: List[str]):
+    """diff_snapshot 결과를 평탄한 상태 뷰에 적용합니다."""
+    view.update(changed)
+    for key in removed:
+        view.pop(key, None)
+
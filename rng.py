@@ -0,0 +1,136 @@
+# rng.py
+import hashlib
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def derive_seed(seed: int, name: str) -> int:
+    """부모 seed와 이름으로 독립적인 64비트 seed를 만듭니다. 실행/프로세스가 달라도 항상 같은 값."""
+    digest = hashlib.blake2b(f"{seed}/{name}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class TrackedRandom(random.Random):
+    """
+    사용 여부(dirty)를 기록하는 random.Random. 자동 저장이 마지막 저장 이후 실제로 쓰인 스트림의 상태만 기록하도록 합니다.
+    random()과 getrandbits()를 모두 재정의하므로 choice/shuffle/choices 등의 결과는 random.Random과 같습니다.
+    """
+    dirty = False
+
+    def random(self) -> float:
+        self.dirty = True
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.dirty = True
+        return super().getrandbits(k)
+
+    def setstate(self, state):
+        # 되돌리기 등으로 상태가 바뀐 것도 자동 저장 대상
+        self.dirty = True
+        super().setstate(state)
+
+
+class DiceRoller:
+    """
+    주사위 굴림을 미리 대량으로 생성해 두고 하나씩 꺼내 쓰는 버퍼.
+    rollout처럼 굴림이 매우 잦은 곳에서 호출당 오버헤드를 줄입니다.
+    """
+
+    def __init__(self, rng: random.Random, sides: int = 6, buffer_size: int = 1024):
+        self.rng = rng
+        self.sides = sides
+        self.buffer_size = buffer_size
+        self._faces = range(1, sides + 1)
+        self._buffer: List[int] = []
+        self._index = 0
+
+    def _refill(self):
+        self._buffer = self.rng.choices(self._faces, k=self.buffer_size)
+        self._index = 0
+
+    def roll(self) -> int:
+        if self._index >= len(self._buffer):
+            self._refill()
+        value = self._buffer[self._index]
+        self._index += 1
+        return value
+
+    def roll_many(self, count: int) -> List[int]:
+        rolls = []
+        while len(rolls) < count:
+            if self._index >= len(self._buffer):
+                self._refill()
+            take = min(count - len(rolls), len(self._buffer) - self._index)
+            rolls.extend(self._buffer[self._index:self._index + take])
+            self._index += take
+        return rolls
+
+    def roll_sum(self, count: int) -> int:
+        return sum(self.roll_many(count))
+
+
+class GameRNG:
+    """
+    게임 하나의 난수 서비스. 하나의 게임 seed에서 이름 붙은 스트림(setup, dice, shuffle:..., agent:...)을 파생합니다.
+    스트림끼리는 서로의 사용량에 영향을 받지 않으므로, 한 곳의 난수 소비가 바뀌어도 다른 곳의 결과는 그대로입니다.
+    """
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self._streams: Dict[str, random.Random] = {}
+        self._dice: Dict[str, DiceRoller] = {}
+        self._dice_marks: Dict[str, int] = {}  # take_changes() 시점의 주사위 버퍼 위치
+
+    def stream(self, name: str) -> random.Random:
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = TrackedRandom(derive_seed(self.seed, name))
+            self._streams[name] = stream
+        return stream
+
+    def split(self, name: str) -> "GameRNG":
+        """하위 서비스(예: 시뮬레이션 안의 게임 하나)를 위한 독립 GameRNG."""
+        return GameRNG(derive_seed(self.seed, name))
+
+    def dice(self, name: str = "dice", sides: int = 6) -> DiceRoller:
+        """
+        이름 붙은 주사위 (같은 이름의 스트림을 사용). 이름 하나에는 주사위 하나만 있으므로,
+        이미 만든 주사위를 다른 면 수로 요청하면 ValueError.
+        """
+        roller = self._dice.get(name)
+        if roller is None:
+            roller = DiceRoller(self.stream(name), sides=sides)
+            self._dice[name] = roller
+        elif roller.sides != sides:
+            raise ValueError(f"Dice '{name}' is a d{roller.sides}, not a d{sides}. Use a different name for d{sides} rolls.")
+        return roller
+
+    def take_changes(self) -> Dict[str, Dict[str, Any]]:
+        """
+        마지막 take_changes() 이후 바뀐 난수 상태 (자동 저장 로그용). 쓰인 스트림은 전체 상태를,
+        주사위는 버퍼 위치만 (버퍼를 다시 채웠으면 버퍼까지) 담습니다.
+        """
+        streams = {}
+        for name, stream in self._streams.items():
+            if stream.dirty:
+                streams[name] = stream.getstate()
+                stream.dirty = False
+        dice: Dict[str, Tuple[Optional[List[int]], int]] = {}
+        for name, roller in self._dice.items():
+            refilled = name in streams
+            if refilled or self._dice_marks.get(name) != roller._index:
+                dice[name] = (list(roller._buffer) if refilled else None, roller._index)
+                self._dice_marks[name] = roller._index
+        return {"streams": streams, "dice": dice}
+
+    def apply_changes(self, changes: Dict[str, Dict[str, Any]]):
+        """take_changes()가 돌려준 변경을 적용합니다."""
+        for name, state in changes["streams"].items():
+            self.stream(name).setstate(state)
+        for name, (buffer, index) in changes["dice"].items():
+            roller = self._dice.get(name) or self.dice(name)
+            if buffer is not None:
+                roller._buffer = list(buffer)
+            roller._index = index
+            self._dice_marks[name] = index
@@ -0,0 +1,152 @@
+# scoring.py
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from datas import GameKnowledge
+from enums import PartyID
+
+
+logger = logging.getLogger(__name__)
+
+PARTIES: List[PartyID] = list(PartyID)
+_BIT: Dict[PartyID, int] = {party: 1 << i for i, party in enumerate(PARTIES)}
+ALL_MASKS = range(1 << len(PARTIES))
+
+
+def coalition_mask(parties: Iterable[PartyID]) -> int:
+    mask = 0
+    for party in parties:
+        mask |= _BIT[party]
+    return mask
+
+
+def mask_parties(mask: int) -> frozenset:
+    return frozenset(party for party in PARTIES if mask & _BIT[party])
+
+
+def largest_remainder(votes: Dict[PartyID, int], total_seats: int) -> Dict[PartyID, int]:
+    """
+    득표(여기서는 보드 위 기반 수)에 비례해 total_seats석을 나눕니다 (Hare 최대잔여법).
+    잔여가 같으면 득표가 많은 정당, 그다음 PartyID 순서가 우선.
+    """
+    seats = {party: 0 for party in votes}
+    total_votes = sum(votes.values())
+    if total_votes <= 0 or total_seats <= 0:
+        return seats
+    remainders = []
+    for order, (party, count) in enumerate(votes.items()):
+        quota, remainder = divmod(count * total_seats, total_votes)
+        seats[party] = quota
+        remainders.append((-remainder, -count, order, party))
+    leftover = total_seats - sum(seats.values())
+    for _, _, _, party in sorted(remainders)[:leftover]:
+        seats[party] += 1
+    return seats
+
+
+class ScoringEngine:
+    """
+    의석/연정 집계를 GameModel의 기본 연산(_apply_seats, _apply_base_change)에 맞춰 증분으로 유지합니다.
+    - 16가지 정당 조합(연정)별 의석 합계를 미리 들고 있어 연정 과반 여부 조회가 O(1)
+    - 정당별 총 기반 수와 도시 지배 수를 유지해 선거 의석 예측 등에 전체 보드를 훑지 않음
+    speculate() 중에도 기본 연산을 통해 갱신되므로 탐색 중 조회해도 항상 현재 상태와 일치합니다.
+    """
+
+    def __init__(self, knowledge: GameKnowledge):
+        self.seats: Dict[PartyID, int] = {party: 0 for party in PARTIES}
+        self.total_seats: int = 0
+        self.coalition_seats: List[int] = [0] * len(ALL_MASKS)
+
+        self.city_bases: Dict[str, Dict[PartyID, int]] = {city_id: {party: 0 for party in PARTIES} for city_id in knowledge.cities}
+        self.base_totals: Dict[PartyID, int] = {party: 0 for party in PARTIES}
+        self.city_controller: Dict[str, Optional[PartyID]] = {city_id: None for city_id in knowledge.cities}
+        self.controlled_cities: Dict[PartyID, int] = {party: 0 for party in PARTIES}
+
+        self._viable_cache: Optional[List[frozenset]] = None
+
+    def sync(self, model):
+        """모델 전체에서 다시 계산합니다."""
+        self.seats = {party: 0 for party in PARTIES}
+        self.total_seats = 0
+        self.coalition_seats = [0] * len(ALL_MASKS)
+        for party, seats in model.parliament_state.seats.items():
+            self.on_seats_changed(party, 0, seats)
+        self.base_totals = {party: 0 for party in PARTIES}
+        self.controlled_cities = {party: 0 for party in PARTIES}
+        for city_id, city_state in model.cities_state.items():
+            self.city_bases[city_id] = {party: city_state.party_bases.get(party, 0) for party in PARTIES}
+            self.city_controller[city_id] = None
+            for party, count in self.city_bases[city_id].items():
+                self.base_totals[party] += count
+            self._refresh_controller(city_id)
+
+    # --- 증분 갱신 (GameModel 기본 연산에서 호출) ---
+    def on_seats_changed(self, party: PartyID, old: int, new: int):
+        change = new - old
+        if not change:
+            return
+        self.seats[party] = new
+        self.total_seats += change
+        bit = _BIT[party]
+        coalition_seats = self.coalition_seats
+        for mask in ALL_MASKS:
+            if mask & bit:
+                coalition_seats[mask] += change
+        self._viable_cache = None
+
+    def on_bases_changed(self, party: PartyID, city_id: str, count: int):
+        bases = self.city_bases[city_id]
+        self.base_totals[party] += count - bases[party]
+        bases[party] = count
+        self._refresh_controller(city_id)
+
+    def _refresh_controller(self, city_id: str):
+        bases = self.city_bases[city_id]
+        ranked = sorted(bases.values(), reverse=True)
+        top = ranked[0] if ranked else 0
+        controller = None
+        if top > 0 and (len(ranked) < 2 or ranked[1] < top):
+            controller = next(party for party, count in bases.items() if count == top)
+        old = self.city_controller[city_id]
+        if old != controller:
+            if old is not None:
+                self.controlled_cities[old] -= 1
+            if controller is not None:
+                self.controlled_cities[controller] += 1
+            self.city_controller[city_id] = controller
+
+    # --- 의회 ---
+    @property
+    def majority(self) -> int:
+        """과반에 필요한 의석 수."""
+        return self.total_seats // 2 + 1
+
+    def coalition_seat_count(self, parties: Iterable[PartyID]) -> int:
+        return self.coalition_seats[coalition_mask(parties)]
+
+    def is_viable(self, parties: Iterable[PartyID]) -> bool:
+        """연정이 과반 의석을 확보하는지."""
+        return self.coalition_seats[coalition_mask(parties)] >= self.majority
+
+    def majority_party(self) -> Optional[PartyID]:
+        """단독 과반 정당 (없으면 None)."""
+        majority = self.majority
+        return next((party for party, seats in self.seats.items() if seats >= majority), None)
+
+    def viable_coalitions(self) -> List[frozenset]:
+        """
+        과반을 확보하는 최소 연정 목록 (어느 정당을 빼도 과반이 깨지는 조합). 정당 수가 적은 순.
+        의석이 바뀔 때까지 캐시됩니다.
+        """
+        if self._viable_cache is None:
+            majority = self.majority
+            viable = [mask for mask in ALL_MASKS if mask and self.coalition_seats[mask] >= majority]
+            minimal = [mask for mask in viable
+                       if all(self.coalition_seats[mask & ~_BIT[p]] < majority for p in mask_parties(mask))]
+            minimal.sort(key=lambda mask: (bin(mask).count("1"), -self.coalition_seats[mask]))
+            self._viable_cache = [mask_parties(mask) for mask in minimal]
+        return self._viable_cache
+
+    def project_election(self, total_seats: Optional[int] = None) -> Dict[PartyID, int]:
+        """현재 보드의 정당별 기반 수에 비례한 선거 의석 예측. 기본 의석 총수는 현재 의회 크기."""
+        return largest_remainder(self.base_totals, self.total_seats if total_seats is None else total_seats)
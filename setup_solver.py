@@ -0,0 +1,184 @@
+# setup_solver.py
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from board_eval import PARTIES, EvalWeights, city_contribution
+from datas import GameKnowledge
+from enums import PartyID
+
+
+logger = logging.getLogger(__name__)
+
+Values = Tuple[float, ...]  # PARTIES 순서의 정당별 절대 점수
+
+
+@dataclass
+class SetupState:
+    """초기 기반 배치 단계의 상태. GameModel의 setup_* 필드와 같은 의미."""
+    counts: List[List[int]]          # [도시][정당] 기반 수 (도시 순서는 SetupSolver.city_ids)
+    threat_counts: List[int]         # [도시] 위협 마커 수
+    seats: List[int]                 # [정당] 의석 수
+    party_index: int                 # placement_order에서 현재 배치 중인 정당
+    placed: int                      # 현재 정당이 이미 배치한 기반 수
+
+
+class SetupSolver:
+    """
+    초기 기반 배치(_request_next_setup_action / resolve_initial_base_placement)를 위한 max-n 탐색기.
+    각 정당은 자신의 평가 점수(자신 - 최강 상대, IncrementalEvaluator.score와 같은 식)를 최대화한다고 가정합니다.
+
+    - 기반 1개 배치를 한 수로 보고 depth 수까지 탐색, 그 아래는 평가 함수로 잘라냄
+      (남은 배치 수가 depth 이하이면 정확한 해)
+    - 같은 정당이 배치 순서만 다르게 만든 상태, 그리고 도시 크기/위협 수가 같은 도시끼리 맞바꾼 상태는
+      하나의 정규형(canonical) 키로 합쳐 메모이제이션합니다.
+    - 메모는 solver 인스턴스에 계속 남으므로, 같은 게임에서 다음 선택은 대부분 조회만으로 끝납니다.
+    """
+
+    def __init__(self, knowledge: GameKnowledge, placement_order: Sequence[PartyID],
+                 quotas: Dict[PartyID, int], weights: Optional[EvalWeights] = None, depth: int = 4):
+        self.weights = weights or EvalWeights()
+        self.depth = depth
+        self.city_ids: List[str] = list(knowledge.cities.keys())
+        self.city_index = {city_id: i for i, city_id in enumerate(self.city_ids)}
+        self.capacity: List[int] = [knowledge.cities[c].max_party_bases for c in self.city_ids]
+        self.city_weights: List[float] = [float(knowledge.cities[c].max_party_bases) for c in self.city_ids]
+        self.placement_order: List[PartyID] = list(placement_order)
+        self.quotas: List[int] = [quotas.get(party, 0) for party in self.placement_order]
+        self._order_index: List[int] = [PARTIES.index(party) for party in self.placement_order]
+
+        self._memo: Dict[tuple, Values] = {}
+        self.nodes: int = 0  # 마지막 탐색에서 실제로 전개한 노드 수 (메모 적중 제외)
+
+        # 탐색 중 상태 (make/unmake)
+        self._counts: List[List[int]] = []
+        self._threats: List[int] = []
+        self._seats: Tuple[int, ...] = ()
+        self._contrib: List[List[float]] = []
+        self._totals: List[float] = []
+
+    @classmethod
+    def from_model(cls, model, weights: Optional[EvalWeights] = None, depth: int = 4) -> "SetupSolver":
+        quotas = {party: detail.city_bases for party, detail in model.scenario_data.initial_party_setup.items()}
+        return cls(model.knowledge, model.placement_order, quotas, weights, depth)
+
+    def state_from_model(self, model) -> SetupState:
+        counts = [[model.cities_state[c].party_bases.get(p, 0) for p in PARTIES] for c in self.city_ids]
+        threats = [len(model.cities_state[c].threats_on_city) for c in self.city_ids]
+        seats = [model.parliament_state.seats.get(p, 0) for p in PARTIES]
+        return SetupState(counts, threats, seats, model.setup_current_party_index, model.setup_bases_placed_count)
+
+    def clear(self):
+        self._memo.clear()
+
+    # --- 질의 ---
+    def score_placements(self, state: SetupState, depth: Optional[int] = None,
+                         stop: Optional[Callable[[], bool]] = None) -> Dict[str, float]:
+        """
+        현재 정당이 각 도시에 다음 기반을 둘 때의 (탐색 후) 점수. 도시 id -> 자신 - 최강 상대.
+        stop()이 True를 돌려주면 도시 사이에서 멈추며, 그때는 계산을 마친 도시만 들어 있습니다.
+        """
+        depth = self.depth if depth is None else depth
+        self._load(state)
+        party_index, placed = self._normalize(state.party_index, state.placed)
+        if party_index >= len(self.placement_order):
+            return {}
+        p = self._order_index[party_index]
+        self.nodes = 0
+        scores = {}
+        for c in self._valid_cities(p):
+            if stop is not None and stop():
+                break
+            self._place(c, p, +1)
+            values = self._search(*self._advance(party_index, placed), max(depth - 1, 0))
+            self._place(c, p, -1)
+            scores[self.city_ids[c]] = self._relative(values, p)
+        return scores
+
+    def best_placement(self, state: SetupState, depth: Optional[int] = None) -> Optional[str]:
+        scores = self.score_placements(state, depth)
+        if not scores:
+            return None
+        return max(scores, key=scores.get)
+
+    # --- 탐색 ---
+    def _search(self, party_index: int, placed: int, depth: int) -> Values:
+        party_index, placed = self._normalize(party_index, placed)
+        if depth == 0 or party_index >= len(self.placement_order):
+            return tuple(self._totals)
+        key = (party_index, placed, depth, self._seats, self._canonical())
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        self.nodes += 1
+        p = self._order_index[party_index]
+        candidates = self._valid_cities(p)
+        if not candidates:
+            # 모델과 같이, 둘 곳이 없으면 다음 정당으로 넘어감
+            best = self._search(party_index + 1, 0, depth)
+        else:
+            best, best_preference = None, None
+            for c in candidates:
+                self._place(c, p, +1)
+                values = self._search(*self._advance(party_index, placed), depth - 1)
+                self._place(c, p, -1)
+                preference = self._preference(values, p)
+                if best_preference is None or preference > best_preference:
+                    best, best_preference = values, preference
+        self._memo[key] = best
+        return best
+
+    def _normalize(self, party_index: int, placed: int) -> Tuple[int, int]:
+        # 배치를 마친 정당은 건너뜀
+        while party_index < len(self.placement_order) and placed >= self.quotas[party_index]:
+            party_index, placed = party_index + 1, 0
+        return party_index, placed
+
+    @staticmethod
+    def _advance(party_index: int, placed: int) -> Tuple[int, int]:
+        return party_index, placed + 1
+
+    def _valid_cities(self, p: int) -> List[int]:
+        # GameModel.get_valid_base_placement_cities와 같은 조건
+        return [c for c, counts in enumerate(self._counts) if counts[p] == 0 and sum(counts) < self.capacity[c]]
+
+    def _canonical(self) -> tuple:
+        # 크기/가중치/위협 수가 같은 도시는 서로 바꿔도 평가와 이후 탐색이 같으므로 정렬해서 하나로 합침
+        return tuple(sorted(
+            (self.capacity[c], self.city_weights[c], self._threats[c], tuple(self._counts[c]))
+            for c in range(len(self.city_ids))
+        ))
+
+    # --- make/unmake와 도시 단위 증분 평가 ---
+    def _load(self, state: SetupState):
+        self._counts = [list(row) for row in state.counts]
+        self._threats = list(state.threat_counts)
+        self._seats = tuple(state.seats)
+        self._totals = [self.weights.seat * seats for seats in state.seats]
+        self._contrib = [[0.0] * len(PARTIES) for _ in self.city_ids]
+        for c in range(len(self.city_ids)):
+            self._refresh_city(c)
+
+    def _place(self, c: int, p: int, amount: int):
+        self._counts[c][p] += amount
+        self._refresh_city(c)
+
+    def _refresh_city(self, c: int):
+        bases = dict(zip(PARTIES, self._counts[c]))
+        contrib = self._contrib[c]
+        for p, party in enumerate(PARTIES):
+            new = city_contribution(bases, self._threats[c], self.city_weights[c], party, self.weights)
+            self._totals[p] += new - contrib[p]
+            contrib[p] = new
+
+    @classmethod
+    def _preference(cls, values: Values, p: int) -> tuple:
+        # 동점이면 자신의 절대 점수, 상대 점수 합이 낮은 쪽, 마지막으로 점수 벡터 자체로 결정.
+        # 도시 순서와 무관한 기준이어야 대칭 상태끼리 메모를 공유해도 결과가 같음 (부동소수 오차는 반올림으로 제거)
+        rounded = tuple(round(value, 9) for value in values)
+        return cls._relative(rounded, p), rounded[p], -sum(rounded), tuple(-value for value in rounded)
+
+    @staticmethod
+    def _relative(values: Values, p: int) -> float:
+        return values[p] - max(value for other, value in enumerate(values) if other != p)
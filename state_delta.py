@@ -0,0 +1,203 @@
+# state_delta.py
+import logging
+from dataclasses import asdict, dataclass, fields
+from typing import Any, ClassVar, Dict, Iterator, Optional, Set, Tuple, Type
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class StateDelta:
+    """
+    GameModel 상태 변경 한 건을 나타내는 최소 이벤트.
+    version은 모델마다 1부터 단조 증가하며, 구독자는 이를 통해 누락 여부를 확인할 수 있습니다.
+    """
+    kind: ClassVar[str] = "STATE_DELTA"
+    version: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["kind"] = self.kind
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class BasePlaced(StateDelta):
+    kind: ClassVar[str] = "BASE_PLACED"
+    party_id: str
+    city_id: str
+    count: int  # 배치 후 해당 도시의 이 정당 기반 수
+
+
+@dataclass(frozen=True, slots=True)
+class BaseRemoved(StateDelta):
+    kind: ClassVar[str] = "BASE_REMOVED"
+    party_id: str
+    city_id: str
+    count: int  # 제거 후 해당 도시의 이 정당 기반 수
+
+
+@dataclass(frozen=True, slots=True)
+class ThreatMoved(StateDelta):
+    kind: ClassVar[str] = "THREAT_MOVED"
+    threat_id: str
+    template_id: str
+    from_location: str
+    to_location: str
+
+
+@dataclass(frozen=True, slots=True)
+class UnitMoved(StateDelta):
+    kind: ClassVar[str] = "UNIT_MOVED"
+    unit_id: str
+    template_id: str
+    from_location: str
+    to_location: str
+
+
+@dataclass(frozen=True, slots=True)
+class TrackerChanged(StateDelta):
+    kind: ClassVar[str] = "TRACKER_CHANGED"
+    tracker: str  # "round", "foreign_affairs_track", "economy_track"
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class SeatsChanged(StateDelta):
+    kind: ClassVar[str] = "SEATS_CHANGED"
+    party_id: str
+    seats: int
+
+
+@dataclass(frozen=True, slots=True)
+class TurnChanged(StateDelta):
+    kind: ClassVar[str] = "TURN_CHANGED"
+    party_id: Optional[str]
+    player_index: int
+
+
+@dataclass(frozen=True, slots=True)
+class DeltaBatch(StateDelta):
+    """
+    한 번에 적용된 여러 delta를 묶은 이벤트 (GameModel.coalesce_deltas).
+    version은 마지막 delta의 version이며, 구독자는 iter_deltas()로 펼쳐서 순서대로 적용합니다.
+    """
+    kind: ClassVar[str] = "BATCH"
+    deltas: Tuple[StateDelta, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "version": self.version, "deltas": [delta.to_dict() for delta in self.deltas]}
+
+
+DELTA_TYPES: Dict[str, Type[StateDelta]] = {
+    cls.kind: cls for cls in (BasePlaced, BaseRemoved, ThreatMoved, UnitMoved, TrackerChanged, SeatsChanged, TurnChanged)
+}
+
+
+def iter_deltas(delta: StateDelta) -> Iterator[StateDelta]:
+    """DeltaBatch면 안의 delta들을, 아니면 자기 자신을 순서대로 돌려줍니다."""
+    if isinstance(delta, DeltaBatch):
+        for inner in delta.deltas:
+            yield from iter_deltas(inner)
+    else:
+        yield delta
+
+
+def delta_from_dict(data: Dict[str, Any]) -> StateDelta:
+    """to_dict()로 직렬화된 delta를 다시 타입이 있는 객체로 복원합니다."""
+    if data.get("kind") == DeltaBatch.kind:
+        return DeltaBatch(version=data["version"], deltas=tuple(delta_from_dict(inner) for inner in data["deltas"]))
+    cls = DELTA_TYPES.get(data.get("kind"))
+    if cls is None:
+        raise ValueError(f"Unknown delta kind: {data.get('kind')!r}")
+    return cls(**{f.name: data[f.name] for f in fields(cls)})
+
+
+class BoardView:
+    """
+    delta만으로 유지되는 구독자 측 보드 사본.
+    초기값은 from_model()로 한 번 채우고, 이후에는 apply()만 호출하면 됩니다.
+    """
+
+    def __init__(self):
+        self.version: int = 0
+        self.bases: Dict[str, Dict[str, int]] = {}
+        self.threat_locations: Dict[str, str] = {}      # threat instance id -> location
+        self.threats_by_location: Dict[str, Set[str]] = {}
+        self.unit_locations: Dict[str, str] = {}        # unit instance id -> location
+        self.units_by_location: Dict[str, Set[str]] = {}
+        self.trackers: Dict[str, Any] = {}
+        self.seats: Dict[str, int] = {}
+        self.turn: Optional[str] = None
+        self.player_index: int = 0
+
+    @classmethod
+    def from_model(cls, model) -> "BoardView":
+        view = cls()
+        view.version = model.state_version
+        for city_id, city_state in model.cities_state.items():
+            view.bases[city_id] = {party.value: count for party, count in city_state.party_bases.items() if count}
+        for instance_id, threat in model.all_threats.items():
+            if threat.current_location != "AVAILABLE_POOL":
+                view._set_threat_location(instance_id, threat.current_location)
+        for instance_id, unit in model.all_units.items():
+            if unit.current_location != "AVAILABLE_POOL":
+                view._set_unit_location(instance_id, unit.current_location)
+        view.seats = {party.value: seats for party, seats in model.parliament_state.seats.items()}
+        view.trackers = {
+            "round": model.round,
+            "foreign_affairs_track": model.foreign_affairs_track,
+            "economy_track": model.economy_track,
+        }
+        view.turn = model.turn.value if model.turn else None
+        view.player_index = model.current_player_index
+        return view
+
+    def apply(self, delta: StateDelta) -> bool:
+        """delta를 적용합니다. 이미 반영된(오래된) delta면 무시하고 False를 반환합니다."""
+        if isinstance(delta, DeltaBatch):
+            applied = False
+            for inner in iter_deltas(delta):
+                applied = self.apply(inner) or applied
+            return applied
+        if delta.version <= self.version:
+            return False
+        if delta.version != self.version + 1:
+            logger.warning(f"BoardView missed deltas: expected version {self.version + 1}, got {delta.version}.")
+        self.version = delta.version
+
+        if isinstance(delta, (BasePlaced, BaseRemoved)):
+            city_bases = self.bases.setdefault(delta.city_id, {})
+            if delta.count:
+                city_bases[delta.party_id] = delta.count
+            else:
+                city_bases.pop(delta.party_id, None)
+        elif isinstance(delta, ThreatMoved):
+            self._set_threat_location(delta.threat_id, delta.to_location)
+        elif isinstance(delta, UnitMoved):
+            self._set_unit_location(delta.unit_id, delta.to_location)
+        elif isinstance(delta, TrackerChanged):
+            self.trackers[delta.tracker] = delta.value
+        elif isinstance(delta, SeatsChanged):
+            self.seats[delta.party_id] = delta.seats
+        elif isinstance(delta, TurnChanged):
+            self.turn = delta.party_id
+            self.player_index = delta.player_index
+        return True
+
+    def _set_threat_location(self, threat_id: str, location: str):
+        old_location = self.threat_locations.pop(threat_id, None)
+        if old_location is not None:
+            self.threats_by_location.get(old_location, set()).discard(threat_id)
+        if location != "AVAILABLE_POOL":
+            self.threat_locations[threat_id] = location
+            self.threats_by_location.setdefault(location, set()).add(threat_id)
+
+    def _set_unit_location(self, unit_id: str, location: str):
+        old_location = self.unit_locations.pop(unit_id, None)
+        if old_location is not None:
+            self.units_by_location.get(old_location, set()).discard(unit_id)
+        if location != "AVAILABLE_POOL":
+            self.unit_locations[unit_id] = location
+            self.units_by_location.setdefault(location, set()).add(unit_id)
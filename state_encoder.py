@@ -0,0 +1,116 @@
+# state_encoder.py
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from batch_eval import TRACKERS
+from board_eval import PARTIES
+from datas import GameKnowledge
+from enums import GamePhase
+from id_registry import DISSOLVED, DR_BOX, IdRegistry
+
+
+logger = logging.getLogger(__name__)
+
+PHASES: List[GamePhase] = list(GamePhase)
+
+
+class StateEncoder:
+    """
+    GameModel을 고정 길이 벡터로 인코딩합니다. 평가기, 학습 Agent, 분석 도구가 같은 표현을 공유하기 위한 것.
+    축 순서는 IdRegistry(도시/위협/유닛 템플릿)와 PARTIES, PHASES, TRACKERS를 따르며 같은 지식 데이터면 항상 같습니다.
+
+    필드 (fields에 이름 -> (구간, 모양)으로 기록됨):
+    - bases (C, P): 도시별 정당 기반 수
+    - threats (C, T): 도시별 위협 템플릿 개수
+    - dr_box (T,): DR 상자의 위협 템플릿 개수
+    - units (C, U): 도시별 유닛 템플릿 개수
+    - dissolved_units (U,): 해산된 유닛 템플릿 개수
+    - seats (P,), vp (P,)
+    - trackers (len(TRACKERS),): 숫자가 아닌 값(아직 정해지지 않은 트래커)은 0
+    - phase (len(PHASES),), turn (P,): one-hot
+    - hands (P, 2): 정당별 [정당 카드, 타임라인 카드] 손패 수
+    """
+
+    def __init__(self, knowledge: GameKnowledge, dtype=np.float32):
+        self.ids = IdRegistry(knowledge)
+        self.dtype = dtype
+        ids = self.ids
+        cities, threats, units, parties = len(ids.cities), len(ids.threat_templates), len(ids.unit_templates), len(PARTIES)
+        self._city_locations: List[int] = [ids.city_location(c) for c in range(cities)]
+        self._unit_templates = np.array(ids.unit_template_of, dtype=np.int64)
+
+        self.fields: Dict[str, Tuple[slice, Tuple[int, ...]]] = {}
+        self.size = 0
+        for name, shape in (
+            ("bases", (cities, parties)),
+            ("threats", (cities, threats)),
+            ("dr_box", (threats,)),
+            ("units", (cities, units)),
+            ("dissolved_units", (units,)),
+            ("seats", (parties,)),
+            ("vp", (parties,)),
+            ("trackers", (len(TRACKERS),)),
+            ("phase", (len(PHASES),)),
+            ("turn", (parties,)),
+            ("hands", (parties, 2)),
+        ):
+            length = int(np.prod(shape))
+            self.fields[name] = (slice(self.size, self.size + length), shape)
+            self.size += length
+
+    def view(self, vector: np.ndarray, name: str) -> np.ndarray:
+        """인코딩된 벡터(또는 (N, size) 배열)에서 필드 하나를 원래 모양으로 본 view."""
+        span, shape = self.fields[name]
+        return vector[..., span].reshape(vector.shape[:-1] + shape)
+
+    def encode(self, model, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """모델 하나를 인코딩합니다. out(길이 size)이 주어지면 그 자리에 씁니다."""
+        if out is None:
+            out = np.zeros(self.size, dtype=self.dtype)
+        else:
+            out[:] = 0
+        fields = self.fields
+        city_states = [model._city_by_location[location] for location in self._city_locations]
+        threats_at = model._threats_at
+
+        out[fields["bases"][0]] = [city_state.party_bases.get(party, 0) for city_state in city_states for party in PARTIES]
+        out[fields["threats"][0]] = [len(instances) for location in self._city_locations for instances in threats_at[location]]
+        out[fields["dr_box"][0]] = [len(instances) for instances in threats_at[DR_BOX]]
+
+        # 유닛 위치는 (위치, 템플릿) 쌍의 개수로 집계
+        unit_count = len(self.ids.unit_templates)
+        if unit_count:
+            locations = np.fromiter((unit.location for unit in model._units_by_num), dtype=np.int64,
+                                    count=len(model._units_by_num))
+            counts = np.bincount(locations * unit_count + self._unit_templates,
+                                 minlength=len(self.ids.locations) * unit_count).reshape(-1, unit_count)
+            out[fields["units"][0]] = counts[self._city_locations].ravel()
+            out[fields["dissolved_units"][0]] = counts[DISSOLVED]
+
+        party_states = model.party_states
+        seats = model.parliament_state.seats
+        out[fields["seats"][0]] = [seats.get(party, 0) for party in PARTIES]
+        out[fields["vp"][0]] = [party_states[party].current_vp if party in party_states else 0 for party in PARTIES]
+        trackers = (getattr(model, tracker, None) for tracker in TRACKERS)
+        out[fields["trackers"][0]] = [value if isinstance(value, (int, float)) else 0 for value in trackers]
+        out[fields["phase"][0].start + PHASES.index(model.phase)] = 1
+        if model.turn in PARTIES:
+            out[fields["turn"][0].start + PARTIES.index(model.turn)] = 1
+        out[fields["hands"][0]] = [
+            count for party in PARTIES
+            for count in ((len(party_states[party].hand_party), len(party_states[party].hand_timeline))
+                          if party in party_states else (0, 0))
+        ]
+        return out
+
+    def encode_batch(self, models: Sequence, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """모델 N개를 (N, size) 배열 하나에 인코딩합니다. out이 주어지면 미리 할당된 그 배열에 씁니다."""
+        if out is None:
+            out = np.empty((len(models), self.size), dtype=self.dtype)
+        elif out.shape[0] < len(models) or out.shape[1] != self.size:
+            raise ValueError(f"Output array of shape {out.shape} cannot hold {len(models)} rows of size {self.size}")
+        for row, model in enumerate(models):
+            self.encode(model, out[row])
+        return out
@@ -0,0 +1,132 @@
+# status_renderer.py
+import sys
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from colorama import Fore, Style
+
+from state_delta import BasePlaced, BaseRemoved, DeltaBatch, StateDelta, ThreatMoved, UnitMoved, iter_deltas
+from utils.localizer import LanguagePack
+
+
+class StatusRenderer:
+    """
+    UI_SHOW_STATUS 화면을 캐시하는 렌더러.
+    - 제목(정당별)을 뺀 본문을 (state_version, 정당 줄의 표시 값)별로 한 번만 조립합니다.
+      손패 수는 delta 없이 바뀌므로 version만으로는 본문이 같은지 알 수 없어 정당 표시 값도 키에 넣습니다.
+    - 본문을 다시 조립할 때도 도시 줄은 STATE_DELTA로 변경된 도시만, 정당 줄은 표시 값이 바뀐 정당만 다시 만듭니다.
+    - show()는 같은 본문을 한 번만 출력하므로, 렌더러를 공유하는 여러 ConsoleAgent가 같은 UI_SHOW_STATUS를 받아도
+      보드는 처음 받은 Agent의 제목으로 한 번만 나옵니다.
+    문구는 text(언어 팩)의 status.* 항목을 사용하고, 정당/도시 이름은 localize로 바꿉니다.
+    """
+
+    def __init__(self, localize: Callable[[Any], str], text: LanguagePack):
+        self.localize = localize
+        self.text = text
+        self.version: int = 0
+        self._city_lines: Dict[str, str] = {}
+        self._dirty_cities: Set[str] = set()
+        self._party_lines: Dict[Any, Tuple[tuple, str]] = {}
+        self._body: Optional[Tuple[tuple, str]] = None  # (본문 키, 본문)
+        self._shown: Optional[tuple] = None  # 마지막으로 출력한 본문 키
+
+    def apply_delta(self, delta: StateDelta):
+        if isinstance(delta, DeltaBatch):
+            for inner in iter_deltas(delta):
+                self.apply_delta(inner)
+            return
+        # 같은 delta가 여러 Agent를 통해 들어와도 한 번만 반영
+        if delta.version <= self.version:
+            return
+        self.version = delta.version
+        if isinstance(delta, (BasePlaced, BaseRemoved)):
+            self._dirty_cities.add(delta.city_id)
+        elif isinstance(delta, (ThreatMoved, UnitMoved)):
+            self._dirty_cities.add(delta.from_location)
+            self._dirty_cities.add(delta.to_location)
+
+    def invalidate(self):
+        self._city_lines.clear()
+        self._party_lines.clear()
+        self._dirty_cities.clear()
+        self._body = None
+        self._shown = None
+
+    def reset(self, version: int = 0):
+        """새 게임(또는 불러온 게임)을 시작할 때 호출. 이전 게임의 줄 캐시를 버리고 delta version을 그 게임 기준으로 맞춥니다."""
+        self.invalidate()
+        self.version = version
+
+    def show(self, data: Dict[str, Any], party_name: str, repeat: bool = False):
+        """
+        party_name의 제목과 본문을 한 번의 쓰기로 출력합니다. 이미 출력한 본문이면 아무것도 하지 않습니다
+        (같은 상태 이벤트를 받은 다른 Agent). repeat=True면 그래도 출력합니다 (Inspect처럼 직접 요청한 경우).
+        """
+        key, body = self.render_body(data)
+        if key == self._shown and not repeat:
+            return
+        self._shown = key
+        self.write(Fore.GREEN + Style.BRIGHT + self.text.format("status.title", party=party_name) + "\n" + body)
+
+    def render_body(self, data: Dict[str, Any]) -> Tuple[tuple, str]:
+        """제목을 뺀 본문과 그 캐시 키. 키가 같으면 지난번에 조립한 본문을 그대로 돌려줍니다."""
+        signatures = tuple((party_id, self._party_signature(party_data)) for party_id, party_data in data['parties'].items())
+        key = (data.get('version'), signatures)
+        if self._body is not None and self._body[0] == key:
+            return self._body
+        text = self.text
+        parts = [
+            Fore.CYAN + text.format("status.round", round=data['round']) + "\n",
+            Fore.CYAN + text.format("status.turn", turn=self.localize(data['turn'])) + "\n",
+            Fore.YELLOW + text.get("status.parties") + "\n",
+        ]
+        for party_id, signature in signatures:
+            parts.append(self._party_line(party_id, signature))
+        parts.append(Fore.MAGENTA + text.get("status.cities") + "\n")
+        for city_id, city_data in data['cities'].items():
+            line = self._city_lines.get(city_id)
+            if line is None or city_id in self._dirty_cities:
+                line = self._render_city(city_id, city_data)
+                self._city_lines[city_id] = line
+            parts.append(line)
+        self._dirty_cities.clear()
+        parts.append(Fore.RED + text.get("status.footer") + "\n")
+        self._body = (key, "".join(parts))
+        return self._body
+
+    def write(self, text: str):
+        """한 번의 버퍼 쓰기로 출력합니다."""
+        sys.stdout.write(text + "\n")
+        sys.stdout.flush()
+
+    @staticmethod
+    def _party_signature(party_data) -> tuple:
+        """정당 줄에 표시되는 값."""
+        return (
+            party_data.current_vp,
+            len(party_data.hand_timeline),
+            len(party_data.hand_party),
+            tuple(sorted(party_data.unit_supply)),
+        )
+
+    def _party_line(self, party_id, signature: tuple) -> str:
+        cached = self._party_lines.get(party_id)
+        if cached and cached[0] == signature:
+            return cached[1]
+        vp, timeline_count, party_count, supply = signature
+        text = self.text
+        line = (
+            Fore.YELLOW + text.format("status.party", party=self.localize(party_id), vp=vp,
+                                      timeline=timeline_count, cards=party_count) + "\n"
+            + Fore.WHITE + text.format("status.supply", units=', '.join(supply) if supply else text.get("status.none")) + "\n"
+        )
+        self._party_lines[party_id] = (signature, line)
+        return line
+
+    def _render_city(self, city_id: str, city_data) -> str:
+        text = self.text
+        bases = ', '.join([f"{self.localize(party)}:{count}" for party, count in city_data.party_bases.items() if count > 0]) \
+            or text.get("status.no_bases")
+        units = ', '.join(city_data.units_on_city) or text.get("status.no_units")
+        threats = ', '.join(city_data.threats_on_city) or text.get("status.no_threats")
+        return Fore.MAGENTA + text.format("status.city", city=self.localize(city_id), bases=bases, units=units,
+                                          threats=threats) + "\n"
@@ -0,0 +1,70 @@
+# threat_rules.py
+import sys
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from datas import GameKnowledge
+from id_registry import IdRegistry
+
+
+# overflow 처리 코드 (GameModel이 이 번호로 처리 함수를 고름)
+OVERFLOW_REJECT = 0
+OVERFLOW_PLACE_IN_DR_BOX = 1
+OVERFLOW_REMOVE_FROM_DR_BOX = 2
+
+_OVERFLOW_CODES = {
+    "place_in_dr_box": OVERFLOW_PLACE_IN_DR_BOX,
+    "remove_from_dr_box": OVERFLOW_REMOVE_FROM_DR_BOX,
+}
+
+UNLIMITED = sys.maxsize
+
+
+@dataclass(frozen=True, slots=True)
+class ThreatRule:
+    """ThreatData의 배치 규칙을 정수 id로 컴파일한 것. 모든 템플릿 참조는 IdRegistry.threat_templates id."""
+    template: int
+    max_per_city: int
+    max_in_dr_box: int
+    cancels: Tuple[int, ...]
+    replaces: Tuple[int, ...]
+    overflow: int
+    overflow_target: int
+
+
+def compile_threat_rules(knowledge: GameKnowledge, ids: IdRegistry) -> List[ThreatRule]:
+    """
+    threats.json에 선언된 상한/상호작용을 템플릿 id로 인덱싱된 규칙표로 만듭니다.
+    알 수 없는 위협 id를 참조하면 ValueError를 발생시킵니다.
+    """
+    templates = ids.threat_templates
+    errors = []
+
+    def resolve(owner: str, field: str, threat_id: str) -> int:
+        num = templates.get(threat_id)
+        if num is None:
+            errors.append(f"{owner}.{field} references unknown threat '{threat_id}'")
+            return -1
+        return num
+
+    rules = []
+    for template_id in templates:
+        data = knowledge.threat[template_id]
+        num = templates.id(template_id)
+        overflow, overflow_target = OVERFLOW_REJECT, num
+        if data.overflow is not None:
+            overflow = _OVERFLOW_CODES[data.overflow.action]
+            if data.overflow.threat_id is not None:
+                overflow_target = resolve(template_id, "overflow.threat_id", data.overflow.threat_id)
+        rules.append(ThreatRule(
+            template=num,
+            max_per_city=UNLIMITED if data.max_per_city is None else data.max_per_city,
+            max_in_dr_box=UNLIMITED if data.max_in_dr_box is None else data.max_in_dr_box,
+            cancels=tuple(resolve(template_id, "cancels", other) for other in data.cancels),
+            replaces=tuple(resolve(template_id, "replaces", other) for other in data.replaces),
+            overflow=overflow,
+            overflow_target=overflow_target,
+        ))
+    if errors:
+        raise ValueError("Invalid threat rules: " + "; ".join(errors))
+    return rules
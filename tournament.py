@@ -0,0 +1,327 @@
+# tournament.py
+import asyncio
+import itertools
+import logging
+import math
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from autosave import has_autosave
+from board_eval import PARTIES
+from enums import GamePhase, PartyID
+import game_events
+from player_agent import IPlayerAgent
+from rng import derive_seed
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCENARIO = "data/scenarios/main_scenario.json"
+# 게임당 결정 횟수 상한. 규칙에 게임 종료가 정의되기 전까지는 이 상한이 게임 길이를 정함
+DEFAULT_MAX_STEPS = 1000
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """
+    토너먼트 참가 Agent. factory(party_id, **kwargs)로 게임마다 새 Agent를 만듭니다.
+    워커 프로세스로 보내야 하므로 factory는 모듈 수준 클래스/함수여야 합니다 (lambda 불가).
+    """
+    name: str
+    factory: Callable[..., IPlayerAgent]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def create(self, party_id: PartyID) -> IPlayerAgent:
+        return self.factory(party_id, **self.kwargs)
+
+
+@dataclass
+class GameResult:
+    seed: int
+    seating: Tuple[int, ...]   # PARTIES 순서의 좌석별 AgentSpec 인덱스
+    vp: Tuple[int, ...]        # PARTIES 순서의 최종 VP
+    standings: Tuple[int, ...]  # 순위 (PARTIES 인덱스, 1위부터)
+    finished: bool             # GAME_OVER까지 진행됐는지 (max_steps에 걸리거나 더 진행할 수 없으면 False)
+
+    def pair_score(self, a: int, b: int) -> Optional[float]:
+        """
+        이 게임에서 Agent a가 Agent b를 상대로 얻은 점수 (0~1).
+        a의 좌석과 b의 좌석을 모두 짝지어 순위가 높으면 1, 같으면 0.5. 둘 중 하나라도 없으면 None.
+        """
+        rank = {seat: place for place, seat in enumerate(self.standings)}
+        a_seats = [seat for seat, spec in enumerate(self.seating) if spec == a]
+        b_seats = [seat for seat, spec in enumerate(self.seating) if spec == b]
+        if not a_seats or not b_seats:
+            return None
+        total = 0.0
+        for x, y in itertools.product(a_seats, b_seats):
+            if self.vp[x] == self.vp[y]:
+                total += 0.5
+            elif rank[x] < rank[y]:
+                total += 1.0
+        return total / (len(a_seats) * len(b_seats))
+
+
+async def run_game(manager, agents: Dict[PartyID, IPlayerAgent], seed: int, scenario: str = DEFAULT_SCENARIO,
+                   max_steps: int = DEFAULT_MAX_STEPS, decision_budget: Optional[float] = None,
+                   autosave: Optional[str] = None):
+    """
+    화면 없이 게임 하나를 GAME_OVER까지, 또는 Agent에게 max_steps번 물을 때까지 진행합니다 (presenter.play).
+    decision_budget이 있으면 모든 Agent의 결정 하나당 시간 예산(초)으로 사용합니다.
+    autosave(디렉터리)를 주면 진행 중인 게임을 그곳에 저장하고, 이미 저장된 게임이 있으면 거기서 이어갑니다
+    (워커가 중단된 뒤 같은 인자로 다시 실행하면 같은 결과).
+    반환: 게임이 끝난 GameModel (max_steps 안에 끝나지 않으면 그 시점의 모델).
+    """
+    budgets = None if decision_budget is None else {party: decision_budget for party in agents}
+    resume = autosave is not None and has_autosave(autosave)
+    if resume:
+        model, _ = manager.resume_game(agents, autosave, choice_timeouts=budgets)
+    else:
+        model, _ = manager.start_game(agents, choice_timeouts=budgets, seed=seed, autosave=autosave)
+    for event_type in (game_events.STATE_DELTA, game_events.UI_SHOW_STATUS):
+        manager.bus.subscribe(event_type, lambda data, event_type=event_type: [
+            agent.receive_message(event_type, data) for agent in agents.values()])
+    if not resume and not await manager.load_scenario(scenario):
+        raise RuntimeError(f"Failed to load scenario {scenario}")
+
+    try:
+        await manager.presenter.play(max_steps)
+    finally:
+        manager.close_autosave()
+    return model
+
+
+_MANAGER = None
+
+
+def play_game(specs: Sequence[AgentSpec], seating: Sequence[int], seed: int, scenario: str = DEFAULT_SCENARIO,
+              max_steps: int = DEFAULT_MAX_STEPS, decision_budget: Optional[float] = None) -> GameResult:
+    """워커 프로세스에서 실행되는 게임 하나. GameManager(정적 데이터)는 프로세스마다 한 번만 만듦."""
+    global _MANAGER
+    if _MANAGER is None:
+        from game_manager import GameManager
+        _MANAGER = GameManager()
+    agents = {party: specs[spec].create(party) for party, spec in zip(PARTIES, seating)}
+    model = asyncio.run(run_game(_MANAGER, agents, seed, scenario, max_steps, decision_budget))
+    standings = model.get_standings()
+    return GameResult(
+        seed=seed,
+        seating=tuple(seating),
+        vp=tuple(model.party_states[party].current_vp for party in PARTIES),
+        standings=tuple(PARTIES.index(party) for party in standings),
+        finished=model.phase == GamePhase.GAME_OVER,
+    )
+
+
+# --- 통계 ---
+def elo_from_score(score: float) -> float:
+    """기대 점수(0~1)에 해당하는 Elo 차이."""
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return -400.0 * math.log10(1.0 / score - 1.0)
+
+
+def score_from_elo(elo: float) -> float:
+    return 1.0 / (1.0 + 10.0 ** (-elo / 400.0))
+
+
+@dataclass
+class PairStats:
+    """Agent a 대 b의 게임별 점수(GameResult.pair_score) 누적. 한 게임의 여러 좌석 쌍은 하나의 표본으로 묶음."""
+    games: int = 0
+    total: float = 0.0
+    total_sq: float = 0.0
+
+    def add(self, score: float):
+        self.games += 1
+        self.total += score
+        self.total_sq += score * score
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.games if self.games else 0.5
+
+    @property
+    def variance(self) -> float:
+        """게임별 점수의 표본 분산."""
+        if self.games < 2:
+            return 0.0
+        return max(self.total_sq / self.games - self.mean ** 2, 0.0) * self.games / (self.games - 1)
+
+    def elo(self) -> float:
+        return elo_from_score(self.mean)
+
+    def elo_interval(self, confidence: float = 0.95) -> Tuple[float, float]:
+        """평균 점수의 정규 근사 신뢰구간을 Elo로 옮긴 것."""
+        if self.games < 2:
+            return -math.inf, math.inf
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        margin = z * math.sqrt(self.variance / self.games)
+        return elo_from_score(self.mean - margin), elo_from_score(self.mean + margin)
+
+
+@dataclass(frozen=True)
+class SPRT:
+    """
+    H0: Elo 차이 = elo0, H1: Elo 차이 = elo1 에 대한 순차 확률비 검정 (정규 근사 GSPRT).
+    게임별 점수의 평균/분산만으로 로그 우도비를 계산하므로 다인전 게임에도 그대로 적용됩니다.
+    """
+    elo0: float = 0.0
+    elo1: float = 20.0
+    alpha: float = 0.05
+    beta: float = 0.05
+    min_games: int = 20
+
+    @property
+    def bounds(self) -> Tuple[float, float]:
+        return math.log(self.beta / (1 - self.alpha)), math.log((1 - self.beta) / self.alpha)
+
+    def llr(self, stats: PairStats) -> float:
+        variance = stats.variance
+        if stats.games < 2 or variance <= 0:
+            return 0.0
+        s0, s1 = score_from_elo(self.elo0), score_from_elo(self.elo1)
+        return stats.games * (s1 - s0) * (2 * stats.mean - s0 - s1) / (2 * variance)
+
+    def decision(self, stats: PairStats) -> Optional[str]:
+        """"H1"(후보가 elo1만큼 강함), "H0"(elo0 이하), 아직 모르면 None."""
+        if stats.games < self.min_games:
+            return None
+        lower, upper = self.bounds
+        llr = self.llr(stats)
+        if llr >= upper:
+            return "H1"
+        if llr <= lower:
+            return "H0"
+        return None
+
+
+@dataclass
+class TournamentReport:
+    """
+    pairs는 끝난(GAME_OVER) 게임만 누적하며 SPRT도 이것만 봅니다.
+    끝나지 않은 게임은 멈춘 시점의 순위로 unfinished_pairs에 따로 누적합니다 (참고용).
+    """
+    names: List[str]
+    results: List[GameResult]
+    pairs: Dict[Tuple[int, int], PairStats]
+    unfinished_pairs: Dict[Tuple[int, int], PairStats]
+    sprt_decision: Optional[str] = None
+    sprt_llr: float = 0.0
+    discarded: int = 0  # SPRT가 멈춘 뒤에 끝나 반영하지 않은 게임 수 (병렬 실행)
+
+    def summary(self, confidence: float = 0.95) -> str:
+        unfinished = sum(not result.finished for result in self.results)
+        lines = [f"{len(self.results)} games ({unfinished} unfinished)"]
+        for label, pairs in (("", self.pairs), (" [unfinished]", self.unfinished_pairs)):
+            for (a, b), stats in sorted(pairs.items()):
+                if not stats.games:
+                    continue
+                low, high = stats.elo_interval(confidence)
+                lines.append(f"{self.names[a]} vs {self.names[b]}{label}: score {stats.mean:.3f}, "
+                             f"Elo {stats.elo():+.1f} [{low:+.1f}, {high:+.1f}] over {stats.games} games")
+        if self.sprt_decision:
+            lines.append(f"SPRT: {self.sprt_decision} (LLR {self.sprt_llr:.2f})")
+        if self.discarded:
+            lines.append(f"{self.discarded} games finished after the SPRT stop and were not counted")
+        return "\n".join(lines)
+
+
+def seat_permutations(agent_count: int) -> List[Tuple[int, ...]]:
+    """Agent들을 PARTIES 좌석에 돌아가며 채운 배치의 서로 다른 모든 순열 (좌석 유불리 상쇄용)."""
+    pattern = [i % agent_count for i in range(len(PARTIES))]
+    return sorted(set(itertools.permutations(pattern)))
+
+
+class Tournament:
+    """
+    여러 Agent를 PartyID 좌석 순열마다 seed를 바꿔 가며 대결시킵니다.
+    게임은 워커 프로세스에서 병렬로 진행되고, sprt가 주어지면 specs[0](후보) 대 specs[1](기준)의
+    검정이 결론에 도달하면 멈춥니다. 결과는 끝난 순서와 관계없이 게임 번호 순으로 반영하므로,
+    같은 seed면 workers 수와 관계없이 같은 게임에서 멈추고 같은 보고서가 나옵니다.
+    decision_budget(초)을 주면 모든 결정에 같은 시간 예산을 걸어 Agent 간 계산량을 맞춥니다.
+    max_steps는 게임당 결정 횟수 상한입니다.
+    """
+
+    def __init__(self, specs: Sequence[AgentSpec], seed: int = 0, scenario: str = DEFAULT_SCENARIO,
+                 sprt: Optional[SPRT] = None, max_steps: int = DEFAULT_MAX_STEPS,
+                 decision_budget: Optional[float] = None):
+        if len(specs) < 2:
+            raise ValueError("A tournament needs at least two agents")
+        self.specs = list(specs)
+        self.seed = seed
+        self.scenario = scenario
+        self.sprt = sprt
+        self.max_steps = max_steps
+        self.decision_budget = decision_budget
+        self.seatings = seat_permutations(len(self.specs))
+
+    def schedule(self, index: int) -> Tuple[Tuple[int, ...], int]:
+        """index번째 게임의 (좌석 배치, seed)."""
+        return self.seatings[index % len(self.seatings)], derive_seed(self.seed, f"game:{index}")
+
+    def run(self, max_games: int, workers: int = 0) -> TournamentReport:
+        """
+        최대 max_games 게임을 진행합니다. workers=0이면 현재 프로세스에서 순서대로 실행.
+        병렬 실행에서 SPRT가 멈추면 시작하지 않은 게임은 취소하고, 진행 중인 게임은 기다리지 않습니다
+        (워커에서 끝까지 진행된 뒤 버려짐). 이미 끝났지만 멈춘 지점 뒤의 게임은 discarded로 셉니다.
+        """
+        pairs = list(itertools.combinations(range(len(self.specs)), 2))
+        report = TournamentReport(
+            names=[spec.name for spec in self.specs], results=[],
+            pairs={pair: PairStats() for pair in pairs}, unfinished_pairs={pair: PairStats() for pair in pairs},
+        )
+        if workers <= 0:
+            for index in range(max_games):
+                if self._record(report, play_game(self.specs, *self.schedule(index), self.scenario,
+                                                  self.max_steps, self.decision_budget)):
+                    break
+            return report
+
+        pool = ProcessPoolExecutor(max_workers=workers)
+        stop = False
+        try:
+            pending: Dict[Future, int] = {}
+            finished: Dict[int, GameResult] = {}  # 앞 번호 게임을 기다리는 결과
+            next_index = next_record = 0
+            while not stop and next_record < max_games:
+                # 워커당 두 게임씩 미리 넣어 두어 결과를 기다리는 동안 놀지 않게 함.
+                # 순서를 기다리며 쌓인 결과까지 세어 느린 게임 하나 때문에 버퍼가 끝없이 커지지 않게 함
+                while next_index < max_games and len(pending) < workers * 2 and len(finished) < workers * 4:
+                    future = pool.submit(play_game, self.specs, *self.schedule(next_index), self.scenario,
+                                         self.max_steps, self.decision_budget)
+                    pending[future] = next_index
+                    next_index += 1
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished[pending.pop(future)] = future.result()
+                while not stop and next_record in finished:
+                    stop = self._record(report, finished.pop(next_record))
+                    next_record += 1
+            report.discarded = len(finished)
+            if report.discarded:
+                logger.info(f"{report.discarded} games finished after the SPRT stop; not counted.")
+        finally:
+            pool.shutdown(wait=not stop, cancel_futures=True)
+        return report
+
+    def _record(self, report: TournamentReport, result: GameResult) -> bool:
+        """결과를 누적하고, SPRT가 결론에 도달했으면 True."""
+        report.results.append(result)
+        if not result.finished:
+            logger.warning(f"Game with seed {result.seed} did not reach GAME_OVER (max_steps {self.max_steps}). "
+                           f"Counted separately from finished games.")
+        for (a, b), stats in (report.pairs if result.finished else report.unfinished_pairs).items():
+            score = result.pair_score(a, b)
+            if score is not None:
+                stats.add(score)
+        if not result.finished or self.sprt is None:
+            return False
+        stats = report.pairs[(0, 1)]
+        report.sprt_llr = self.sprt.llr(stats)
+        report.sprt_decision = self.sprt.decision(stats)
+        if report.sprt_decision:
+            logger.info(f"SPRT reached {report.sprt_decision} after {stats.games} games (LLR {report.sprt_llr:.2f}).")
+            return True
+        return False
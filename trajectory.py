@@ -0,0 +1,332 @@
+# trajectory.py
+import json
+import logging
+import os
+import uuid
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from action_space import ActionSpace
+from decision_context import DecisionContext
+from board_eval import PARTIES
+from enums import PartyID
+from game_action import Move
+from models import GameModel
+from player_agent import IPlayerAgent
+from state_encoder import StateEncoder
+
+
+logger = logging.getLogger(__name__)
+
+META_FILE = "meta.json"
+FORMAT_VERSION = 1
+
+# 샤드 디렉터리 하나에 들어가는 열(.npy 파일). masks는 행 단위 np.packbits로 압축해 저장
+COLUMNS = ("states", "masks", "actions", "players", "outcomes", "games")
+
+
+@dataclass
+class TrajectoryBatch:
+    """학습 레코드 N개. 정당 축 순서는 PARTIES."""
+    states: np.ndarray    # (N, D) float32 인코딩된 상태
+    masks: np.ndarray     # (N, A) bool 합법 행동 마스크 (ActionSpace 번호)
+    actions: np.ndarray   # (N,) int32 선택한 행동
+    players: np.ndarray   # (N,) int8 결정한 정당의 PARTIES 인덱스
+    outcomes: np.ndarray  # (N, P) float32 게임 최종 결과 (기본: 정당별 최종 VP)
+    games: np.ndarray     # (N,) int64 게임 seed
+
+    def __len__(self) -> int:
+        return self.actions.shape[0]
+
+
+class TrajectoryWriter:
+    """
+    레코드를 고정 크기 버퍼에 모았다가 shard_size개가 차면 열 단위 .npy 샤드 디렉터리로 씁니다.
+    메모리 사용량은 shard_size행으로 제한됩니다.
+
+    - 샤드는 임시 디렉터리에 쓴 뒤 이름을 바꿔 공개하므로, 중간에 죽어도 읽는 쪽은 완성된 샤드만 봅니다.
+    - 샤드 이름에 writer별 prefix가 들어가 여러 프로세스가 같은 디렉터리에 동시에 써도 됩니다.
+    - 상태 벡터 길이(state_dim)를 주지 않으면 첫 레코드에서 정합니다.
+    """
+
+    def __init__(self, directory: str, action_count: int, state_dim: Optional[int] = None,
+                 shard_size: int = 65536, prefix: Optional[str] = None,
+                 action_labels: Optional[Sequence[str]] = None):
+        if shard_size <= 0:
+            raise ValueError(f"shard_size must be positive, got {shard_size}")
+        self.directory = directory
+        self.action_count = action_count
+        self.state_dim = state_dim
+        self.shard_size = shard_size
+        self.prefix = prefix or uuid.uuid4().hex[:8]
+        self.action_labels = list(action_labels) if action_labels is not None else None
+        self.shards_written = 0
+        self.rows_written = 0
+        self._rows = 0
+        self._buffers: Optional[Dict[str, np.ndarray]] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self) -> "TrajectoryWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, state: np.ndarray, mask: np.ndarray, action: int, player: int,
+               outcome: Sequence[float], game: int):
+        if self._buffers is None:
+            self._allocate(len(state))
+        row = self._rows
+        buffers = self._buffers
+        buffers["states"][row] = state
+        buffers["masks"][row] = mask
+        buffers["actions"][row] = action
+        buffers["players"][row] = player
+        buffers["outcomes"][row] = outcome
+        buffers["games"][row] = game
+        self._rows += 1
+        if self._rows == self.shard_size:
+            self.flush()
+
+    def flush(self):
+        """버퍼에 남은 레코드를 샤드 하나로 씁니다 (비어 있으면 아무것도 하지 않음)."""
+        if not self._rows:
+            return
+        self._write_meta()
+        rows = self._rows
+        name = f"shard-{self.prefix}-{self.shards_written:05d}"
+        tmp = os.path.join(self.directory, f".{name}.tmp")
+        os.makedirs(tmp, exist_ok=True)
+        for column in COLUMNS:
+            data = self._buffers[column][:rows]
+            if column == "masks":
+                data = np.packbits(data, axis=1)
+            np.save(os.path.join(tmp, f"{column}.npy"), data)
+        os.replace(tmp, os.path.join(self.directory, name))
+        logger.debug(f"Wrote trajectory shard {name} ({rows} rows).")
+        self.shards_written += 1
+        self.rows_written += rows
+        self._rows = 0
+
+    def close(self):
+        self.flush()
+
+    def _allocate(self, state_dim: int):
+        if self.state_dim is None:
+            self.state_dim = state_dim
+        elif self.state_dim != state_dim:
+            raise ValueError(f"State vector length {state_dim} does not match state_dim {self.state_dim}")
+        size = self.shard_size
+        self._buffers = {
+            "states": np.zeros((size, self.state_dim), dtype=np.float32),
+            "masks": np.zeros((size, self.action_count), dtype=bool),
+            "actions": np.zeros(size, dtype=np.int32),
+            "players": np.zeros(size, dtype=np.int8),
+            "outcomes": np.zeros((size, len(PARTIES)), dtype=np.float32),
+            "games": np.zeros(size, dtype=np.int64),
+        }
+
+    def _write_meta(self):
+        meta = {
+            "version": FORMAT_VERSION,
+            "state_dim": self.state_dim,
+            "action_count": self.action_count,
+            "parties": [party.value for party in PARTIES],
+            "action_labels": self.action_labels,
+        }
+        path = os.path.join(self.directory, META_FILE)
+        if os.path.exists(path):
+            existing = read_meta(self.directory)
+            for key in ("version", "state_dim", "action_count", "parties"):
+                if existing.get(key) != meta[key]:
+                    raise ValueError(f"Trajectory directory {self.directory} has {key}={existing.get(key)}, writer has {meta[key]}")
+            return
+        tmp = f"{path}.{self.prefix}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+
+def read_meta(directory: str) -> Dict[str, Any]:
+    with open(os.path.join(directory, META_FILE), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TrajectoryReader:
+    """
+    TrajectoryWriter가 쓴 샤드들을 np.load(mmap_mode="r")로 열어 읽습니다.
+    전체를 메모리에 올리지 않고, 필요한 행만 디스크에서 가져옵니다.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.meta = read_meta(directory)
+        if self.meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported trajectory format version {self.meta.get('version')} in {directory}")
+        self.action_count: int = self.meta["action_count"]
+        self.state_dim: int = self.meta["state_dim"]
+        # 임시 샤드(.으로 시작)는 아직 쓰는 중이므로 제외
+        self.shard_names: List[str] = sorted(
+            name for name in os.listdir(directory)
+            if not name.startswith(".") and os.path.isdir(os.path.join(directory, name))
+        )
+        self._open: Dict[int, Dict[str, np.ndarray]] = {}
+        self.shard_sizes: List[int] = [len(self._columns(i)["actions"]) for i in range(len(self.shard_names))]
+
+    def __len__(self) -> int:
+        return sum(self.shard_sizes)
+
+    def _columns(self, shard: int) -> Dict[str, np.ndarray]:
+        columns = self._open.get(shard)
+        if columns is None:
+            path = os.path.join(self.directory, self.shard_names[shard])
+            columns = {column: np.load(os.path.join(path, f"{column}.npy"), mmap_mode="r") for column in COLUMNS}
+            self._open[shard] = columns
+        return columns
+
+    def read(self, shard: int, rows: Optional[np.ndarray] = None) -> TrajectoryBatch:
+        """샤드 하나에서 rows번째 행들(없으면 전체)을 읽습니다."""
+        if rows is None:
+            rows = np.arange(self.shard_sizes[shard])
+        return self._gather(np.full(len(rows), shard), np.asarray(rows))
+
+    def batches(self, batch_size: int = 256, seed: Optional[int] = None, shuffle: bool = True,
+                window: int = 4, drop_last: bool = False) -> Iterator[TrajectoryBatch]:
+        """
+        전체 레코드를 batch_size개씩 돌려줍니다.
+        shuffle이면 샤드 순서를 섞고, window개 샤드씩 묶어 그 안의 행을 섞습니다.
+        (한 번에 열어 두는 샤드 수가 window개라 디스크 접근이 흩어지지 않으면서도 샤드 경계를 넘어 섞임)
+        """
+        rng = np.random.default_rng(seed)
+        order = rng.permutation(len(self.shard_names)) if shuffle else np.arange(len(self.shard_names))
+        pending_shards = np.empty(0, dtype=np.int64)
+        pending_rows = np.empty(0, dtype=np.int64)
+        for start in range(0, len(order), window):
+            group = order[start:start + window]
+            shards = np.concatenate([pending_shards] + [np.full(self.shard_sizes[s], s) for s in group])
+            rows = np.concatenate([pending_rows] + [np.arange(self.shard_sizes[s]) for s in group])
+            if shuffle:
+                permutation = rng.permutation(len(rows))
+                shards, rows = shards[permutation], rows[permutation]
+            full = len(rows) - len(rows) % batch_size
+            for b in range(0, full, batch_size):
+                yield self._gather(shards[b:b + batch_size], rows[b:b + batch_size])
+            pending_shards, pending_rows = shards[full:], rows[full:]
+        if len(pending_rows) and not drop_last:
+            yield self._gather(pending_shards, pending_rows)
+
+    def _gather(self, shards: np.ndarray, rows: np.ndarray) -> TrajectoryBatch:
+        size = len(rows)
+        out = TrajectoryBatch(
+            states=np.empty((size, self.state_dim), dtype=np.float32),
+            masks=np.empty((size, self.action_count), dtype=bool),
+            actions=np.empty(size, dtype=np.int32),
+            players=np.empty(size, dtype=np.int8),
+            outcomes=np.empty((size, len(self.meta["parties"])), dtype=np.float32),
+            games=np.empty(size, dtype=np.int64),
+        )
+        for shard in np.unique(shards):
+            positions = np.flatnonzero(shards == shard)
+            # memmap은 정렬된 인덱스로 읽어야 순차 접근이 됨
+            order = np.argsort(rows[positions], kind="stable")
+            positions, shard_rows = positions[order], rows[positions][order]
+            columns = self._columns(int(shard))
+            out.states[positions] = columns["states"][shard_rows]
+            out.masks[positions] = np.unpackbits(columns["masks"][shard_rows], axis=1, count=self.action_count).astype(bool)
+            out.actions[positions] = columns["actions"][shard_rows]
+            out.players[positions] = columns["players"][shard_rows]
+            out.outcomes[positions] = columns["outcomes"][shard_rows]
+            out.games[positions] = columns["games"][shard_rows]
+        return out
+
+
+class TrajectoryRecorder:
+    """
+    Agent의 결정마다 (상태 인코딩, 합법 행동 마스크, 선택한 행동)을 모아 두었다가,
+    게임이 끝나면(end_game) 최종 결과를 붙여 TrajectoryWriter로 보냅니다.
+    레코드는 GameModel 객체별로 모으므로 seed가 같은 게임을 동시에 기록해도 섞이지 않고,
+    end_game 없이 버려진 게임의 레코드는 모델과 함께 사라집니다.
+
+        recorder = TrajectoryRecorder(writer, ActionSpace(knowledge))
+        model, presenter = manager.start_game(recorder.wrap(agents), seed=seed)
+        ...
+        recorder.end_game(model)
+    """
+
+    def __init__(self, writer: TrajectoryWriter, action_space: ActionSpace,
+                 encode: Optional[Callable[[GameModel], np.ndarray]] = None):
+        # encode가 없으면 첫 기록 때 StateEncoder로 만듦
+        if writer.action_count != action_space.size:
+            raise ValueError(f"Writer action_count {writer.action_count} does not match action space size {action_space.size}")
+        self.writer = writer
+        self.action_space = action_space
+        self.encode = encode
+        # 게임(모델) -> 결과를 기다리는 레코드
+        self._pending: "weakref.WeakKeyDictionary[GameModel, List[tuple]]" = weakref.WeakKeyDictionary()
+        self.skipped: int = 0  # ActionSpace로 번호를 매길 수 없어 버린 결정 수
+
+    def wrap(self, agents: Dict[PartyID, IPlayerAgent]) -> Dict[PartyID, IPlayerAgent]:
+        return {party: RecordingAgent(agent, self) for party, agent in agents.items()}
+
+    def record(self, model: GameModel, party: PartyID, mask: np.ndarray, action: Optional[int]):
+        if action is None or not mask[action]:
+            self.skipped += 1
+            return
+        if self.encode is None:
+            self.encode = StateEncoder(model.knowledge).encode
+        self._pending.setdefault(model, []).append((self.encode(model), mask, action, PARTIES.index(party)))
+
+    def end_game(self, model: GameModel, outcome: Optional[Dict[PartyID, float]] = None):
+        """
+        게임의 레코드에 결과를 붙여 writer에 씁니다. outcome이 없으면 정당별 현재 VP를 씁니다.
+        """
+        if outcome is None:
+            outcome = {party: model.party_states[party].current_vp for party in PARTIES if party in model.party_states}
+        values = np.array([outcome.get(party, 0.0) for party in PARTIES], dtype=np.float32)
+        for state, mask, action, player in self._pending.pop(model, []):
+            self.writer.append(state, mask, action, player, values, model.seed)
+
+    def discard_game(self, model: GameModel):
+        self._pending.pop(model, None)
+
+
+class RecordingAgent(IPlayerAgent):
+    """다른 Agent를 감싸 결정은 그대로 전달하고, 결정마다 TrajectoryRecorder에 기록합니다."""
+
+    def __init__(self, inner: IPlayerAgent, recorder: TrajectoryRecorder):
+        super().__init__(inner.party_id)
+        self.inner = inner
+        self.recorder = recorder
+        self.game_model: Optional[GameModel] = None
+
+    def on_game_start(self, game_model: GameModel):
+        super().on_game_start(game_model)
+        self.game_model = game_model
+        self.inner.on_game_start(game_model)
+
+    async def get_next_move(self, game_model: GameModel) -> Move:
+        return await self.decide_move(game_model, DecisionContext())
+
+    async def get_choice(self, options: List[Any], context: Dict[str, Any]) -> Any:
+        return await self.decide_choice(options, context, DecisionContext())
+
+    async def decide_move(self, game_model: GameModel, decision: DecisionContext) -> Move:
+        space = self.recorder.action_space
+        mask = space.move_mask(game_model.get_valid_moves(self.party_id))
+        move = await self.inner.decide_move(game_model, decision)
+        self.recorder.record(game_model, self.party_id, mask, space.move_index(move))
+        return move
+
+    async def decide_choice(self, options: List[Any], context: Dict[str, Any], decision: DecisionContext) -> Any:
+        space = self.recorder.action_space
+        mask = space.choice_mask(options)
+        choice = await self.inner.decide_choice(options, context, decision)
+        if self.game_model is not None:
+            self.recorder.record(self.game_model, self.party_id, mask, space.choice_index(choice))
+        return choice
+
+    def receive_message(self, event_type: str, data: Dict[str, Any]):
+        self.inner.receive_message(event_type, data)
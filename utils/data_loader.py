@@ -1,11 +1,12 @@
 from enum import Enum
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any, Dict, Type, Optional, List, Protocol
 
-from pydantic import BaseModel, ValidationError, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from datas import IssueData, PartyData, CityData, SocietyData, ThreatData, UnitData
+from datas import IssueData, PartyCardData, PartyData, CityData, SocietyData, ThreatData, TimelineCardData, UnitData
 
 
 
@@ -21,9 +22,28 @@ DEFAULT_TYPE_MAP: Dict[str, Type[Any]] = {
     "UnitData": UnitData,
     "ThreatData": ThreatData,
     "SocietyData": SocietyData,
-    "IssueData": IssueData
+    "IssueData": IssueData,
+    "PartyCardData": PartyCardData,
+    "TimelineCardData": TimelineCardData,
 }
 
+# 파일/타입 단위 일괄 검증기. TypeAdapter 생성 비용이 크므로 모델 클래스마다 한 번만 만듦
+_ADAPTERS: Dict[Type[BaseModel], TypeAdapter] = {}
+
+
+def _list_adapter(cls: Type[BaseModel]) -> TypeAdapter:
+    adapter = _ADAPTERS.get(cls)
+    if adapter is None:
+        adapter = TypeAdapter(List[cls])
+        _ADAPTERS[cls] = adapter
+    return adapter
+
+
+def _load_file(type_map: Dict[str, Type[BaseModel]], path: str) -> Dict[str, BaseModel]:
+    # 프로세스 풀에서도 실행할 수 있도록 모듈 수준 함수로 둠
+    return DataLoader(type_map).load(path)
+
+
 class DataLoader:
     def __init__(self, type_map: Optional[Dict[str, Type[BaseModel]]] = None):
         self.type_map = dict(DEFAULT_TYPE_MAP)
@@ -46,47 +66,82 @@ class DataLoader:
             logger.error(e)
             raise
 
-
-        result: Dict[str, BaseModel] = {}
+        # 1. 형식 확인 후 타입별로 묶음 (원래 인덱스는 오류 보고용으로 보관)
+        groups: Dict[Type[BaseModel], List[tuple[int, Any]]] = {}
         for index, item in enumerate(payload): # ⭐️ 인덱스 추가 (오류 추적용)
             if not isinstance(item, dict) or "type" not in item or "data" not in item:
                 logger.error(f"Invalid item format at index {index} in {path}. Skipping item: {item}")
                 continue # ⭐️ 잘못된 형식의 아이템 건너뛰기
 
             typ = item["type"]
-            data = item["data"]
-
             cls = self.type_map.get(typ)
             if not cls:
                 logger.warning(f"Unknown type '{typ}' at index {index} in {path}. Skipping item.")
                 continue # ⭐️ 모르는 타입 건너뛰기
+            groups.setdefault(cls, []).append((index, item["data"]))
 
-            try:
-                # ⭐️ Pydantic 모델로 직접 파싱 및 유효성 검사!
-                obj = cls.parse_obj(data)
-                
-                # ID 필드가 있는지 확인 (Pydantic 모델에 id가 정의되어 있어야 함)
-                obj_id = getattr(obj, "id", None) 
-                # ⭐️ Pydantic 모델의 id 타입이 Enum일 수 있으므로 .value 사용 고려
-                if isinstance(obj_id, Enum): 
-                    obj_id = obj_id.value
-
-                if not obj_id or not isinstance(obj_id, str):
-                     logger.error(f"Object of type {typ} at index {index} missing valid 'id' in {path}. Skipping item: {data}")
-                     continue
-
-                if obj_id in result:
-                    logger.warning(f"Duplicate id '{obj_id}' found at index {index} in {path}. Overwriting previous entry.")
-                
-                result[obj_id] = obj
-                logger.debug(f"Loaded object: {obj}")
-    
-            except ValidationError as e:
-                # ⭐️ Pydantic 유효성 검사 실패 시 오류 로깅 및 건너뛰기
-                logger.error(f"Validation failed for type '{typ}' at index {index} in {path}. Skipping item. Errors: {e.errors()}")
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error parsing object of type {typ} at index {index} in {path}: {e}. Skipping item: {data}")
+        # 2. 타입마다 리스트 전체를 한 번에 검증
+        parsed: List[tuple[int, BaseModel]] = []
+        for cls, entries in groups.items():
+            parsed.extend(self._validate_group(cls, entries, path))
+        parsed.sort(key=lambda entry: entry[0])
+
+        # 3. id 기준으로 정리 (파일 내 순서 유지)
+        result: Dict[str, BaseModel] = {}
+        for index, obj in parsed:
+            # ID 필드가 있는지 확인 (Pydantic 모델에 id가 정의되어 있어야 함)
+            obj_id = getattr(obj, "id", None)
+            # ⭐️ Pydantic 모델의 id 타입이 Enum일 수 있으므로 .value 사용 고려
+            if isinstance(obj_id, Enum):
+                obj_id = obj_id.value
+
+            if not obj_id or not isinstance(obj_id, str):
+                logger.error(f"Object of type {type(obj).__name__} at index {index} missing valid 'id' in {path}. Skipping item.")
                 continue
 
-        return result
\ No newline at end of file
+            if obj_id in result:
+                logger.warning(f"Duplicate id '{obj_id}' found at index {index} in {path}. Overwriting previous entry.")
+
+            result[obj_id] = obj
+            logger.debug(f"Loaded object: {obj}")
+
+        return result
+
+    def _validate_group(self, cls: Type[BaseModel], entries: List[tuple[int, Any]], path: str) -> List[tuple[int, BaseModel]]:
+        """
+        같은 타입 아이템들을 TypeAdapter 한 번으로 검증합니다.
+        실패한 아이템이 있으면 아이템별로 오류를 기록하고, 나머지만 다시 한 번에 검증합니다.
+        """
+        adapter = _list_adapter(cls)
+        indices = [index for index, _ in entries]
+        data = [item_data for _, item_data in entries]
+        try:
+            return list(zip(indices, adapter.validate_python(data)))
+        except ValidationError as e:
+            errors_by_position: Dict[int, list] = {}
+            for error in e.errors():
+                position = error["loc"][0] if error["loc"] else None
+                if isinstance(position, int):
+                    errors_by_position.setdefault(position, []).append(error)
+            if not errors_by_position:
+                logger.error(f"Validation failed for type '{cls.__name__}' in {path}. Skipping all {len(entries)} items. Errors: {e.errors()}")
+                return []
+
+        for position, errors in errors_by_position.items():
+            # ⭐️ Pydantic 유효성 검사 실패 시 오류 로깅 및 건너뛰기 (loc에서 리스트 인덱스는 제외)
+            item_errors = [{**error, "loc": error["loc"][1:]} for error in errors]
+            logger.error(f"Validation failed for type '{cls.__name__}' at index {indices[position]} in {path}. Skipping item. Errors: {item_errors}")
+
+        remaining = [entry for position, entry in enumerate(entries) if position not in errors_by_position]
+        return self._validate_group(cls, remaining, path) if remaining else []
+
+    def load_many(self, paths: Dict[str, str], max_workers: Optional[int] = None,
+                  use_processes: bool = False) -> Dict[str, Dict[str, BaseModel]]:
+        """
+        여러 데이터 파일을 동시에 읽고 검증합니다. paths: 이름 -> 파일 경로, 반환: 이름 -> load() 결과.
+        기본은 스레드 풀이며, 데이터가 커서 검증이 CPU를 오래 쓰면 use_processes=True로 프로세스 풀을 사용합니다.
+        """
+        pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with pool_cls(max_workers=max_workers or min(len(paths), 8) or 1) as pool:
+            futures = {name: pool.submit(_load_file, self.type_map, path) for name, path in paths.items()}
+            return {name: future.result() for name, future in futures.items()}
@@ -1,19 +1,134 @@
+import json
+import logging
+import os
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+LOCALE_DIR = os.path.join("data", "locales")
+
+
+def flatten_catalog(tree: Mapping[str, Any], prefix: str = "") -> Dict[str, str]:
+    """중첩된 카탈로그({"status": {"round": ...}})를 점으로 이은 한 단계 키("status.round")로 펼칩니다."""
+    flat: Dict[str, str] = {}
+    for key, value in tree.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, Mapping):
+            flat.update(flatten_catalog(value, f"{name}."))
+        else:
+            flat[name] = str(value)
+    return flat
+
+
+class LanguagePack:
+    """한 언어로 컴파일된 카탈로그. 대체 언어의 문구까지 미리 합쳐 두어 조회는 dict 한 번입니다."""
+    __slots__ = ("language", "messages", "_localizer")
+
+    def __init__(self, language: str, messages: Dict[str, str], localizer: "Localizer"):
+        self.language = language
+        self.messages = messages
+        self._localizer = localizer
+
+    def get(self, key: str) -> str:
+        return self.messages.get(key, key)
+
+    def section(self, prefix: str) -> Dict[str, str]:
+        """prefix 아래의 항목 (예: section("city") -> {"berlin": "Berlin", ...})."""
+        start = f"{prefix}."
+        return {key[len(start):]: text for key, text in self.messages.items() if key.startswith(start)}
+
+    def format(self, key: str, **params: Any) -> str:
+        return self._localizer.format(key, self.language, **params)
 
 
 class Localizer:
-    def __init__(self, translations: Dict[str, Dict[str, str]], default_language: str = "en"):
+    """
+    언어별 카탈로그(data/locales/<언어>.json)를 처음 쓰일 때 읽어 LanguagePack으로 컴파일합니다.
+    대체 순서는 default_language -> 기본 언어(ko-KR이면 ko) -> 요청한 언어이며, 컴파일할 때 한 번만 합칩니다.
+    translations를 주면 파일 대신 그 dict(언어 -> 중첩 카탈로그)를 사용합니다.
+    """
+
+    def __init__(self, translations: Optional[Mapping[str, Mapping[str, Any]]] = None, default_language: str = "en",
+                 directory: str = LOCALE_DIR, format_cache_size: int = 4096):
         self.translations = translations
         self.default_language = default_language
+        self.directory = directory
+        self.format_cache_size = format_cache_size
+        self._packs: Dict[str, LanguagePack] = {}
+        self._formatted: Dict[Tuple[Any, ...], str] = {}  # (언어, 키, 인자) -> 완성된 문구
+
+    @property
+    def languages(self) -> List[str]:
+        """사용 가능한 언어 (파일 목록만 보고 내용은 읽지 않음)."""
+        if self.translations is not None:
+            return sorted(self.translations)
+        try:
+            return sorted(name[:-len(".json")] for name in os.listdir(self.directory) if name.endswith(".json"))
+        except FileNotFoundError:
+            return []
+
+    def _load(self, language: str) -> Optional[Dict[str, str]]:
+        """언어 하나의 카탈로그를 펼쳐 읽습니다. 없으면 None."""
+        if self.translations is not None:
+            tree = self.translations.get(language)
+            return None if tree is None else flatten_catalog(tree)
+        path = os.path.join(self.directory, f"{language}.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return flatten_catalog(json.load(f))
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid locale file {path}: {e}")
+            return None
+
+    def pack(self, language: str) -> LanguagePack:
+        pack = self._packs.get(language)
+        if pack is None:
+            chain = [self.default_language]
+            base = language.split("-")[0]
+            for name in (base, language):
+                if name not in chain:
+                    chain.append(name)
+            messages: Dict[str, str] = {}
+            loaded = []
+            for name in chain:
+                catalog = self._load(name)
+                if catalog is not None:
+                    messages.update(catalog)
+                    loaded.append(name)
+            if loaded[-1:] != [language] and loaded[-1:] != [base]:
+                logger.warning(f"No locale catalog for '{language}'. Falling back to {loaded or 'message keys'}.")
+            pack = LanguagePack(language, messages, self)
+            self._packs[language] = pack
+            logger.debug(f"Locale '{language}' compiled from {loaded}: {len(messages)} messages.")
+        return pack
 
     def translate(self, key: str, language: str) -> str:
-        if language in self.translations and key in self.translations[language]:
-            return self.translations[language][key]
-        elif key in self.translations.get(self.default_language, {}):
-            return self.translations[self.default_language][key]
-        else:
-            return key  # Fallback to key if no translation found
-        
+        pack = self._packs.get(language) or self.pack(language)
+        return pack.messages.get(key, key)  # 어느 언어에도 없으면 키 그대로
 
-        
\ No newline at end of file
+    def format(self, key: str, language: str, **params: Any) -> str:
+        """
+        매개변수가 있는 문구를 완성합니다. 같은 (언어, 키, 인자) 조합은 캐시된 결과를 돌려줍니다.
+        캐시가 format_cache_size를 넘으면 비우고 다시 채웁니다.
+        """
+        cache_key = (language, key, *params.items())
+        try:
+            return self._formatted[cache_key]
+        except KeyError:
+            cacheable = True
+        except TypeError:
+            cacheable = False  # 해시할 수 없는 인자
+        template = self.translate(key, language)
+        try:
+            text = template.format(**params)
+        except (KeyError, IndexError, ValueError) as e:
+            logger.warning(f"Failed to format message '{key}' ({language}): {e}")
+            return template
+        if cacheable:
+            if len(self._formatted) >= self.format_cache_size:
+                self._formatted.clear()
+            self._formatted[cache_key] = text
+        return text